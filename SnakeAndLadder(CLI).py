@@ -1,10 +1,10 @@
-import random
+import argparse
 import time
 import os
 import sys
 from enum import Enum
 from typing import List, Tuple, Dict, Optional
-from rich.console import Console
+from rich.console import Console, ConsoleOptions, RenderResult
 from rich.panel import Panel
 from rich.table import Table
 from rich.progress import track
@@ -15,6 +15,10 @@ from rich.align import Align
 from rich.live import Live
 from rich.prompt import IntPrompt, Prompt, Confirm
 from rich.style import Style
+from rich.segment import Segment
+from rich.control import Control
+from game.core.dice import StandardDice
+from game.models.board import Board, JUMP_BLOCKED, JUMP_SNAKE, JUMP_LADDER
 
 # Initialize rich console
 console = Console()
@@ -27,9 +31,17 @@ class GameState(Enum):
 # Game constants
 BOARD_SIZE = 10
 DICE_FACES = 6
-MAX_POS = BOARD_SIZE * BOARD_SIZE
 PAUSE = 0.8
 
+# Seeded dice shared by all games in this session
+dice = StandardDice(DICE_FACES)
+
+# Multiplier for every pause in the game (0 plays at full speed)
+pace = 1.0
+
+# Whether game messages and animations are suppressed
+quiet = False
+
 # Colors
 COLORS = [
     "red", "blue", "green", "yellow",
@@ -47,6 +59,10 @@ ladders = {
     28: 84, 51: 67, 71: 90, 80: 99
 }
 
+# The board's rules; the goal is its last cell
+game_board = Board(snakes, ladders, BOARD_SIZE)
+MAX_POS = game_board.total_cells
+
 # Game symbols
 SNAKE_HEAD = "🐍"
 SNAKE_TAIL = "🐉"
@@ -56,18 +72,81 @@ DICE = "🎲"
 TROPHY = "🏆"
 PLAYER = "😊"
 
+def build_decorations() -> Dict[int, Text]:
+    """Precompute the snake and ladder markers shown in each cell."""
+    snake_tails = set(snakes.values())
+    ladder_tops = set(ladders.values())
+    decorations = {}
+    for pos in range(1, MAX_POS + 1):
+        decoration = Text()
+        
+        # Snakes' heads and ladders' bottoms
+        if pos in snakes:
+            decoration.append(f" {SNAKE_HEAD}", style="red")
+        elif pos in ladders:
+            if pos < ladders[pos]:  # Bottom of ladder
+                decoration.append(f" {LADDER_BOTTOM}", style="green")
+            else:  # Top of ladder (shouldn't happen with current data)
+                decoration.append(f" {LADDER_TOP}", style="green")
+        
+        # Snakes' tails and ladders' tops
+        if pos in snake_tails:
+            decoration.append(f" {SNAKE_TAIL}", style="red")
+        if pos in ladder_tops:
+            decoration.append(f" {LADDER_TOP}", style="green")
+        
+        if decoration:
+            decorations[pos] = decoration
+    return decorations
+
+# Markers for the cells that have any, built once
+CELL_DECORATIONS = build_decorations()
+
+def fill_cell(cell: Text, pos: int, players_here: List[int]) -> None:
+    """Append a cell's players and snake/ladder markers after its number."""
+    for p_num in players_here:
+        color = COLORS[(p_num - 1) % len(COLORS)]
+        cell.append(f" {PLAYER}", style=f"bold {color}")
+    if players_here:
+        cell.append(" ")
+    decoration = CELL_DECORATIONS.get(pos)
+    if decoration is not None:
+        cell.append_text(decoration)
+
+def board_positions() -> List[List[int]]:
+    """Get the cell numbers of each board row, top row first, in display order."""
+    rows = []
+    for row in range(BOARD_SIZE, 0, -1):
+        # Determine if we're moving left or right
+        if row % 2 == 0:
+            cols = range(BOARD_SIZE, 0, -1)  # Right to left for even rows
+        else:
+            cols = range(1, BOARD_SIZE + 1)  # Left to right for odd rows
+        rows.append([(row - 1) * BOARD_SIZE + col for col in cols])
+    return rows
+
+def pause(seconds: float) -> None:
+    """Wait for ``seconds`` scaled by the current pace."""
+    if pace > 0:
+        time.sleep(seconds * pace)
+
 def clear_screen():
     """Clear the terminal screen."""
     console.clear()
 
-def generate_board(players: List[Tuple[str, int]]) -> Table:
-    """Generate a rich table for the game board."""
-    # Create a table for the board
+def create_board_table() -> Table:
+    """Create an empty table with the board's columns."""
     board = Table(show_header=False, show_lines=True, box=box.ROUNDED, padding=0)
     
     # Add columns (we'll add 10 columns for a 10x10 grid)
     for _ in range(BOARD_SIZE):
         board.add_column(justify="center", width=6)
+    return board
+
+def generate_board(players: List[Tuple[str, int]]) -> Table:
+    """Generate a rich table for the game board."""
+    # Create a table for the board
+    board = create_board_table()
     
     # Create a mapping of positions to player numbers
     pos_to_players = {}
@@ -77,53 +156,24 @@ def generate_board(players: List[Tuple[str, int]]) -> Table:
         pos_to_players[pos].append(idx + 1)
     
     # Fill the board
-    for row in range(BOARD_SIZE, 0, -1):
+    for positions in board_positions():
         row_cells = []
-        
-        # Determine if we're moving left or right
-        if row % 2 == 0:
-            cols = range(BOARD_SIZE, 0, -1)  # Right to left for even rows
-        else:
-            cols = range(1, BOARD_SIZE + 1)  # Left to right for odd rows
-        
-        for col in cols:
-            pos = (row - 1) * BOARD_SIZE + col
+        for pos in positions:
             cell_content = Text()
             
             # Add position number
             cell_content.append(f"{pos:3}\n", style="dim")
             
-            # Add players in this position
-            if pos in pos_to_players:
-                players_here = pos_to_players[pos]
-                for p_num in players_here:
-                    color = COLORS[(p_num - 1) % len(COLORS)]
-                    cell_content.append(f" {PLAYER}", style=f"bold {color}")
-                cell_content.append(" ")
-            
-            # Add snakes and ladders
-            if pos in snakes:
-                cell_content.append(f" {SNAKE_HEAD}", style="red")
-            elif pos in ladders:
-                if pos < ladders[pos]:  # Bottom of ladder
-                    cell_content.append(f" {LADDER_BOTTOM}", style="green")
-                else:  # Top of ladder (shouldn't happen with current data)
-                    cell_content.append(f" {LADDER_TOP}", style="green")
-            
-            # Add snakes' tails and ladders' tops
-            if pos in snakes.values():
-                cell_content.append(f" {SNAKE_TAIL}", style="red")
-            if pos in ladders.values():
-                cell_content.append(f" {LADDER_TOP}", style="green")
-            
+            # Add players and snakes and ladders
+            fill_cell(cell_content, pos, pos_to_players.get(pos, []))
             row_cells.append(cell_content)
         
         board.add_row(*row_cells)
     
     return board
 
-def display_game_state(players: List[Tuple[str, int]], current_player: int, last_roll: int = None):
-    """Display the current game state with rich formatting."""
+def create_layout() -> Layout:
+    """Create the game screen layout with its header filled in."""
     layout = Layout()
     
     # Split the layout into header, board, and status sections
@@ -144,27 +194,27 @@ def display_game_state(players: List[Tuple[str, int]], current_player: int, last
         )
     )
     layout["header"].update(header)
-    
-    # Board
-    board = generate_board(players)
-    layout["board"].update(Panel(board, title="Game Board", border_style="green"))
-    
-    # Status
-    status = Table.grid(expand=True)
-    status.add_column()
-    
-    # Current player info
+    return layout
+
+def build_turn_panel(players: List[Tuple[str, int]], current_player: int,
+                     last_roll: int = None, message: str = None) -> Panel:
+    """Build the panel describing the current turn."""
     current_name, current_pos = players[current_player]
-    status.add_row(
-        Panel(
-            f"🎮 [bold]{current_name}'s[/] turn\n"
-            f"📍 Position: [bold]{current_pos}[/]/100\n"
-            f"🎲 Last roll: [bold]{last_roll if last_roll is not None else '--'}",
-            title="Current Turn",
-            border_style=COLORS[current_player % len(COLORS)]
-        )
+    turn_text = (
+        f"🎮 [bold]{current_name}'s[/] turn\n"
+        f"📍 Position: [bold]{current_pos}[/]/{MAX_POS}\n"
+        f"🎲 Last roll: [bold]{last_roll if last_roll is not None else '--'}"
     )
-    
+    if message is not None:
+        turn_text += f"[/]\n{message}"
+    return Panel(
+        turn_text,
+        title="Current Turn",
+        border_style=COLORS[current_player % len(COLORS)]
+    )
+
+def add_details(status: Table, players: List[Tuple[str, int]], current_player: int) -> Table:
+    """Add the players table and instructions shown below the current turn to a status grid."""
     # Players' status
     players_table = Table(show_header=True, box=box.ROUNDED)
     players_table.add_column("Player", style="bold")
@@ -194,12 +244,261 @@ def display_game_state(players: List[Tuple[str, int]], current_player: int, last
     )
     status.add_row("")
     status.add_row(Panel(instructions, border_style="dim"))
+    return status
+
+def build_status(players: List[Tuple[str, int]], current_player: int,
+                 last_roll: int = None) -> Table:
+    """Build the status section: current turn, players and instructions."""
+    status = Table.grid(expand=True)
+    status.add_column()
+    status.add_row(build_turn_panel(players, current_player, last_roll))
+    add_details(status, players, current_player)
+    return status
+
+def display_game_state(players: List[Tuple[str, int]], current_player: int, last_roll: int = None):
+    """Display the current game state with rich formatting."""
+    layout = create_layout()
+    
+    # Board
+    board = generate_board(players)
+    layout["board"].update(Panel(board, title="Game Board", border_style="green"))
     
-    layout["status"].update(status)
+    # Status
+    layout["status"].update(build_status(players, current_player, last_roll))
     
     # Display everything
     console.print(layout)
 
+class CachedLines:
+    """Renderable that keeps the lines of another renderable until invalidated."""
+    
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._lines: Optional[List[List[Segment]]] = None
+        self._key = None
+    
+    def invalidate(self) -> None:
+        """Render again next time, as the wrapped renderable has changed."""
+        self._lines = None
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        key = (options.max_width, options.height)
+        if self._lines is None or key != self._key:
+            self._lines = console.render_lines(self.renderable, options)
+            self._key = key
+        new_line = Segment.line()
+        for line in self._lines:
+            yield from line
+            yield new_line
+
+class ChangedLines:
+    """Renderable that only repaints the screen lines that changed since the last frame.
+    
+    Unchanged lines are sent as bare newlines, which leave what is already
+    on the terminal in place. Only valid on the alternate screen, where
+    every frame starts from the top-left corner.
+    """
+    
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._previous: Optional[List[List[Segment]]] = None
+    
+    def invalidate(self, line: Optional[int] = None) -> None:
+        """Repaint a line of the next frame, or every line if ``line`` is None."""
+        if line is None:
+            self._previous = None
+        elif self._previous is not None and line < len(self._previous):
+            self._previous[line] = None
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        lines = console.render_lines(self.renderable, options)
+        previous = self._previous
+        new_line = Segment.line()
+        for index, line in enumerate(lines):
+            if previous is None or index >= len(previous) or previous[index] != line:
+                yield from line
+            yield new_line
+        self._previous = lines
+
+class BoardRows:
+    """The board table, rendered one row at a time and kept until a row changes.
+    
+    Looks exactly like ``generate_board``, but a change to a cell only
+    re-renders that cell's row.
+    """
+    
+    def __init__(self, cells: Dict[int, Text]):
+        """Lay out the board's cells.
+        
+        Args:
+            cells: The text of every cell, by position
+        """
+        self.rows = [[cells[pos] for pos in positions] for positions in board_positions()]
+        self.row_of = {pos: index for index, positions in enumerate(board_positions())
+                       for pos in positions}
+        self._row_lines: List[Optional[List[List[Segment]]]] = [None] * len(self.rows)
+        self._borders: Optional[Tuple[List[Segment], List[Segment], List[Segment]]] = None
+        self._width: Optional[int] = None
+    
+    def invalidate(self, pos: int) -> None:
+        """Re-render the row holding ``pos`` next time."""
+        self._row_lines[self.row_of[pos]] = None
+    
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        if options.max_width != self._width:
+            self._width = options.max_width
+            self._row_lines = [None] * len(self.rows)
+            
+            # Top edge, row separator and bottom edge, from a two-row table
+            table = create_board_table()
+            table.add_row()
+            table.add_row()
+            lines = console.render_lines(table, options, pad=False)
+            self._borders = (lines[0], lines[2], lines[-1])
+        
+        top, separator, bottom = self._borders
+        new_line = Segment.line()
+        yield from top
+        for index, row in enumerate(self.rows):
+            if self._row_lines[index] is None:
+                table = create_board_table()
+                table.add_row(*row)
+                self._row_lines[index] = console.render_lines(table, options, pad=False)[1:-1]
+            if index:
+                yield new_line
+                yield from separator
+            for line in self._row_lines[index]:
+                yield new_line
+                yield from line
+        yield new_line
+        yield from bottom
+        yield new_line
+
+class InPlaceLive(Live):
+    """``Live`` display on the alternate screen that leaves unchanged lines alone.
+    
+    Rich normally pads every line of an alternate-screen frame to the full
+    width, which would blank the lines ``ChangedLines`` skips.
+    """
+    
+    @property
+    def renderable(self):
+        return self.get_renderable()
+
+class LiveBoard:
+    """Game screen kept on display with ``rich.live.Live`` and updated in place.
+    
+    The board's cell texts are built once. Each update only rewrites the
+    cells whose occupants changed and rebuilds the small status section.
+    The board's rendered lines are kept until a cell changes, and only the
+    screen lines that differ from the previous frame are sent to the
+    terminal.
+    """
+    
+    def __init__(self):
+        """Build the layout and every cell of the board."""
+        self.layout = create_layout()
+        self.cells: Dict[int, Text] = {}
+        self.occupants: Dict[int, List[int]] = {}
+        self.live: Optional[Live] = None
+        self.last_message: Optional[str] = None
+        
+        for pos in range(1, MAX_POS + 1):
+            cell = Text()
+            cell.append(f"{pos:3}\n", style="dim")
+            fill_cell(cell, pos, [])
+            self.cells[pos] = cell
+        self.rows = BoardRows(self.cells)
+        self.board = CachedLines(Panel(self.rows, title="Game Board", border_style="green"))
+        self.layout["board"].update(self.board)
+        self.layout["header"].update(CachedLines(self.layout["header"].renderable))
+        
+        # The current turn, with a line for messages, changes far more often
+        # than the players table below it
+        self.layout["status"].split_column(
+            Layout(name="turn", size=6),
+            Layout(name="details")
+        )
+        self.details: Optional[CachedLines] = None
+        self.screen = ChangedLines(self.layout)
+        
+        # Length of each cell's number, which never changes
+        self.base_length = len(f"{0:3}\n")
+        self._players: List[Tuple[str, int]] = []
+        self._current_player = 0
+        self._last_roll: Optional[int] = None
+    
+    def __enter__(self) -> 'LiveBoard':
+        self.live = InPlaceLive(self.screen, console=console, screen=True, auto_refresh=False)
+        self.live.__enter__()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.live.__exit__(*exc_info)
+        self.live = None
+    
+    def update(self, players: List[Tuple[str, int]], current_player: int,
+               last_roll: int = None) -> None:
+        """Show a new game state, rewriting only the cells whose occupants changed."""
+        occupants: Dict[int, List[int]] = {}
+        for idx, (_, pos) in enumerate(players):
+            occupants.setdefault(pos, []).append(idx + 1)
+        
+        for pos in self.occupants.keys() | occupants.keys():
+            players_here = occupants.get(pos, [])
+            cell = self.cells.get(pos)
+            if cell is not None and players_here != self.occupants.get(pos, []):
+                cell.set_length(self.base_length)
+                fill_cell(cell, pos, players_here)
+                self.rows.invalidate(pos)
+                self.board.invalidate()
+        self.occupants = occupants
+        
+        self._players = list(players)
+        self._current_player = current_player
+        self._last_roll = last_roll
+        details = Table.grid(expand=True)
+        details.add_column()
+        self.details = CachedLines(add_details(details, players, current_player))
+        self.layout["details"].update(self.details)
+        self._refresh_status()
+    
+    def input(self) -> str:
+        """Read a line typed by the player on the current-turn panel's message line."""
+        region = self.layout.map[self.layout["turn"]].region
+        row = region.y + 4
+        console.control(Control.move_to(region.x + 2, row))
+        line = input()
+        
+        # Only the echoed text needs repainting; the newline moves the
+        # cursor without scrolling
+        self.screen.invalidate(row)
+        return line
+    
+    def message(self, text: Optional[str]) -> None:
+        """Show a one-line message in the current-turn panel (None clears it)."""
+        self.last_message = text
+        self._refresh_status()
+    
+    def _refresh_status(self) -> None:
+        """Rebuild the current-turn panel and repaint the screen."""
+        self.layout["turn"].update(build_turn_panel(
+            self._players, self._current_player, self._last_roll, self.last_message or ""))
+        if self.live is not None:
+            self.live.refresh()
+
+# Board shown by play_game while a game is running
+live_board: Optional[LiveBoard] = None
+
+def announce(message: str, style: str = "") -> None:
+    """Show a game message on the live board, or print it if there is none."""
+    if quiet:
+        return
+    if live_board is not None:
+        live_board.message(f"[{style}]{message}[/]" if style else message)
+    else:
+        console.print(message, style=style or None)
+
 def show_game_over(winner: str):
     """Display the game over screen."""
     console.clear()
@@ -220,9 +519,20 @@ def show_game_over(winner: str):
 
 def roll_dice() -> int:
     """Simulate rolling a die with a rich animation."""
+    if quiet:
+        return dice.roll()
+    if live_board is not None:
+        # The live board is already a Live display, so no spinner here
+        live_board.message("🎲 Rolling the die...")
+        pause(0.8)
+        result = dice.roll()
+        live_board.message(f"{DICE} Rolled: [bold]{result}[/]")
+        pause(0.5)
+        return result
+    
     with console.status("🎲 Rolling the die...", spinner="dots"):
-        time.sleep(0.8)
-        result = random.randint(1, DICE_FACES)
+        pause(0.8)
+        result = dice.roll()
         
         # Create a visual dice face
         dice_faces = {
@@ -241,44 +551,103 @@ def roll_dice() -> int:
             border_style="yellow"
         )
         console.print(dice_panel)
-        time.sleep(0.5)
+        pause(0.5)
         
         return result
 
 def move_player(player_idx: int, current_pos: int, steps: int, players: List[Tuple[str, int]]) -> int:
     """Move a player and handle snakes and ladders with rich output."""
     name, pos = players[player_idx]
+    final_pos, jump = game_board.resolve_move(pos, steps)
     new_pos = pos + steps
     
-    if new_pos > MAX_POS:
-        console.print(
+    if jump == JUMP_BLOCKED:
+        announce(
             f"[yellow]You need exactly {MAX_POS - pos} to win![/] :cross_mark:",
             style="bold yellow"
         )
-        time.sleep(1)
+        pause(1)
         return pos
     
     # Animate the movement
-    console.print(f"[cyan]{name} moves from {pos} to {new_pos}[/] :arrow_forward:")
+    announce(f"[cyan]{name} moves from {pos} to {new_pos}[/] :arrow_forward:")
     
     # Check for snakes and ladders
-    if new_pos in snakes:
-        final_pos = snakes[new_pos]
-        console.rule(f"[red]SNAKE BITE![/] {name} slides down to {final_pos} {SNAKE_HEAD}", 
-                    style="red", align="center")
+    if jump == JUMP_SNAKE:
+        if quiet:
+            pass
+        elif live_board is not None:
+            live_board.message(f"[red]SNAKE BITE![/] {name} slides down to {final_pos} {SNAKE_HEAD}")
+        else:
+            console.rule(f"[red]SNAKE BITE![/] {name} slides down to {final_pos} {SNAKE_HEAD}", 
+                        style="red", align="center")
         new_pos = final_pos
-        time.sleep(1)
-    elif new_pos in ladders:
-        final_pos = ladders[new_pos]
-        console.rule(f"[green]LADDER![/] {name} climbs up to {final_pos} {LADDER_TOP}", 
-                    style="green", align="center")
+        pause(1)
+    elif jump == JUMP_LADDER:
+        if quiet:
+            pass
+        elif live_board is not None:
+            live_board.message(f"[green]LADDER![/] {name} climbs up to {final_pos} {LADDER_TOP}")
+        else:
+            console.rule(f"[green]LADDER![/] {name} climbs up to {final_pos} {LADDER_TOP}", 
+                        style="green", align="center")
         new_pos = final_pos
-        time.sleep(1)
+        pause(1)
     
     # Update player position
     players[player_idx] = (name, new_pos)
     return new_pos
 
+def play_turns(players: List[Tuple[str, int]], board: Optional[LiveBoard] = None,
+               bots: bool = False) -> Tuple[Optional[int], int]:
+    """Play turns until a player wins or quits.
+    
+    Args:
+        players: (name, position) of each player, updated in place
+        board: The live board to show the game on (None plays without a display)
+        bots: Whether turns are rolled automatically instead of waiting for Enter
+        
+    Returns:
+        Tuple[Optional[int], int]: Index of the winner (None if the game was
+        quit) and the number of turns played
+    """
+    current_player = 0
+    last_roll = None
+    turns = 0
+    
+    while True:
+        name, pos = players[current_player]
+        
+        if board is not None:
+            # Display game state
+            board.update(players, current_player, last_roll)
+            
+            # The prompt is shown in the instructions panel
+            if not bots:
+                key = board.input().strip().lower()
+                if key == 'q':
+                    board.message("[bold]Quit?[/] Press [bold]Q[/] again to confirm, Enter to keep playing")
+                    if board.input().strip().lower() == 'q':
+                        return None, turns
+                    board.message(None)
+                    continue
+                board.message(None)
+        
+        # Roll the dice
+        last_roll = roll_dice()
+        new_pos = move_player(current_player, pos, last_roll, players)
+        turns += 1
+        
+        # Check for win
+        if new_pos == MAX_POS:
+            return current_player, turns
+        
+        # Next player's turn
+        current_player = (current_player + 1) % len(players)
+        
+        # Small delay for smooth transition
+        pause(0.5)
+
 def play_game(num_players: int = 2):
     """Main game loop with rich interface."""
     # Get player names
@@ -295,38 +664,75 @@ def play_game(num_players: int = 2):
                 players.append((name, 1))  # (name, position)
                 break
     
-    current_player = 0
-    last_roll = None
-    
-    with console.screen() as screen:
-        while True:
-            name, pos = players[current_player]
-            
-            # Display game state
-            display_game_state(players, current_player, last_roll)
-            
-            # Get input with timeout for animation
-            key = input("Press Enter to roll (Q to quit): ").strip().lower()
-            if key == 'q':
-                if Confirm.ask("Are you sure you want to quit?"):
-                    console.print("\nThanks for playing!")
-                    return
-                continue
-            
-            # Roll the dice
-            last_roll = roll_dice()
-            new_pos = move_player(current_player, pos, last_roll, players)
-            
-            # Check for win
-            if new_pos == MAX_POS:
-                show_game_over(name)
-                break
-            
-            # Next player's turn
-            current_player = (current_player + 1) % num_players
-            
-            # Small delay for smooth transition
-            time.sleep(0.5)
+    global live_board
+    with LiveBoard() as board:
+        live_board = board
+        try:
+            winner, _ = play_turns(players, board)
+        finally:
+            live_board = None
+    
+    if winner is None:
+        console.print("\nThanks for playing!")
+    else:
+        show_game_over(players[winner][0])
+
+def autoplay(num_players: int = 2, games: int = 1, seed: Optional[int] = None,
+             game_pace: float = 0.0, summary_only: bool = False) -> List[Tuple[int, int]]:
+    """Play games between bots without any input.
+    
+    Game ``n`` is played with the dice seeded with ``seed + n``, so any game
+    of a run can be replayed on its own.
+    
+    Args:
+        num_players: Number of bots in each game
+        games: Number of games to play
+        seed: Seed of the first game (default: the dice's current seed)
+        game_pace: Multiplier for the game's pauses (0 plays at full speed)
+        summary_only: Print one summary line per game instead of showing the board
+        
+    Returns:
+        List[Tuple[int, int]]: Index of the winner and number of turns of each game
+    """
+    global pace, quiet, live_board
+    base_seed = dice.seed if seed is None else seed
+    names = [f"Bot {i + 1}" for i in range(num_players)]
+    results = []
+    previous = pace, quiet
+    pace, quiet = game_pace, summary_only
+    started = time.perf_counter()
+    try:
+        for game in range(games):
+            dice.seek(0, base_seed + game)
+            players = [(name, 1) for name in names]
+            if summary_only:
+                winner, turns = play_turns(players, bots=True)
+            else:
+                with LiveBoard() as board:
+                    live_board = board
+                    try:
+                        winner, turns = play_turns(players, board, bots=True)
+                    finally:
+                        live_board = None
+            results.append((winner, turns))
+            console.print(f"game {game + 1}/{games} seed={base_seed + game} "
+                          f"winner={names[winner]} turns={turns}", highlight=False, soft_wrap=True)
+    finally:
+        pace, quiet = previous
+    
+    elapsed = time.perf_counter() - started
+    wins = [0] * num_players
+    for winner, _ in results:
+        wins[winner] += 1
+    mean_turns = sum(turns for _, turns in results) / len(results) if results else 0.0
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    console.print(
+        f"{len(results)} games in {elapsed:.2f}s ({rate:.1f} games/s), "
+        f"mean {mean_turns:.1f} turns, wins: "
+        + ", ".join(f"{name} {count}" for name, count in zip(names, wins)),
+        highlight=False, soft_wrap=True
+    )
+    return results
 
 def show_main_menu() -> bool:
     """Display the main menu and return whether to start the game."""
@@ -377,14 +783,16 @@ def show_how_to_play():
     console.clear()
     console.print("\n" * 2, style="white")
     
-    instructions = """
+    ladder_list = ", ".join(f"{start}→{end}" for start, end in sorted(ladders.items()))
+    snake_list = ", ".join(f"{start}→{end}" for start, end in sorted(snakes.items()))
+    instructions = f"""
     [bold underline]HOW TO PLAY[/bold underline]\n\n
-    [bold]Objective:[/] Be the first player to reach the 100th square.\n\n
+    [bold]Objective:[/] Be the first player to reach square {MAX_POS}.\n\n
     [bold]Gameplay:[/]
     • Each player takes turns rolling the dice and moving forward.\n
-    • If you land on the bottom of a ladder, you climb up to the top.\n      [green]Ladders:[/] 3→37, 5→14, 9→31, 21→42, 28→84, 51→67, 71→90, 80→99\n
-    • If you land on a snake's head, you slide down to its tail.\n      [red]Snakes:[/] 17→7, 54→34, 62→19, 64→60, 87→24, 93→73, 96→75, 98→79\n
-    • You must roll the exact number needed to reach 100.\n    """
+    • If you land on the bottom of a ladder, you climb up to the top.\n      [green]Ladders:[/] {ladder_list}\n
+    • If you land on a snake's head, you slide down to its tail.\n      [red]Snakes:[/] {snake_list}\n
+    • You must roll the exact number needed to reach {MAX_POS}.\n    """
     
     console.print(Panel(
         instructions.strip(),
@@ -430,5 +838,26 @@ def start_game():
         console.print("pip install rich colorama")
         sys.exit(1)
 
+def main(argv: Optional[List[str]] = None):
+    """Run the interactive game, or bots in autoplay mode."""
+    parser = argparse.ArgumentParser(description="Snake and Ladder in the terminal.")
+    parser.add_argument('--autoplay', action='store_true',
+                        help="let bots play without any input")
+    parser.add_argument('--players', type=int, default=2, choices=range(2, len(COLORS) + 1),
+                        metavar='N', help="number of bots in autoplay mode (default: 2)")
+    parser.add_argument('--games', type=int, default=1,
+                        help="number of games to autoplay (default: 1)")
+    parser.add_argument('--seed', type=int, help="seed of the first autoplayed game")
+    parser.add_argument('--pace', type=float, default=0.0,
+                        help="multiplier for the pauses in autoplay mode (default: 0, no pauses)")
+    parser.add_argument('--quiet', action='store_true',
+                        help="print only a summary line per game instead of the board")
+    args = parser.parse_args(argv)
+    
+    if args.autoplay:
+        autoplay(args.players, args.games, args.seed, args.pace, args.quiet)
+    else:
+        start_game()
+
 if __name__ == "__main__":
-    start_game()
\ No newline at end of file
+    main()
\ No newline at end of file
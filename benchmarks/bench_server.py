@@ -0,0 +1,97 @@
+"""Load benchmark for the game server: many sessions over localhost TCP.
+
+Creates and joins ``--sessions`` single-seat games, then has ``--clients``
+connections roll in random sessions and reports the latency of each
+request. With more sessions than the store's hot capacity, most rolls hit
+a parked session that has to be rehydrated first.
+
+Run from the repository root:
+    python benchmarks/bench_server.py --sessions 10000 --clients 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game.server.server import GameServer
+from game.server.session_store import SessionStore
+
+async def request_all(host: str, port: int, requests: List[dict]) -> List[dict]:
+    """Send requests pipelined over one connection and read every response."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b''.join(json.dumps(request).encode() + b'\n' for request in requests))
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for _ in requests]
+    writer.close()
+    return responses
+
+
+async def roll_client(host: str, port: int, sessions: int, rolls: int,
+                      rng: random.Random) -> List[float]:
+    """Roll one request at a time in random sessions and time each reply."""
+    reader, writer = await asyncio.open_connection(host, port)
+    latencies = []
+    for _ in range(rolls):
+        request = {'op': 'roll', 'session': rng.randint(1, sessions), 'seat': 0}
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b'\n')
+        await reader.readline()
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    return latencies
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Get a percentile of already sorted values."""
+    return values[min(len(values) - 1, int(share * len(values)))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Start a server, load it and print the timings."""
+    server = GameServer()
+    server.sessions = SessionStore(server.board, hot_capacity=args.hot)
+    listener = await server.start_tcp('127.0.0.1', 0)
+    host, port = listener.sockets[0].getsockname()[:2]
+
+    start = time.perf_counter()
+    await request_all(host, port, [{'op': 'create', 'seats': 1, 'seed': i}
+                                   for i in range(args.sessions)])
+    create_time = time.perf_counter() - start
+    await request_all(host, port, [{'op': 'join', 'session': i + 1}
+                                   for i in range(args.sessions)])
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        roll_client(host, port, args.sessions, args.rolls, random.Random(client))
+        for client in range(args.clients)))
+    roll_time = time.perf_counter() - start
+    await server.close()
+
+    latencies = sorted(latency for result in results for latency in result)
+    print(f"sessions: {args.sessions} ({args.hot} hot), clients: {args.clients}")
+    print(f"  create: {create_time:.2f} s ({args.sessions / create_time:,.0f}/s)")
+    print(f"    roll: {len(latencies) / roll_time:,.0f}/s, "
+          f"p50 {percentile(latencies, 0.5) * 1e3:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1e3:.2f} ms, "
+          f"max {latencies[-1] * 1e3:.2f} ms")
+
+
+def main() -> None:
+    """Entry point for the server load benchmark."""
+    parser = argparse.ArgumentParser(description="Game server load benchmark")
+    parser.add_argument('--sessions', type=int, default=10000, help="sessions to create")
+    parser.add_argument('--clients', type=int, default=10, help="concurrent connections rolling")
+    parser.add_argument('--rolls', type=int, default=200, help="rolls sent by each client")
+    parser.add_argument('--hot', type=int, default=1024, help="sessions the store keeps live")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
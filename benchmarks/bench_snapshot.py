@@ -0,0 +1,44 @@
+"""Benchmark binary game snapshots against the dictionary state path.
+
+Run from the repository root:
+    python benchmarks/bench_snapshot.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from game import constants as const
+from game.core.game_logic import GameLogic
+from game.models.board import Board
+from game.models.player import Player
+
+def main(number: int = 100000) -> None:
+    """Time checkpointing and restoring a game mid-play."""
+    players = [Player("Player 1", const.RED), Player("Player 2", const.BLUE)]
+    logic = GameLogic(players, Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE), seed=1)
+    for _ in range(20):
+        logic.play_turn()
+
+    state_dict = logic.get_state()
+    snapshot = logic.snapshot()
+
+    timings = {
+        'get_state': timeit.timeit(logic.get_state, number=number),
+        'set_state': timeit.timeit(lambda: logic.set_state(state_dict), number=number),
+        'snapshot': timeit.timeit(logic.snapshot, number=number),
+        'restore': timeit.timeit(lambda: logic.restore(snapshot), number=number),
+    }
+
+    print(f"snapshot size: {len(snapshot)} bytes")
+    for name, seconds in timings.items():
+        print(f"{name:>10}: {seconds / number * 1e6:8.3f} us/call")
+    dict_path = timings['get_state'] + timings['set_state']
+    binary_path = timings['snapshot'] + timings['restore']
+    print(f"round trip speed-up: {dict_path / binary_path:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,414 @@
+"""Headless benchmark suite for the engine, rendering and CLI hot paths.
+
+Every benchmark is timed in microseconds per call (best of several
+repeats), written as JSON and compared against a stored baseline. A
+benchmark more than ``--tolerance`` slower than its baseline is reported
+as a regression and makes the run exit with status 1.
+
+Timings depend on the machine. The baseline is read from
+``baseline.local.json``, recorded on this machine and not committed, if
+there is one; otherwise from the committed ``baseline.json``, which was
+measured elsewhere and so only catches gross slowdowns.
+
+Run from the repository root:
+    python benchmarks/run.py --save-baseline  # record a local baseline
+    python benchmarks/run.py                  # compare with it
+    python benchmarks/run.py -k board -o results.json
+"""
+
+import argparse
+import importlib.util
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+# Rendering benchmarks must not open a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from game import constants as const
+from game.core.game_logic import GameLogic
+from game.models.board import Board
+from game.models.player import Player, PlayerTable
+from game.ui.animations import AnimationManager, MoveAnimation
+from game.ui.board_ui import BoardUI
+from game.ui.sidebar_ui import SidebarUI
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Baseline recorded on this machine, and the committed one measured elsewhere
+LOCAL_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.local.json')
+REFERENCE_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+# Allowed slowdown against a local baseline, and against the committed one;
+# other hardware alone can make a benchmark more than twice as slow
+LOCAL_TOLERANCE = 0.25
+REFERENCE_TOLERANCE = 2.0
+
+# Live animations kept running in the AnimationManager benchmark
+ANIMATION_COUNT = 1000
+
+# Cells per side and snakes/ladders of the board in the large-board benchmark
+LARGE_BOARD_SIZE = 1000
+LARGE_BOARD_JUMPS = 20000
+
+# Registered benchmarks: name -> setup function returning the callable to time
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+def benchmark(name: str) -> Callable:
+    """Register a benchmark setup function under ``name``."""
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _new_game(seed: int = 1) -> GameLogic:
+    """Create a two-player game on the standard board."""
+    players = [Player("Player 1", const.RED), Player("Player 2", const.BLUE)]
+    return GameLogic(players, Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE), seed=seed)
+
+
+def _large_board(seed: int = 1) -> Board:
+    """Create a LARGE_BOARD_SIZE board with random non-overlapping snakes and ladders."""
+    rng = random.Random(seed)
+    last = LARGE_BOARD_SIZE * LARGE_BOARD_SIZE
+    snakes: Dict[int, int] = {}
+    ladders: Dict[int, int] = {}
+    used = set()
+    while len(snakes) + len(ladders) < LARGE_BOARD_JUMPS:
+        start = rng.randint(2, last - 1)
+        # Short jumps, mostly within a few rows
+        end = start + rng.choice((-1, 1)) * rng.randint(1, 5 * LARGE_BOARD_SIZE)
+        if not 1 <= end < last or start in used or end in used:
+            continue
+        (snakes if end < start else ladders)[start] = end
+        used.update((start, end))
+    return Board(snakes, ladders, LARGE_BOARD_SIZE)
+
+
+def _load_cli():
+    """Import the CLI script, whose file name is not a valid module name."""
+    path = os.path.join(ROOT, 'SnakeAndLadder(CLI).py')
+    spec = importlib.util.spec_from_file_location('snake_and_ladder_cli', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@benchmark('logic.play_turn')
+def bench_play_turn() -> Callable[[], object]:
+    """A full turn: roll, move, jumps and turn handover (games restart when won)."""
+    logic = _new_game()
+    state = logic.state
+
+    def run() -> None:
+        if state.game_over:
+            logic.reset()
+        logic.play_turn()
+    return run
+
+
+@benchmark('logic.move_player')
+def bench_move_player() -> Callable[[], object]:
+    """Moving a player from each cell of the board by each roll in turn."""
+    logic = _new_game()
+    player = logic.players[0]
+    moves = itertools.cycle([(start, roll) for start in range(logic.board.total_cells)
+                             for roll in range(1, 7)])
+
+    def run() -> None:
+        start, roll = next(moves)
+        player.position = start
+        logic.move_player(player, roll)
+    return run
+
+
+@benchmark('logic.snapshot_restore')
+def bench_snapshot_restore() -> Callable[[], object]:
+    """Checkpointing and restoring a game mid-play."""
+    logic = _new_game()
+    for _ in range(20):
+        logic.play_turn()
+
+    def run() -> None:
+        logic.restore(logic.snapshot())
+    return run
+
+
+@benchmark('board.get_cell_coordinates')
+def bench_cell_coordinates() -> Callable[[], object]:
+    """Pixel coordinates of every cell on the board."""
+    board = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+    positions = itertools.cycle(range(1, board.total_cells + 1))
+    height = const.WINDOW_SIZE[1]
+
+    def run() -> None:
+        board.get_cell_coordinates(next(positions), const.CELL_SIZE, height)
+    return run
+
+
+@benchmark('board.get_position_from_coords')
+def bench_position_from_coords() -> Callable[[], object]:
+    """Cell lookup for a sweep of points across the board."""
+    board = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+    step = const.CELL_SIZE // 3
+    points = itertools.cycle([(x, y) for x in range(0, const.BOARD_WIDTH, step)
+                              for y in range(0, const.WINDOW_SIZE[1], step)])
+    height = const.WINDOW_SIZE[1]
+
+    def run() -> None:
+        x, y = next(points)
+        board.get_position_from_coords(x, y, const.CELL_SIZE, height)
+    return run
+
+
+@benchmark('ui.board_draw')
+def bench_board_draw() -> Callable[[], object]:
+    """One frame of the board with two tokens on it."""
+    logic = _new_game()
+    logic.players[0].position = 27
+    logic.players[1].position = 64
+    board_ui = BoardUI(logic.board, logic.players)
+    surface = pygame.display.get_surface()
+
+    def run() -> None:
+        board_ui.draw(surface)
+    return run
+
+
+@benchmark('ui.board_pan_large')
+def bench_board_pan_large() -> Callable[[], object]:
+    """One frame of a 1000x1000 board while the camera pans across it."""
+    logic = GameLogic([Player("Player 1", const.RED), Player("Player 2", const.BLUE)],
+                      _large_board(), seed=1)
+    board_ui = BoardUI(logic.board, logic.players)
+    camera = board_ui.camera
+    # Large boards open zoomed out; pan at the standard board's cell size
+    camera.zoom(const.CELL_SIZE / camera.cell_size)
+    surface = pygame.display.get_surface()
+    # Pan far enough each frame to keep reaching tiles that are not cached
+    steps = itertools.cycle([(37, -23)] * 400 + [(-37, 23)] * 400)
+
+    def run() -> None:
+        camera.pan(*next(steps))
+        board_ui.draw(surface)
+    return run
+
+
+@benchmark('ui.sidebar_draw')
+def bench_sidebar_draw() -> Callable[[], object]:
+    """One frame of the sidebar, cycling through the dice faces."""
+    logic = _new_game()
+    sidebar_ui = SidebarUI(const.SIDEBAR_WIDTH, const.WINDOW_SIZE[1], logic.board.total_cells)
+    surface = pygame.display.get_surface()
+    values = itertools.cycle(range(1, 7))
+    player = logic.players[0]
+
+    def run() -> None:
+        sidebar_ui.draw(surface, player, next(values))
+    return run
+
+
+@benchmark('ui.animation_update')
+def bench_animation_update() -> Callable[[], object]:
+    """One update of the animation manager with many live move animations."""
+    manager = AnimationManager()
+    board = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+    for i in range(ANIMATION_COUNT):
+        player = Player(f"Player {i + 1}", const.RED, position=i % 90 + 1)
+        # Long enough never to finish while being timed
+        manager.add_animation(MoveAnimation(player, player.position + 6, 1e6, board,
+                                            const.CELL_SIZE, const.WINDOW_SIZE[1]))
+
+    def run() -> None:
+        manager.update()
+    return run
+
+
+@benchmark('ui.animation_update_replay')
+def bench_animation_update_replay() -> Callable[[], object]:
+    """One update of pooled move animations for players sharing one table, as in a replay."""
+    manager = AnimationManager()
+    board = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+    table = PlayerTable()
+    for i in range(ANIMATION_COUNT):
+        player = table.add(f"Player {i + 1}", const.RED, position=i % 90 + 1)
+        manager.move(player, player.position + 6, 1e6, board, const.CELL_SIZE, const.WINDOW_SIZE[1])
+
+    def run() -> None:
+        manager.update()
+    return run
+
+
+@benchmark('cli.generate_board')
+def bench_generate_board() -> Callable[[], object]:
+    """Building the CLI's board table for four players."""
+    cli = _load_cli()
+    players = [("Alice", 7), ("Bob", 34), ("Carol", 34), ("Dave", 99)]
+
+    def run() -> None:
+        cli.generate_board(players)
+    return run
+
+
+@benchmark('cli.display_game_state')
+def bench_display_game_state() -> Callable[[], object]:
+    """Rendering the CLI's full game screen to an in-memory terminal."""
+    cli = _load_cli()
+    cli.console = cli.Console(file=io.StringIO(), width=120, height=60,
+                              force_terminal=True, color_system='truecolor')
+    players = [("Alice", 7), ("Bob", 34), ("Carol", 34), ("Dave", 99)]
+
+    def run() -> None:
+        cli.console.file.seek(0)
+        cli.console.file.truncate()
+        cli.display_game_state(players, 1, 4)
+    return run
+
+
+def measure(func: Callable[[], object], repeat: int = 5, min_time: float = 0.2) -> float:
+    """Time ``func``.
+
+    Args:
+        func: The callable to time
+        repeat: Number of timing runs; the fastest is kept
+        min_time: Minimum duration of each run in seconds
+
+    Returns:
+        float: Microseconds per call
+    """
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number * 1e6
+
+
+def run_benchmarks(pattern: Optional[str] = None, repeat: int = 5) -> Dict[str, float]:
+    """Run the registered benchmarks.
+
+    Args:
+        pattern: Only run benchmarks whose name contains this substring
+        repeat: Number of timing runs per benchmark
+
+    Returns:
+        Dict[str, float]: Microseconds per call for each benchmark
+    """
+    pygame.init()
+    pygame.display.set_mode(const.WINDOW_SIZE)
+    try:
+        results = {}
+        for name, setup in BENCHMARKS.items():
+            if pattern and pattern not in name:
+                continue
+            results[name] = measure(setup(), repeat=repeat)
+            print(f"{name:<32} {results[name]:12.3f} us/call", flush=True)
+        return results
+    finally:
+        pygame.quit()
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """Compare results against a baseline and print a report.
+
+    Args:
+        results: Microseconds per call from this run
+        baseline: Microseconds per call from the baseline
+        tolerance: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        List[str]: Names of the benchmarks that regressed
+    """
+    regressions = []
+    print(f"\n{'benchmark':<32} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<32} {'-':>12} {current:12.3f} {'new':>8}")
+            continue
+        change = current / previous - 1.0
+        flag = ''
+        if change > tolerance:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:<32} {previous:12.3f} {current:12.3f} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the suite from the command line."""
+    parser = argparse.ArgumentParser(description="Run the Snake and Ladder benchmarks.")
+    parser.add_argument('-k', dest='pattern', help="only run benchmarks whose name contains this")
+    parser.add_argument('-o', '--output', help="write the results as JSON to this file")
+    parser.add_argument('--baseline',
+                        help="baseline JSON file (default: baseline.local.json if it exists, "
+                             "else baseline.json; --save-baseline writes baseline.local.json)")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store the results as the new baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float,
+                        help="allowed slowdown before a benchmark counts as a regression "
+                             f"(default: {LOCAL_TOLERANCE} against a local baseline, "
+                             f"{REFERENCE_TOLERANCE} against the committed one)")
+    parser.add_argument('--repeat', type=int, default=5, help="timing runs per benchmark")
+    args = parser.parse_args(argv)
+    if args.baseline is None:
+        use_local = args.save_baseline or os.path.exists(LOCAL_BASELINE)
+        args.baseline = LOCAL_BASELINE if use_local else REFERENCE_BASELINE
+    reference = os.path.abspath(args.baseline) == REFERENCE_BASELINE
+    if args.tolerance is None:
+        args.tolerance = REFERENCE_TOLERANCE if reference else LOCAL_TOLERANCE
+
+    results = run_benchmarks(args.pattern, args.repeat)
+    report = {
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': platform.machine(),
+        'unit': 'us/call',
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                previous = json.load(f)
+            # Keep baseline entries for benchmarks filtered out of this run
+            report['results'] = {**previous.get('results', {}), **results}
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)['results']
+    if reference:
+        print("\nComparing with the committed baseline, measured on other hardware; "
+              "run with --save-baseline for a local one")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Board analysis package."""
+
+from .landings import LandingStats, landing_stats
+from .markov import MarkovSolution, solve_board
+from .monte_carlo import MonteCarloResult, run_monte_carlo, shard_seed
+from .optimizer import (LayoutConstraints, LayoutStats, LayoutTargets, OptimizationResult,
+                        board_definition, evaluate_layout, layout_violations, optimize_layout)
+from .win_odds import WinOdds, finish_table
+
+__all__ = ['LandingStats', 'landing_stats', 'MarkovSolution', 'solve_board',
+           'MonteCarloResult', 'run_monte_carlo', 'shard_seed',
+           'LayoutConstraints', 'LayoutStats', 'LayoutTargets', 'OptimizationResult',
+           'board_definition', 'evaluate_layout', 'layout_violations', 'optimize_layout',
+           'WinOdds', 'finish_table']
@@ -0,0 +1,115 @@
+"""How often a board's cells are landed on and its snakes and ladders fire."""
+
+import math
+from functools import lru_cache
+from typing import Dict, NamedTuple, Tuple
+import numpy as np
+from ..core.simulation import BatchSimulator
+from ..models.board import Board
+from .markov import MAX_DENSE_CELLS
+
+# Games simulated for boards too big to solve exactly
+SIMULATED_GAMES = 500
+
+# A simulated game is cut off after this many times the turns a jump-free
+# board needs on average (a turn covers about 3.5 cells), and never later
+# than SIMULATED_MAX_TURNS, which keeps the largest boards to a few seconds
+SIMULATED_TURN_MARGIN = 4
+SIMULATED_MAX_TURNS = 20000
+
+class LandingStats(NamedTuple):
+    """Landing and jump frequencies for one player playing a board to the end.
+
+    Attributes:
+        landings: Expected landings per game on each cell, counted before
+            any jump (index 0 unused)
+        fires: Expected times per game each snake or ladder is followed, by
+            its start cell; a jump reached through a chain counts too
+        exact: True if solved exactly, False if estimated by simulation
+        cut_off: Share of the simulated games stopped at the turn limit
+            before finishing (0 when exact); their landings still count,
+            so cells near the goal are underweighted when this is not 0
+    """
+    landings: np.ndarray
+    fires: Dict[int, float]
+    exact: bool
+    cut_off: float = 0.0
+
+
+def landing_stats(board: Board) -> LandingStats:
+    """Get how often each cell is landed on and each jump fires.
+
+    Boards of up to ``MAX_DENSE_CELLS`` cells are solved exactly and bigger
+    ones simulated. The last few layouts' results are kept, so asking again
+    for the board on screen does no work.
+
+    Args:
+        board: The game board
+
+    Returns:
+        LandingStats: The frequencies
+    """
+    return _landing_stats(board.key())
+
+
+@lru_cache(maxsize=8)
+def _landing_stats(key: Tuple) -> LandingStats:
+    """Work out the frequencies for a board key (see ``Board.key``)."""
+    board = Board.from_key(key)
+    if board.total_cells <= MAX_DENSE_CELLS:
+        landings = _exact_landings(board)
+        exact = True
+        cut_off = 0.0
+    else:
+        result = BatchSimulator(board, 1).run(SIMULATED_GAMES, 0, simulated_turn_limit(board),
+                                              track_landings=True)
+        landings = result.landings / SIMULATED_GAMES
+        exact = False
+        cut_off = float(np.mean(result.winner < 0))
+    landings.setflags(write=False)
+
+    # Every jump a landing passes through fires, following chains as the board does
+    fires = {cell: 0.0 for cell in set(board.snakes) | set(board.ladders)}
+    for cell in fires:
+        target = cell
+        while target in board.snakes or target in board.ladders:
+            fires[target] += float(landings[cell])
+            target = board.snakes.get(target, board.ladders.get(target))
+    return LandingStats(landings, fires, exact, cut_off)
+
+
+def simulated_turn_limit(board: Board) -> int:
+    """Get the turn limit simulated games on a board are cut off at."""
+    return min(SIMULATED_MAX_TURNS, math.ceil(SIMULATED_TURN_MARGIN * board.total_cells / 3.5))
+
+
+def _exact_landings(board: Board) -> np.ndarray:
+    """Solve for the expected landings per cell over one player's game.
+
+    Each roll moves the token by the chain ``Q`` over the cells before the
+    goal, so the expected number of rolls made from each cell is
+    ``e0 (I - Q)^-1``; a roll from cell ``s`` lands on each of ``s + 1`` to
+    ``s + 6`` that is on the board with probability 1/6.
+    """
+    goal = board.total_cells
+    destinations = np.arange(goal + 1)
+    for cell, (destination, _) in board.jumps.items():
+        destinations[cell] = destination
+
+    # One-roll transitions between the cells before the goal
+    cells = np.arange(goal)
+    transitions = np.zeros((goal, goal))
+    for roll in range(1, 7):
+        landing = cells + roll
+        target = np.where(landing > goal, cells, destinations[np.minimum(landing, goal)])
+        running = target < goal
+        np.add.at(transitions, (cells[running], target[running]), 1 / 6)
+
+    start = np.zeros(goal)
+    start[0] = 1.0
+    rolls_from = np.linalg.solve((np.eye(goal) - transitions).T, start)
+
+    landings = np.zeros(goal + 1)
+    for roll in range(1, 7):
+        landings[roll:] += rolls_from[:goal + 1 - roll] / 6
+    return landings
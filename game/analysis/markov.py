@@ -0,0 +1,123 @@
+"""Exact Markov-chain analysis of a Snake and Ladder board."""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+import numpy as np
+from ..models.board import Board, JUMP_BLOCKED
+
+# Largest board, in cells, given to any dense solve (turn statistics, exact
+# landings and win odds). The matrices are dense, so memory grows with the
+# square of the cell count and time with its cube; a 40x40 board takes a
+# couple of seconds, and bigger ones are refused or simulated instead
+MAX_DENSE_CELLS = 1600
+
+class MarkovSolution:
+    """Exact turn statistics for a single player on a board.
+    
+    A turn is one or more rolls: rolling a six moves the player and lets them
+    roll again, and, as in ``GameLogic.play_turn``, a roll that would
+    overshoot the goal leaves them in place to roll again. The chain below
+    works on whole turns rather than rolls.
+    States are board positions 0 (off the board) to ``goal``.
+    
+    Attributes:
+        goal: The winning cell
+        turn_matrix: (goal + 1) x (goal + 1) transition matrix for one turn
+        expected_turns: Expected turns to finish from every position
+        variance: Variance of the turns to finish from every position
+    """
+    
+    def __init__(self, goal: int, turn_matrix: np.ndarray):
+        """Solve the absorbing chain described by ``turn_matrix``.
+        
+        Args:
+            goal: The winning cell (the only absorbing state)
+            turn_matrix: Row-stochastic transition matrix for one turn
+        """
+        self.goal = goal
+        self.turn_matrix = turn_matrix
+        
+        # Fundamental matrix of the transient part gives the moments directly
+        transient = turn_matrix[:goal, :goal]
+        fundamental = np.linalg.inv(np.eye(goal) - transient)
+        expected = fundamental.sum(axis=1)
+        variance = (2 * fundamental - np.eye(goal)) @ expected - expected ** 2
+        
+        self.expected_turns = np.append(expected, 0.0)
+        self.variance = np.append(variance, 0.0)
+        self._distributions: Dict[Tuple[int, float, int], np.ndarray] = {}
+        
+        for array in (self.turn_matrix, self.expected_turns, self.variance):
+            array.setflags(write=False)
+    
+    def length_distribution(self, start: int = 0, tol: float = 1e-12,
+                            max_turns: int = 100000) -> np.ndarray:
+        """Get the probability distribution of the number of turns to finish.
+        
+        Args:
+            start: Starting position (default: 0 - off board)
+            tol: Stop once the unfinished probability mass drops below this
+            max_turns: Hard limit on the length of the returned distribution
+            
+        Returns:
+            np.ndarray: ``p[k]`` is the probability of finishing on turn k
+        """
+        cache_key = (start, tol, max_turns)
+        if cache_key not in self._distributions:
+            state = np.zeros(self.goal + 1)
+            state[start] = 1.0
+            pmf = [state[self.goal]]
+            finished = state[self.goal]
+            while 1.0 - finished > tol and len(pmf) <= max_turns:
+                state = state @ self.turn_matrix
+                pmf.append(state[self.goal] - finished)
+                finished = state[self.goal]
+            distribution = np.array(pmf)
+            distribution.setflags(write=False)
+            self._distributions[cache_key] = distribution
+        return self._distributions[cache_key]
+
+
+def solve_board(board: Board) -> MarkovSolution:
+    """Get the exact turn statistics for a board.
+    
+    The chain is solved once per layout and kept, so boards with equal
+    contents share one solution.
+    
+    Args:
+        board: The game board (at most ``MAX_DENSE_CELLS`` cells)
+        
+    Returns:
+        MarkovSolution: The solved chain for the board
+        
+    Raises:
+        ValueError: If the board is too large to solve
+    """
+    if board.total_cells > MAX_DENSE_CELLS:
+        raise ValueError(f"Exact turn statistics need a board of at most {MAX_DENSE_CELLS} cells, "
+                         f"got {board.total_cells}")
+    return _solve(board.key())
+
+
+@lru_cache(maxsize=32)
+def _solve(key: Tuple) -> MarkovSolution:
+    """Build and solve the chain for a board key (see ``Board.key``)."""
+    board = Board.from_key(key)
+    goal = board.total_cells
+    
+    # Split single rolls into those that end the turn and those that don't:
+    # sixes short of the goal and overshoots, which are rolled again
+    ending = np.zeros((goal + 1, goal + 1))
+    continuing = np.zeros((goal + 1, goal + 1))
+    for position in range(goal):
+        for roll in range(1, 7):
+            target, jump = board.resolve_move(position, roll)
+            if jump == JUMP_BLOCKED or (roll == 6 and target != goal):
+                continuing[position, target] += 1 / 6
+            else:
+                ending[position, target] += 1 / 6
+    ending[goal, goal] = 1.0
+    
+    # A turn either ends now or continues from the new cell: K = A + S K
+    turn_matrix = np.linalg.solve(np.eye(goal + 1) - continuing, ending)
+    return MarkovSolution(goal, turn_matrix)
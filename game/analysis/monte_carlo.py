@@ -0,0 +1,117 @@
+"""Multi-core Monte Carlo runner for Snake and Ladder simulations."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import NamedTuple, Optional, Tuple
+import numpy as np
+from ..core.simulation import BatchSimulator
+from ..models.board import Board
+
+# Games simulated per BatchSimulator call inside a shard, to bound memory
+CHUNK_SIZE = 1_000_000
+
+class MonteCarloResult(NamedTuple):
+    """Merged histograms from a Monte Carlo run.
+
+    Attributes:
+        num_games: Number of games simulated
+        length_histogram: Games finishing in k turns at index k; the last
+            bin also holds games abandoned at the turn limit
+        winner_histogram: Wins per seat; the last bin counts abandoned games
+        landings: Landings per cell (before any jump) over all games
+    """
+    num_games: int
+    length_histogram: np.ndarray
+    winner_histogram: np.ndarray
+    landings: np.ndarray
+
+
+def shard_seed(master_seed: int, shard: int) -> np.random.SeedSequence:
+    """Derive the deterministic seed of one shard.
+
+    Args:
+        master_seed: Seed of the whole run
+        shard: Index of the shard
+
+    Returns:
+        np.random.SeedSequence: Independent seed for the shard's dice
+    """
+    return np.random.SeedSequence(master_seed, spawn_key=(shard,))
+
+
+def run_monte_carlo(board: Board, num_players: int, num_games: int, seed: int = 0,
+                    shards: Optional[int] = None, processes: Optional[int] = None,
+                    max_turns: int = 1000) -> MonteCarloResult:
+    """Simulate games on a board across a pool of worker processes.
+
+    The games are split into shards, each with its own seed derived from
+    ``seed``. Results are identical for the same seed and shard count
+    however many processes run them.
+
+    Args:
+        board: The game board
+        num_players: Number of seats in every game
+        num_games: Total number of games to simulate
+        seed: Master seed of the run
+        shards: Number of shards (default: one per CPU)
+        processes: Number of worker processes (default: one per CPU)
+        max_turns: Turn limit after which a game is abandoned
+
+    Returns:
+        MonteCarloResult: Histograms merged over all shards
+    """
+    shards = shards or os.cpu_count() or 1
+    layout = _row_layout(board, num_players, max_turns)
+    row_size = sum(layout)
+
+    # Each shard writes its histograms into its own row of one shared block
+    block = shared_memory.SharedMemory(create=True, size=shards * row_size * 8)
+    try:
+        rows = np.ndarray((shards, row_size), dtype=np.int64, buffer=block.buf)
+        rows[:] = 0
+        tasks = [
+            (block.name, shards, shard, board, num_players,
+             num_games // shards + (shard < num_games % shards), seed, max_turns)
+            for shard in range(shards)
+        ]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(_run_shard, tasks))
+        totals = rows.sum(axis=0)
+        del rows
+    finally:
+        block.close()
+        block.unlink()
+
+    lengths, winners, landings = np.split(totals, np.cumsum(layout)[:-1])
+    return MonteCarloResult(num_games, lengths, winners, landings)
+
+
+def _row_layout(board: Board, num_players: int, max_turns: int) -> Tuple[int, int, int]:
+    """Get the sizes of the length, winner and landing histograms."""
+    return (max_turns + 1, num_players + 1, board.total_cells + 1)
+
+
+def _run_shard(task: Tuple) -> int:
+    """Simulate one shard and write its histograms to shared memory."""
+    block_name, shards, shard, board, num_players, num_games, seed, max_turns = task
+    layout = _row_layout(board, num_players, max_turns)
+    simulator = BatchSimulator(board, num_players)
+    rng = np.random.default_rng(shard_seed(seed, shard))
+
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        row = np.ndarray((shards, sum(layout)), dtype=np.int64, buffer=block.buf)[shard]
+        lengths, winners, landings = np.split(row, np.cumsum(layout)[:-1])
+        for start in range(0, num_games, CHUNK_SIZE):
+            result = simulator.run(min(CHUNK_SIZE, num_games - start), rng,
+                                   max_turns, track_landings=True)
+            lengths += np.bincount(np.minimum(result.turns, max_turns),
+                                   minlength=layout[0])
+            winners += np.bincount(np.where(result.winner < 0, num_players, result.winner),
+                                   minlength=layout[1])
+            landings += result.landings
+        del row, lengths, winners, landings
+    finally:
+        block.close()
+    return shard
@@ -0,0 +1,442 @@
+"""Parallel search for snake and ladder layouts that hit game-length and fairness targets.
+
+Usage:
+    python -m game.analysis.optimizer --players 2 --mean-turns 50 --tail-turns 110
+"""
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import numpy as np
+from ..models.board import Board
+from .markov import MAX_DENSE_CELLS, solve_board
+from .monte_carlo import shard_seed
+
+# Unfinished probability mass left when a finish-turn distribution is cut off
+DISTRIBUTION_TOL = 1e-9
+
+# Longest finish-turn distribution worked out for one candidate
+MAX_DISTRIBUTION_TURNS = 10000
+
+# Attempts at drawing a valid jump before a move is given up
+MAX_DRAWS = 50
+
+# Jumps per line in the printed definition, as in constants.py
+JUMPS_PER_LINE = 5
+
+class LayoutConstraints(NamedTuple):
+    """Rules every candidate layout must follow.
+
+    Jumps never start or end on the goal, and no two jumps share a cell, so
+    a snake or ladder can't lead straight into another (no chains).
+
+    Attributes:
+        num_snakes: Number of snakes
+        num_ladders: Number of ladders
+        min_length: Shortest jump, in cells
+        max_length: Longest jump, in cells (default: no limit)
+    """
+    num_snakes: int = 10
+    num_ladders: int = 9
+    min_length: int = 3
+    max_length: Optional[int] = None
+
+
+class LayoutTargets(NamedTuple):
+    """What the search aims for; targets left as None are ignored.
+
+    Game lengths count every player's turns, as ``BatchSimulator`` does. The
+    length errors are relative to the target, and the seat advantage error
+    is relative to a fair share of the wins, so the weights are comparable.
+
+    Attributes:
+        num_players: Seats in every game
+        mean_turns: Mean game length
+        tail_turns: Game length at ``tail_quantile``
+        tail_quantile: Fraction of games finished by ``tail_turns``
+        first_seat_advantage: First seat's win probability above a fair share
+        mean_weight: Weight of the mean length error
+        tail_weight: Weight of the tail length error
+        fairness_weight: Weight of the seat advantage error
+    """
+    num_players: int = 2
+    mean_turns: Optional[float] = None
+    tail_turns: Optional[float] = None
+    tail_quantile: float = 0.95
+    first_seat_advantage: Optional[float] = 0.0
+    mean_weight: float = 1.0
+    tail_weight: float = 1.0
+    fairness_weight: float = 1.0
+
+
+class LayoutStats(NamedTuple):
+    """Exact game statistics of a layout.
+
+    Attributes:
+        mean_turns: Mean game length
+        tail_turns: Game length at the requested quantile
+        win_probabilities: Probability of each seat winning
+        first_seat_advantage: First seat's win probability above a fair share
+    """
+    mean_turns: float
+    tail_turns: int
+    win_probabilities: Tuple[float, ...]
+    first_seat_advantage: float
+
+
+class OptimizationResult(NamedTuple):
+    """Best layout found by ``optimize_layout``.
+
+    Attributes:
+        board: The layout, ready to play on
+        stats: Its exact statistics
+        score: Weighted squared error against the targets (0 is a perfect hit)
+        evaluations: Candidates scored over all chains
+    """
+    board: Board
+    stats: LayoutStats
+    score: float
+    evaluations: int
+
+
+def evaluate_layout(board: Board, num_players: int = 2,
+                    tail_quantile: float = 0.95) -> LayoutStats:
+    """Work out a layout's game statistics exactly.
+
+    Players move independently, so every seat's finish turn follows the same
+    single-player distribution from the Markov solver. Seat ``i`` wins on its
+    ``t``-th turn if it finishes then, the seats before it have not finished
+    by their ``t``-th turn and the seats after it have not by their
+    ``(t - 1)``-th, which gives the whole game-length distribution at once.
+
+    Args:
+        board: The game board
+        num_players: Seats in every game
+        tail_quantile: Fraction of games the tail length must cover
+
+    Returns:
+        LayoutStats: The statistics
+    """
+    pmf = solve_board(board).length_distribution(0, DISTRIBUTION_TOL, MAX_DISTRIBUTION_TURNS)
+    unfinished = 1.0 - np.cumsum(pmf)
+    seats = np.arange(num_players)
+
+    # wins[t - 1, i]: seat i wins on its t-th turn, the game's ((t - 1) * n + i + 1)-th
+    wins = (pmf[1:, None] * unfinished[1:, None] ** seats
+            * unfinished[:-1, None] ** (num_players - 1 - seats))
+    lengths = wins.ravel()
+    mean_turns = float(lengths @ np.arange(1, lengths.size + 1))
+    tail_turns = int(np.searchsorted(np.cumsum(lengths), tail_quantile)) + 1
+
+    win_probabilities = tuple(float(p) for p in wins.sum(axis=0))
+    return LayoutStats(mean_turns, tail_turns, win_probabilities,
+                       win_probabilities[0] - 1.0 / num_players)
+
+
+def layout_violations(board: Board,
+                      constraints: Optional[LayoutConstraints] = None) -> List[str]:
+    """List the ways a layout breaks the constraints.
+
+    Args:
+        board: The game board
+        constraints: The rules to check (default: ``LayoutConstraints()``)
+
+    Returns:
+        List[str]: One message per problem; empty if the layout is valid
+    """
+    constraints = constraints or LayoutConstraints()
+    goal = board.total_cells
+    min_length, max_length = _length_range(constraints, goal)
+    problems = []
+    if len(board.snakes) != constraints.num_snakes:
+        problems.append(f"{len(board.snakes)} snakes, expected {constraints.num_snakes}")
+    if len(board.ladders) != constraints.num_ladders:
+        problems.append(f"{len(board.ladders)} ladders, expected {constraints.num_ladders}")
+
+    seen = set()
+    for name, jumps in (('Snake', board.snakes), ('Ladder', board.ladders)):
+        for start, end in sorted(jumps.items()):
+            if goal in (start, end):
+                problems.append(f"{name} {start} -> {end} touches the goal")
+            if (end < start) != (name == 'Snake'):
+                problems.append(f"{name} {start} -> {end} goes the wrong way")
+            if not min_length <= abs(end - start) <= max_length:
+                problems.append(f"{name} {start} -> {end} is not {min_length} to {max_length} cells long")
+            for cell in (start, end):
+                if cell in seen:
+                    problems.append(f"{name} {start} -> {end} shares cell {cell} with another jump")
+                seen.add(cell)
+    return problems
+
+
+def optimize_layout(constraints: Optional[LayoutConstraints] = None,
+                    targets: Optional[LayoutTargets] = None, size: int = 10,
+                    iterations: int = 2000, chains: Optional[int] = None,
+                    processes: Optional[int] = None, seed: int = 0,
+                    start: Optional[Board] = None,
+                    temperature: float = 0.01) -> OptimizationResult:
+    """Search for the layout that best meets the targets.
+
+    Independent simulated-annealing chains run across a pool of worker
+    processes, each seeded from ``seed`` and scoring every candidate
+    exactly with ``evaluate_layout``. Results are identical for the same
+    seed and chain count however many processes run them. The evaluator
+    solves a dense chain over every cell, so boards are limited to
+    ``markov.MAX_DENSE_CELLS`` cells.
+
+    Args:
+        constraints: Rules every layout must follow (default: ``LayoutConstraints()``)
+        targets: What to aim for (default: ``LayoutTargets()``)
+        size: Board size, in cells per side
+        iterations: Candidates scored by each chain
+        chains: Number of independent chains (default: one per CPU)
+        processes: Number of worker processes (default: one per CPU)
+        seed: Master seed of the search
+        start: Layout every chain starts from (default: a random one per chain)
+        temperature: Initial annealing temperature, in units of the score
+
+    Returns:
+        OptimizationResult: The best layout over all chains
+
+    Raises:
+        ValueError: If the board is too large, ``start`` breaks the
+            constraints or no layout can meet them
+    """
+    constraints = constraints or LayoutConstraints()
+    targets = targets or LayoutTargets()
+    goal = size * size
+    if goal > MAX_DENSE_CELLS:
+        raise ValueError(f"Layouts can be scored on boards of at most {MAX_DENSE_CELLS} cells, "
+                         f"got {goal}")
+    min_length, max_length = _length_range(constraints, goal)
+    if min_length < 1 or min_length > max_length or max_length > goal - 2:
+        raise ValueError(f"No jumps of {min_length} to {max_length} cells fit a board of {goal} cells")
+    start_key = None
+    if start is not None:
+        problems = layout_violations(start, constraints)
+        if problems:
+            raise ValueError("Starting layout breaks the constraints: " + "; ".join(problems))
+        start_key = start.key()
+
+    chains = chains or os.cpu_count() or 1
+    tasks = [(constraints, targets, size, iterations, seed, chain, start_key, temperature)
+             for chain in range(chains)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(_run_chain, tasks))
+
+    # Ties go to the lowest chain, keeping the result independent of scheduling
+    score, key, _ = min(results, key=lambda result: result[0])
+    board = Board.from_key(key)
+    stats = evaluate_layout(board, targets.num_players, targets.tail_quantile)
+    return OptimizationResult(board, stats, score, sum(result[2] for result in results))
+
+
+def board_definition(board: Board) -> str:
+    """Format a layout as Python source, ready to paste over ``constants.py``'s.
+
+    Args:
+        board: The game board
+
+    Returns:
+        str: ``SNAKES`` and ``LADDERS`` dictionaries, with ``BOARD_SIZE``
+        when the board is not 10x10
+    """
+    lines = []
+    if board.size != 10:
+        lines += [f"BOARD_SIZE = {board.size}", ""]
+    for name, jumps in (('SNAKES', board.snakes), ('LADDERS', board.ladders)):
+        items = [f"{start}: {end}" for start, end in sorted(jumps.items())]
+        rows = [", ".join(items[i:i + JUMPS_PER_LINE])
+                for i in range(0, len(items), JUMPS_PER_LINE)]
+        lines.append(f"{name} = {{")
+        lines.append(",\n".join(f"    {row}" for row in rows))
+        lines += ["}", ""]
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def _length_range(constraints: LayoutConstraints, goal: int) -> Tuple[int, int]:
+    """Get the shortest and longest allowed jump for a board."""
+    max_length = constraints.max_length
+    return constraints.min_length, max_length if max_length is not None else goal - 2
+
+
+def _score(stats: LayoutStats, targets: LayoutTargets) -> float:
+    """Get the weighted squared error of a layout's statistics against the targets."""
+    score = 0.0
+    if targets.mean_turns is not None:
+        score += targets.mean_weight * (stats.mean_turns / targets.mean_turns - 1.0) ** 2
+    if targets.tail_turns is not None:
+        score += targets.tail_weight * (stats.tail_turns / targets.tail_turns - 1.0) ** 2
+    if targets.first_seat_advantage is not None:
+        error = (stats.first_seat_advantage - targets.first_seat_advantage) * targets.num_players
+        score += targets.fairness_weight * error ** 2
+    return score
+
+
+def _valid_jump(start: int, end: int, snake: bool, goal: int,
+                length_range: Tuple[int, int], taken: set) -> bool:
+    """Check a single jump against the constraints and the cells already in use."""
+    return (1 <= start < goal and 1 <= end < goal and (end < start) == snake
+            and length_range[0] <= abs(end - start) <= length_range[1]
+            and start not in taken and end not in taken)
+
+
+def _random_jump(rng: np.random.Generator, snake: bool, goal: int,
+                 length_range: Tuple[int, int], taken: set) -> Optional[Tuple[int, int]]:
+    """Draw a valid jump anywhere on the board, or None if none was found."""
+    for _ in range(MAX_DRAWS):
+        length = int(rng.integers(length_range[0], length_range[1] + 1))
+        if snake:
+            start = int(rng.integers(length + 1, goal))
+            end = start - length
+        else:
+            start = int(rng.integers(1, goal - length))
+            end = start + length
+        if _valid_jump(start, end, snake, goal, length_range, taken):
+            return start, end
+    return None
+
+
+def _random_layout(rng: np.random.Generator, constraints: LayoutConstraints,
+                   goal: int) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """Draw a random valid layout.
+
+    Raises:
+        ValueError: If the jumps don't fit on the board
+    """
+    length_range = _length_range(constraints, goal)
+    layout: Tuple[Dict[int, int], Dict[int, int]] = ({}, {})
+    taken: set = set()
+    for snake, count in ((True, constraints.num_snakes), (False, constraints.num_ladders)):
+        jumps = layout[0] if snake else layout[1]
+        for _ in range(count):
+            jump = _random_jump(rng, snake, goal, length_range, taken)
+            if jump is None:
+                raise ValueError(f"Could not fit {constraints.num_snakes} snakes and "
+                                 f"{constraints.num_ladders} ladders on a board of {goal} cells")
+            jumps[jump[0]] = jump[1]
+            taken.update(jump)
+    return layout
+
+
+def _mutate(rng: np.random.Generator, snakes: Dict[int, int], ladders: Dict[int, int],
+            size: int, length_range: Tuple[int, int]) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """Get a neighbouring layout by moving, stretching or redrawing one jump.
+
+    Returns the layout unchanged if no valid move was found.
+    """
+    goal = size * size
+    snake = rng.random() < len(snakes) / (len(snakes) + len(ladders))
+    jumps = snakes if snake else ladders
+    if not jumps:
+        return snakes, ladders
+    starts = sorted(jumps)
+    old_start = starts[int(rng.integers(len(starts)))]
+    old_end = jumps[old_start]
+    taken = set(snakes) | set(snakes.values()) | set(ladders) | set(ladders.values())
+    taken -= {old_start, old_end}
+
+    move = rng.random()
+    new = None
+    for _ in range(MAX_DRAWS):
+        if move < 0.2:
+            new = _random_jump(rng, snake, goal, length_range, taken)
+            break
+        shift = int(rng.integers(-size, size + 1))
+        if shift == 0:
+            continue
+        if move < 0.6:
+            candidate = (old_start + shift, old_end + shift)
+        elif move < 0.8:
+            candidate = (old_start + shift, old_end)
+        else:
+            candidate = (old_start, old_end + shift)
+        if _valid_jump(candidate[0], candidate[1], snake, goal, length_range, taken):
+            new = candidate
+            break
+    if new is None:
+        return snakes, ladders
+
+    jumps = dict(jumps)
+    del jumps[old_start]
+    jumps[new[0]] = new[1]
+    return (jumps, ladders) if snake else (snakes, jumps)
+
+
+def _run_chain(task: Tuple) -> Tuple[float, Tuple, int]:
+    """Run one annealing chain and return its best (score, board key, evaluations)."""
+    constraints, targets, size, iterations, seed, chain, start_key, temperature = task
+    rng = np.random.default_rng(shard_seed(seed, chain))
+    goal = size * size
+    length_range = _length_range(constraints, goal)
+    if start_key is not None:
+        snakes, ladders = dict(start_key[1]), dict(start_key[2])
+    else:
+        snakes, ladders = _random_layout(rng, constraints, goal)
+
+    def score_of(snakes: Dict[int, int], ladders: Dict[int, int]) -> Tuple[float, Tuple]:
+        board = Board(snakes, ladders, size)
+        stats = evaluate_layout(board, targets.num_players, targets.tail_quantile)
+        return _score(stats, targets), board.key()
+
+    score, key = score_of(snakes, ladders)
+    best_score, best_key = score, key
+    evaluations = 1
+    # Geometric cooling down to a thousandth of the starting temperature
+    cooling = 1e-3 ** (1.0 / max(1, iterations - 1))
+    for _ in range(iterations - 1):
+        new_snakes, new_ladders = _mutate(rng, snakes, ladders, size, length_range)
+        new_score, new_key = score_of(new_snakes, new_ladders)
+        evaluations += 1
+        if (new_score <= score or temperature > 0
+                and rng.random() < math.exp((score - new_score) / temperature)):
+            snakes, ladders, score = new_snakes, new_ladders, new_score
+            if score < best_score:
+                best_score, best_key = score, new_key
+        temperature *= cooling
+    return best_score, best_key, evaluations
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Entry point for the layout optimizer."""
+    defaults = LayoutConstraints()
+    parser = argparse.ArgumentParser(description="Search for a snake and ladder layout")
+    parser.add_argument('--size', type=int, default=10, help="cells per side of the board")
+    parser.add_argument('--snakes', type=int, default=defaults.num_snakes, help="number of snakes")
+    parser.add_argument('--ladders', type=int, default=defaults.num_ladders, help="number of ladders")
+    parser.add_argument('--min-length', type=int, default=defaults.min_length,
+                        help="shortest jump, in cells")
+    parser.add_argument('--max-length', type=int, help="longest jump, in cells (default: no limit)")
+    parser.add_argument('--players', type=int, default=2, help="seats in every game")
+    parser.add_argument('--mean-turns', type=float, help="target mean game length, in turns")
+    parser.add_argument('--tail-turns', type=float, help="target game length at --tail-quantile")
+    parser.add_argument('--tail-quantile', type=float, default=0.95,
+                        help="fraction of games finished by --tail-turns")
+    parser.add_argument('--advantage', type=float, default=0.0,
+                        help="target first-seat win probability above a fair share")
+    parser.add_argument('--iterations', type=int, default=2000, help="candidates scored per chain")
+    parser.add_argument('--chains', type=int, help="independent chains (default: one per CPU)")
+    parser.add_argument('--processes', type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument('--seed', type=int, default=0, help="master seed of the search")
+    args = parser.parse_args(argv)
+
+    constraints = LayoutConstraints(args.snakes, args.ladders, args.min_length, args.max_length)
+    targets = LayoutTargets(args.players, args.mean_turns, args.tail_turns,
+                            args.tail_quantile, args.advantage)
+    result = optimize_layout(constraints, targets, args.size, args.iterations,
+                             args.chains, args.processes, args.seed)
+
+    stats = result.stats
+    wins = ", ".join(f"{p:.1%}" for p in stats.win_probabilities)
+    print(f"Scored {result.evaluations} layouts, best score {result.score:.3g}")
+    print(f"Mean game length {stats.mean_turns:.1f} turns, "
+          f"{targets.tail_quantile:.0%} of games within {stats.tail_turns} turns")
+    print(f"Seat win probabilities {wins} (first seat {stats.first_seat_advantage:+.2%})")
+    print()
+    print(board_definition(result.board), end="")
+
+
+if __name__ == '__main__':
+    main()
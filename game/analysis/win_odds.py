@@ -0,0 +1,147 @@
+"""Exact win probabilities of every player from any point in a game."""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Sequence, Tuple
+import numpy as np
+from ..models.board import Board
+from .markov import MAX_DENSE_CELLS, solve_board
+
+# Unfinished probability mass left when the finish tables are cut off
+FINISH_TOL = 1e-9
+
+# Longest finish table kept, in turns
+MAX_FINISH_TURNS = 10000
+
+class WinOdds:
+    """Win probabilities of a game's players from their positions.
+
+    Players never affect each other's moves, so each one's chance of having
+    finished within ``t`` more of their own turns depends only on their
+    cell. Those chances come from the board's turn-level Markov chain, where
+    a six or an overshoot of the goal continues the same turn, as in
+    ``GameLogic.play_turn``, and are worked out once per board for every
+    cell. A player about to roll again within a turn is in the same place
+    as one starting a turn, so the tables cover that too.
+
+    Positions are then combined in turn order: a player wins on their
+    ``t``-th turn from now if they finish on it, the players due before
+    them have not finished within ``t`` turns and those due after them have
+    not within ``t - 1``. Results are kept in a bounded LRU cache, so
+    revisiting a position is a dictionary lookup.
+
+    Attributes:
+        board: The game board
+        finished: ``finished[cell, t]`` is the chance of finishing within
+            ``t`` turns from ``cell``
+        max_size: Maximum number of positions cached
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that had to be worked out
+    """
+
+    def __init__(self, board: Board, max_size: int = 4096):
+        """Initialize the tables for a board.
+
+        Args:
+            board: The game board (at most ``MAX_DENSE_CELLS`` cells)
+            max_size: Maximum number of positions cached before the least
+                recently used one is evicted
+
+        Raises:
+            ValueError: If the board is too large for exact tables
+        """
+        if board.total_cells > MAX_DENSE_CELLS:
+            raise ValueError(f"Win odds need a board of at most {MAX_DENSE_CELLS} cells, "
+                             f"got {board.total_cells}")
+        self.board = board
+        self.finished = finish_table(board)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._odds: 'OrderedDict[Tuple[Tuple[int, ...], int], Tuple[float, ...]]' = OrderedDict()
+
+    def win_probabilities(self, positions: Sequence[int], current: int) -> Tuple[float, ...]:
+        """Get every player's chance of winning.
+
+        Args:
+            positions: Each player's cell, in seat order (0 - off board)
+            current: Seat of the player about to roll
+
+        Returns:
+            Tuple[float, ...]: Win probability of each seat, summing to 1
+        """
+        key = (tuple(positions), current)
+        odds = self._odds.get(key)
+        if odds is not None:
+            self.hits += 1
+            self._odds.move_to_end(key)
+            return odds
+
+        self.misses += 1
+        odds = self._solve(key[0], current)
+        self._odds[key] = odds
+        if len(self._odds) > self.max_size:
+            self._odds.popitem(last=False)
+        return odds
+
+    def __len__(self) -> int:
+        """Get the number of cached positions."""
+        return len(self._odds)
+
+    def _solve(self, positions: Tuple[int, ...], current: int) -> Tuple[float, ...]:
+        """Work out the win probabilities for one position."""
+        count = len(positions)
+        goal = self.board.total_cells
+        if goal in positions:
+            return tuple(float(position == goal) for position in positions)
+
+        order = [(current + offset) % count for offset in range(count)]
+        finished = self.finished[[positions[seat] for seat in order]]
+        unfinished = 1.0 - finished
+        finishing = np.diff(finished, axis=1)
+
+        odds = np.empty(count)
+        for rank, seat in enumerate(order):
+            chance = finishing[rank].copy()
+            if rank:
+                chance *= unfinished[:rank, 1:].prod(axis=0)
+            if rank < count - 1:
+                chance *= unfinished[rank + 1:, :-1].prod(axis=0)
+            odds[seat] = chance.sum()
+        # The tables stop once almost every game has finished; spread the rest
+        odds /= odds.sum()
+        return tuple(float(p) for p in odds)
+
+
+def finish_table(board: Board) -> np.ndarray:
+    """Get every cell's chance of finishing within each number of turns.
+
+    The table is read-only and shared between boards with the same layout.
+
+    Args:
+        board: The game board
+
+    Returns:
+        np.ndarray: ``table[cell, t]`` is the chance of reaching the goal
+        from ``cell`` within ``t`` turns
+    """
+    return _finish_table(board.key())
+
+
+@lru_cache(maxsize=8)
+def _finish_table(key: Tuple) -> np.ndarray:
+    """Build the finish table for a board key (see ``Board.key``)."""
+    board = Board.from_key(key)
+    turn_matrix = solve_board(board).turn_matrix
+    goal = board.total_cells
+
+    # Finishing within t turns: take one turn, then finish within t - 1
+    column = np.zeros(goal + 1)
+    column[goal] = 1.0
+    columns = [column]
+    while 1.0 - column.min() > FINISH_TOL and len(columns) <= MAX_FINISH_TURNS:
+        column = turn_matrix @ column
+        columns.append(column)
+    table = np.stack(columns, axis=1)
+    table.setflags(write=False)
+    return table
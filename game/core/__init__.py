@@ -2,5 +2,10 @@
 
 from .game_state import GameState
 from .game_logic import GameLogic
+from .dice import DiceSource, StandardDice, WeightedDice, MultiDice
+from .journal import GameJournal, JournalReader, TurnRecord
+from .simulation import BatchSimulator, SimulationResult
 
-__all__ = ['GameState', 'GameLogic']
+__all__ = ['GameState', 'GameLogic', 'DiceSource', 'StandardDice', 'WeightedDice', 'MultiDice',
+           'GameJournal', 'JournalReader', 'TurnRecord',
+           'BatchSimulator', 'SimulationResult']
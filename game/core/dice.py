@@ -0,0 +1,198 @@
+"""Seeded dice sources for the Snake and Ladder game."""
+
+import random
+from typing import List, Optional, Sequence
+import numpy as np
+
+class DiceSource:
+    """Base class for seeded dice that pre-draw their rolls in blocks.
+
+    Rolls are drawn ``block_size`` at a time from a per-source NumPy
+    generator and served from a buffer. The state of a source is fully
+    described by ``(seed, draws)``, so it can be checkpointed and restored.
+    The generator is only built once a roll is needed, so a source that is
+    restored straight after creation never seeds one it throws away.
+
+    Attributes:
+        seed: Seed of the generator
+        draws: Number of rolls served so far
+        block_size: Number of rolls drawn at a time
+    """
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 256):
+        """Initialize the dice source.
+
+        Args:
+            seed: Seed for the rolls (random if None)
+            block_size: Number of rolls to pre-draw at a time
+        """
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.block_size = block_size
+        self.draws = 0
+        self._rng: Optional[np.random.Generator] = None
+        self._buffer: List[int] = []
+        self._index = 0
+
+    @property
+    def max_roll(self) -> int:
+        """The highest value a roll can take."""
+        raise NotImplementedError("Subclasses must implement max_roll")
+
+    def roll(self) -> int:
+        """Roll the dice.
+
+        Returns:
+            int: The rolled value
+        """
+        if self._index >= len(self._buffer):
+            self._buffer = self._draw_block(self._generator(), self.block_size).tolist()
+            self._index = 0
+        value = self._buffer[self._index]
+        self._index += 1
+        self.draws += 1
+        return value
+
+    def seek(self, draws: int, seed: Optional[int] = None) -> None:
+        """Move to the point in the sequence after ``draws`` rolls.
+
+        Args:
+            draws: Number of rolls to have been served
+            seed: Switch to this seed first (default: keep the current seed)
+        """
+        if seed is not None and seed != self.seed or draws < self.draws:
+            self.seed = seed if seed is not None else self.seed
+            self._rng = None
+            self.draws = 0
+            self._buffer = []
+            self._index = 0
+
+        # Whole blocks are regenerated and dropped, the rest served normally
+        remaining_in_buffer = len(self._buffer) - self._index
+        skip = draws - self.draws
+        if skip > remaining_in_buffer:
+            skip -= remaining_in_buffer
+            rng = self._generator()
+            for _ in range(skip // self.block_size):
+                self._draw_block(rng, self.block_size)
+            self._buffer = self._draw_block(rng, self.block_size).tolist()
+            self._index = skip % self.block_size
+        else:
+            self._index += skip
+        self.draws = draws
+
+    def _generator(self) -> np.random.Generator:
+        """Get the generator, seeding it on first use."""
+        if self._rng is None:
+            self._rng = np.random.default_rng(self.seed)
+        return self._rng
+
+    def _draw_block(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw ``count`` rolls from ``rng``.
+
+        Args:
+            rng: The generator to draw from
+            count: Number of rolls to draw
+
+        Returns:
+            np.ndarray: The rolls
+        """
+        raise NotImplementedError("Subclasses must implement _draw_block")
+
+
+class StandardDice(DiceSource):
+    """A single fair die."""
+
+    def __init__(self, faces: int = 6, seed: Optional[int] = None, block_size: int = 256):
+        """Initialize the die.
+
+        Args:
+            faces: Number of faces
+            seed: Seed for the rolls (random if None)
+            block_size: Number of rolls to pre-draw at a time
+        """
+        super().__init__(seed, block_size)
+        self.faces = faces
+
+    @property
+    def max_roll(self) -> int:
+        """The highest value a roll can take."""
+        return self.faces
+
+    def _draw_block(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw ``count`` fair rolls."""
+        return rng.integers(1, self.faces + 1, size=count)
+
+
+class WeightedDice(DiceSource):
+    """A single loaded die, sampled in O(1) per roll with the alias method."""
+
+    def __init__(self, weights: Sequence[float], seed: Optional[int] = None,
+                 block_size: int = 256):
+        """Initialize the die.
+
+        Args:
+            weights: Relative weight of each face, starting with face 1
+            seed: Seed for the rolls (random if None)
+            block_size: Number of rolls to pre-draw at a time
+
+        Raises:
+            ValueError: If a weight is negative or they are all zero
+        """
+        super().__init__(seed, block_size)
+        scaled = np.asarray(weights, dtype=float)
+        if scaled.ndim != 1 or not scaled.size or (scaled < 0).any() or scaled.sum() <= 0:
+            raise ValueError("weights must be non-negative and not all zero")
+        self.weights = tuple(weights)
+
+        # Vose's alias tables: face i is kept with probability prob[i],
+        # otherwise replaced by alias[i]
+        count = scaled.size
+        scaled = scaled * count / scaled.sum()
+        self._prob = np.ones(count)
+        self._alias = np.arange(count)
+        small = [i for i in range(count) if scaled[i] < 1.0]
+        large = [i for i in range(count) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    @property
+    def max_roll(self) -> int:
+        """The highest value a roll can take."""
+        return len(self.weights)
+
+    def _draw_block(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw ``count`` weighted rolls."""
+        columns = rng.integers(0, len(self.weights), size=count)
+        keep = rng.random(count) < self._prob[columns]
+        return np.where(keep, columns, self._alias[columns]) + 1
+
+
+class MultiDice(DiceSource):
+    """The sum of several fair dice."""
+
+    def __init__(self, count: int = 2, faces: int = 6, seed: Optional[int] = None,
+                 block_size: int = 256):
+        """Initialize the dice.
+
+        Args:
+            count: Number of dice rolled together
+            faces: Number of faces on each die
+            seed: Seed for the rolls (random if None)
+            block_size: Number of rolls to pre-draw at a time
+        """
+        super().__init__(seed, block_size)
+        self.count = count
+        self.faces = faces
+
+    @property
+    def max_roll(self) -> int:
+        """The highest value a roll can take."""
+        return self.count * self.faces
+
+    def _draw_block(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw ``count`` sums of fair dice."""
+        return rng.integers(1, self.faces + 1, size=(count, self.count)).sum(axis=1)
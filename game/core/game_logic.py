@@ -1,67 +1,111 @@
 """Core game logic for the Snake and Ladder game."""
 
-import random
-from typing import List, Optional, Tuple, Dict, Any
+import struct
+import sys
+from array import array
+from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
 from ..models.player import Player
-from ..models.board import Board
+from ..models.board import Board, JUMP_BLOCKED
 from .game_state import GameState
+from .dice import DiceSource, StandardDice
+
+if TYPE_CHECKING:
+    from .journal import GameJournal
+
+# Binary snapshot layout: magic, version, board fingerprint, player count,
+# current index, dice value, last roll (0 - none), winner seat (-1 - none),
+# game-over flag, RNG seed, rolls drawn; followed by one little-endian int32
+# per position, copied straight from the player table
+SNAPSHOT_MAGIC = b'SLG'
+SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEADER = struct.Struct('<3sBQHHIIhBQI')
+_POSITION_SIZE = 4
+
+# Seeds must fit the snapshot's 64-bit field
+MAX_SEED = 2 ** 64
+
+# Positions are copied as raw bytes, so big-endian hosts swap them
+_SWAP_POSITIONS = sys.byteorder != 'little'
 
 class GameLogic:
     """Handles the core game rules and mechanics."""
     
-    def __init__(self, players: List[Player], board: Board):
+    def __init__(self, players: List[Player], board: Board, seed: Optional[int] = None,
+                 journal: Optional['GameJournal'] = None, dice: Optional[DiceSource] = None):
         """Initialize the game logic.
         
         Args:
             players: List of Player instances
             board: The game board
+            seed: Seed for this game's dice (random if None)
+            journal: Optional journal that records every turn
+            dice: Dice to roll (default: a standard six-sided die seeded with ``seed``)
+            
+        Raises:
+            ValueError: If the dice's seed is outside 0 to ``MAX_SEED - 1``
         """
         self.players = players
         self.board = board
         self.state = GameState(players, board)
+        
+        # Per-game dice; (seed, rolls) fully describes their state
+        if dice is not None:
+            seed = dice.seed
+        if seed is not None and not 0 <= seed < MAX_SEED:
+            raise ValueError(f"seed must be from 0 to 2**64 - 1, got {seed}")
+        self.dice = dice if dice is not None else StandardDice(seed=seed)
+        
+        self.journal = journal
+        if journal is not None:
+            journal.start_game(self)
+    
+    @property
+    def seed(self) -> int:
+        """Seed of this game's dice."""
+        return self.dice.seed
+    
+    @property
+    def rolls(self) -> int:
+        """Number of rolls drawn from this game's dice."""
+        return self.dice.draws
     
     def roll_dice(self) -> int:
-        """Roll a six-sided die.
+        """Roll the game's dice.
         
         Returns:
-            int: A random number between 1 and 6
+            int: The rolled value (1-6 for a standard die)
         """
-        return random.randint(1, 6)
+        return self.dice.roll()
     
     def move_player(self, player: Player, steps: int) -> Tuple[bool, bool]:
         """Move a player and handle snakes and ladders.
         
         Args:
             player: The player to move
-            steps: Number of steps to move (1-6)
+            steps: Number of steps to move (1 to the dice's highest roll)
             
         Returns:
             Tuple[bool, bool]: 
                 - First element: True if the move was valid, False otherwise
                 - Second element: True if the player won, False otherwise
         """
-        if not (1 <= steps <= 6):
+        if not (1 <= steps <= self.dice.max_roll):
             return False, False
             
-        # Move the player
-        new_position = player.position + steps
+        # Resolve the roll, including any snakes and ladders, in one lookup
+        new_position, jump = self.board.resolve_move(player.position, steps)
         
-        # Check for win condition (exact 100 required)
-        if new_position > 100:
+        # Check for win condition (exact roll required)
+        if jump == JUMP_BLOCKED:
             return False, False
             
-        player.set_position(new_position)
+        player.set_position(new_position, self.board.total_cells)
         
         # Check for win
-        if new_position == 100:
+        if new_position == self.board.total_cells:
             self.state.set_winner(player)
             return True, True
             
-        # Check for snakes and ladders
-        is_snake, target = self.board.check_snake_or_ladder(new_position)
-        if target is not None:
-            player.set_position(target)
-            
         return True, False
     
     def play_turn(self) -> Tuple[bool, Optional[Player]]:
@@ -75,35 +119,57 @@ class GameLogic:
         if self.state.game_over:
             return False, self.state.winner
             
+        seat = self.state.current_player_index
         player = self.state.current_player
+        start = player.position
         
-        # Roll the dice
+        # Roll the dice and move the player
         roll = self.roll_dice()
-        self.state.last_roll = roll
-        self.state.dice_value = roll
+        valid_move, has_won = self.apply_roll(roll)
         
-        # Move the player
-        valid_move, has_won = self.move_player(player, roll)
+        if self.journal is not None:
+            self.journal.record_turn(self, seat, roll, start, player.position)
         
         if not valid_move:
             return False, None
+        return True, player if has_won else None
+    
+    def apply_roll(self, roll: int) -> Tuple[bool, bool]:
+        """Play the current player's turn with a given roll.
+        
+        Follows the same rules as ``play_turn`` without drawing from the
+        dice or writing to the journal, so recorded turns can be replayed.
+        
+        Args:
+            roll: The number rolled
             
-        # Check for win
+        Returns:
+            Tuple[bool, bool]:
+                - First element: True if the move was valid, False otherwise
+                - Second element: True if the player won, False otherwise
+        """
+        player = self.state.current_player
+        self.state.last_roll = roll
+        self.state.dice_value = roll
+        
+        valid_move, has_won = self.move_player(player, roll)
+        if valid_move:
+            self._end_turn(player, roll, has_won)
+        return valid_move, has_won
+    
+    def _end_turn(self, player: Player, roll: int, has_won: bool) -> None:
+        """Finish a valid move: declare the winner or pass the turn on unless a six was rolled."""
         if has_won:
             self.state.set_winner(player)
-            return True, player
-            
-        # Move to next player if not a six
-        if roll != 6:
+        elif roll != 6:
             self.state.next_turn()
-            
-        return True, None
     
     def reset(self) -> None:
         """Reset the game to its initial state."""
-        for player in self.players:
-            player.set_position(0)
+        self.state.table.reset_positions(0)
         self.state = GameState(self.players, self.board)
+        if self.journal is not None:
+            self.journal.start_game(self)
     
     def get_state(self) -> Dict[str, Any]:
         """Get the current game state as a dictionary."""
@@ -112,3 +178,58 @@ class GameLogic:
     def set_state(self, state_data: Dict[str, Any]) -> None:
         """Set the game state from a dictionary."""
         self.state = GameState.from_dict(state_data, self.players, self.board)
+    
+    def snapshot(self) -> bytes:
+        """Pack the complete game state into a compact binary snapshot.
+        
+        Returns:
+            bytes: The snapshot (39 bytes plus 4 per player)
+        """
+        state = self.state
+        dice = self.dice
+        positions = state.table.positions
+        if _SWAP_POSITIONS:
+            positions = array('i', positions)
+            positions.byteswap()
+        return _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.board.fingerprint,
+            len(positions), state.current_player_index, state.dice_value,
+            state.last_roll or 0, state.winner_index, state.game_over, dice.seed, dice.draws
+        ) + positions.tobytes()
+    
+    def restore(self, data: bytes) -> None:
+        """Restore the game from a snapshot taken by ``snapshot``.
+        
+        Args:
+            data: The snapshot
+            
+        Raises:
+            ValueError: If the snapshot is malformed or was taken from a game
+                with a different board or number of players
+        """
+        header_size = _SNAPSHOT_HEADER.size
+        if len(data) != header_size + _POSITION_SIZE * len(self.players):
+            raise ValueError("Snapshot has a different number of players or is truncated")
+        (magic, version, fingerprint, _, current, dice_value, last_roll,
+         winner, game_over, seed, rolls) = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError("Not a game snapshot or unsupported version")
+        if fingerprint != self.board.fingerprint:
+            raise ValueError("Snapshot was taken on a different board")
+        
+        positions = array('i')
+        positions.frombytes(data[header_size:])
+        if _SWAP_POSITIONS:
+            positions.byteswap()
+        
+        state = self.state
+        state.table.positions[:] = positions
+        state.current_player_index = current
+        state.dice_value = dice_value
+        state.last_roll = last_roll or None
+        state.game_over = bool(game_over)
+        state.winner = self.players[winner] if winner >= 0 else None
+        state.winner_index = winner
+        state.message = f"{state.winner.name} wins!" if state.winner else ""
+        
+        self.dice.seek(rolls, seed)
@@ -1,7 +1,7 @@
 """Game state management for the Snake and Ladder game."""
 
 from typing import List, Optional, Dict, Any
-from ..models.player import Player
+from ..models.player import Player, PlayerTable
 from ..models.board import Board
 
 class GameState:
@@ -15,11 +15,13 @@ class GameState:
             board: The game board
         """
         self.players = players
+        self.table = PlayerTable.gather(players)
         self.board = board
         self.current_player_index = 0
         self.dice_value = 1
         self.game_over = False
         self.winner: Optional[Player] = None
+        self.winner_index = -1  # Seat of the winner (-1 - none)
         self.last_roll: Optional[int] = None
         self.message: str = ""
     
@@ -40,6 +42,7 @@ class GameState:
             player: The winning player
         """
         self.winner = player
+        self.winner_index = self.players.index(player)
         self.game_over = True
         self.message = f"{player.name} wins!"
     
@@ -51,7 +54,8 @@ class GameState:
             'game_over': self.game_over,
             'winner': self.winner.name if self.winner else None,
             'last_roll': self.last_roll,
-            'message': self.message
+            'message': self.message,
+            'positions': list(self.table.positions)
         }
     
     @classmethod
@@ -73,8 +77,13 @@ class GameState:
         state.last_roll = data.get('last_roll')
         state.message = data.get('message', '')
         
+        for player, position in zip(players, data.get('positions', [])):
+            player.set_position(position, board.total_cells)
+        
         winner_name = data.get('winner')
         if winner_name:
             state.winner = next((p for p in players if p.name == winner_name), None)
+            if state.winner is not None:
+                state.winner_index = players.index(state.winner)
             
         return state
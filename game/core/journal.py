@@ -0,0 +1,291 @@
+"""Append-only game journal with snapshot-indexed replay for the Snake and Ladder game."""
+
+import os
+import struct
+from typing import BinaryIO, Iterator, NamedTuple, Optional, TYPE_CHECKING
+if TYPE_CHECKING:
+    from .game_logic import GameLogic
+
+# File header: magic and format version
+JOURNAL_MAGIC = b'SLJ'
+JOURNAL_VERSION = 1
+_HEADER = struct.Struct('<3sB')
+
+# Frames: a tag byte followed by a fixed-width turn record, or by a snapshot
+# header and the snapshot bytes from GameLogic.snapshot()
+_TURN_TAG = b'T'
+_SNAPSHOT_TAG = b'S'
+_TURN = struct.Struct('<IIHBIIB')  # game, turn, seat, roll, from, to, jump kind
+_SNAPSHOT = struct.Struct('<IIH')  # game, turn, snapshot length
+
+# Sidecar index entries: game, turn and file offset of each snapshot frame
+_INDEX_ENTRY = struct.Struct('<IIQ')
+
+class TurnRecord(NamedTuple):
+    """One recorded turn.
+
+    Attributes:
+        game: Number of the game within the journal
+        turn: Number of the turn within the game (the first is 1)
+        seat: Index of the player who rolled
+        roll: The number rolled
+        start: Position before the roll
+        end: Position after the roll, snakes and ladders included
+        jump: Jump kind from the board's move table
+    """
+    game: int
+    turn: int
+    seat: int
+    roll: int
+    start: int
+    end: int
+    jump: int
+
+
+class GameJournal:
+    """Appends every turn of one or more games to a journal file.
+
+    A full snapshot is written at the start of each game and every
+    ``snapshot_interval`` turns, and its offset is recorded in a sidecar
+    ``.idx`` file so any turn can be reached without replaying from turn 0.
+    """
+
+    def __init__(self, path: str, snapshot_interval: int = 64):
+        """Open a journal for appending, creating it if needed.
+
+        Args:
+            path: Path of the journal file
+            snapshot_interval: Turns between full-state snapshots
+        """
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self._file = open(path, 'ab')
+        self._index = open(index_path(path), 'ab')
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION))
+
+        # Continue numbering after the games already in the file
+        self.games = 0
+        if self._index.tell() >= _INDEX_ENTRY.size:
+            with open(index_path(path), 'rb') as index:
+                index.seek(-_INDEX_ENTRY.size, os.SEEK_END)
+                self.games = _INDEX_ENTRY.unpack(index.read(_INDEX_ENTRY.size))[0] + 1
+
+        self._game = -1
+        self._turn = 0
+
+    def start_game(self, logic: 'GameLogic') -> None:
+        """Begin recording a new game from the logic's current state.
+
+        Args:
+            logic: The game being recorded
+        """
+        self._game = self.games
+        self._turn = 0
+        self.games += 1
+        self._write_snapshot(logic)
+
+    def record_turn(self, logic: 'GameLogic', seat: int, roll: int, start: int, end: int) -> None:
+        """Append a turn that ``logic`` has just played.
+
+        Args:
+            logic: The game being recorded, already updated for the turn
+            seat: Index of the player who rolled
+            roll: The number rolled
+            start: Position before the roll
+            end: Position after the roll
+        """
+        self._turn += 1
+        _, jump = logic.board.resolve_move(start, roll)
+        self._file.write(_TURN_TAG)
+        self._file.write(_TURN.pack(self._game, self._turn, seat, roll, start, end, jump))
+        if self._turn % self.snapshot_interval == 0:
+            self._write_snapshot(logic)
+
+    def _write_snapshot(self, logic: 'GameLogic') -> None:
+        """Append a snapshot frame and index it."""
+        snapshot = logic.snapshot()
+        offset = self._file.tell()
+        self._file.write(_SNAPSHOT_TAG)
+        self._file.write(_SNAPSHOT.pack(self._game, self._turn, len(snapshot)))
+        self._file.write(snapshot)
+        # The frame reaches the file before its index entry, so after a crash
+        # the index never points past the end of the journal
+        self._file.flush()
+        self._index.write(_INDEX_ENTRY.pack(self._game, self._turn, offset))
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        self._file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        self._file.close()
+        self._index.close()
+
+    def __enter__(self) -> 'GameJournal':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class JournalReader:
+    """Streams and seeks within a journal written by ``GameJournal``."""
+
+    def __init__(self, path: str):
+        """Open a journal for reading.
+
+        Args:
+            path: Path of the journal file
+
+        Raises:
+            ValueError: If the file is not a journal
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            magic, version = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION:
+            raise ValueError(f"{path} is not a game journal or has an unsupported version")
+
+    def records(self, game: Optional[int] = None) -> Iterator[TurnRecord]:
+        """Stream the recorded turns without loading the file into memory.
+
+        Args:
+            game: Only yield turns of this game
+
+        Returns:
+            Iterator[TurnRecord]: The turns in the order they were played
+        """
+        with open(self.path, 'rb') as f:
+            f.seek(_HEADER.size)
+            for record in _read_frames(f):
+                if isinstance(record, TurnRecord) and (game is None or record.game == game):
+                    yield record
+
+    def seek(self, logic: 'GameLogic', game: int, turn: Optional[int] = None) -> int:
+        """Put ``logic`` into the state after ``turn`` turns of ``game``.
+
+        Restores the nearest snapshot at or before the turn and replays the
+        recorded turns after it.
+
+        Args:
+            logic: A game with the same board and players as the recording
+            game: Number of the game within the journal
+            turn: Turns to play (default: the whole recorded game)
+
+        Returns:
+            int: The turn reached, which is lower than ``turn`` if the
+            recording ends first
+
+        Raises:
+            ValueError: If the game is not in the journal, or a recorded
+                turn doesn't play out the same way on ``logic``
+        """
+        offset = self._find_snapshot(game, turn)
+        if offset is None:
+            raise ValueError(f"Game {game} is not in {self.path}")
+
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            reached = 0
+            replayed = 0
+            for record in _read_frames(f):
+                if isinstance(record, TurnRecord):
+                    if record.game != game or (turn is not None and record.turn > turn):
+                        break
+                    _apply_turn(logic, record)
+                    reached = record.turn
+                    replayed += 1
+                else:
+                    game_number, snapshot_turn, snapshot = record
+                    if game_number != game:
+                        break
+                    if replayed == 0:
+                        logic.restore(snapshot)
+                        reached = snapshot_turn
+
+        # Advance the dice past the rolls that were replayed
+        logic.dice.seek(logic.dice.draws + replayed)
+        return reached
+
+    def _find_snapshot(self, game: int, turn: Optional[int]) -> Optional[int]:
+        """Binary-search the index for the last snapshot at or before (game, turn)."""
+        target = (game, turn if turn is not None else 0xFFFFFFFF)
+        with open(self.path, 'rb') as journal, open(index_path(self.path), 'rb') as index:
+            low, high = 0, os.fstat(index.fileno()).st_size // _INDEX_ENTRY.size
+            # Entries for snapshots past the end of a journal cut short by a
+            # crash are ignored
+            journal_size = os.fstat(journal.fileno()).st_size
+            while high:
+                index.seek((high - 1) * _INDEX_ENTRY.size)
+                offset = _INDEX_ENTRY.unpack(index.read(_INDEX_ENTRY.size))[2]
+                if _snapshot_fits(journal, offset, journal_size):
+                    break
+                high -= 1
+            found = None
+            while low < high:
+                middle = (low + high) // 2
+                index.seek(middle * _INDEX_ENTRY.size)
+                entry_game, entry_turn, offset = _INDEX_ENTRY.unpack(index.read(_INDEX_ENTRY.size))
+                if (entry_game, entry_turn) <= target:
+                    if entry_game == game:
+                        found = offset
+                    low = middle + 1
+                else:
+                    high = middle
+        return found
+
+
+def index_path(path: str) -> str:
+    """Get the path of a journal's snapshot index."""
+    return path + '.idx'
+
+
+def _snapshot_fits(f: BinaryIO, offset: int, size: int) -> bool:
+    """Check that the snapshot frame at ``offset`` ends within the first ``size`` bytes."""
+    f.seek(offset + len(_SNAPSHOT_TAG))
+    header = f.read(_SNAPSHOT.size)
+    if len(header) < _SNAPSHOT.size:
+        return False
+    return f.tell() + _SNAPSHOT.unpack(header)[2] <= size
+
+
+def _read_frames(f: BinaryIO) -> Iterator:
+    """Yield TurnRecords and (game, turn, snapshot) tuples from an open journal.
+
+    A frame cut short at the end of the file, as a crash mid-write leaves
+    it, ends the stream.
+    """
+    while True:
+        tag = f.read(1)
+        if tag == _TURN_TAG:
+            data = f.read(_TURN.size)
+            if len(data) < _TURN.size:
+                return
+            yield TurnRecord._make(_TURN.unpack(data))
+        elif tag == _SNAPSHOT_TAG:
+            data = f.read(_SNAPSHOT.size)
+            if len(data) < _SNAPSHOT.size:
+                return
+            game, turn, length = _SNAPSHOT.unpack(data)
+            snapshot = f.read(length)
+            if len(snapshot) < length:
+                return
+            yield game, turn, snapshot
+        elif not tag:
+            return
+        else:
+            raise ValueError(f"Corrupt journal frame at offset {f.tell() - 1}")
+
+
+def _apply_turn(logic: 'GameLogic', record: TurnRecord) -> None:
+    """Apply a recorded turn to ``logic`` exactly as ``play_turn`` did."""
+    if logic.state.current_player_index != record.seat:
+        raise ValueError(f"Turn {record.turn} of game {record.game} was played by seat "
+                         f"{record.seat}, not {logic.state.current_player_index}")
+    logic.apply_roll(record.roll)
+    if logic.players[record.seat].position != record.end:
+        raise ValueError(f"Turn {record.turn} of game {record.game} ended on {record.end}, "
+                         f"not {logic.players[record.seat].position}")
@@ -0,0 +1,132 @@
+"""Vectorized headless batch simulation for the Snake and Ladder game."""
+
+from typing import List, NamedTuple, Optional, Union
+import numpy as np
+from ..models.board import Board, JUMP_BLOCKED, JUMP_LADDER, JUMP_SNAKE
+
+class SimulationResult(NamedTuple):
+    """Per-game outcome arrays for a batch of simulated games.
+
+    Attributes:
+        winner: Winning seat of each game, or -1 if it hit the turn limit
+        turns: Turns played in each game (a six or an overshoot continues
+            the same turn)
+        rolls: Dice rolls made in each game
+        snakes: Snake bites suffered in each game
+        ladders: Ladders climbed in each game
+        landings: Landings per cell over the whole batch, counted before any
+            jump, or None if landings were not tracked
+    """
+    winner: np.ndarray
+    turns: np.ndarray
+    rolls: np.ndarray
+    snakes: np.ndarray
+    ladders: np.ndarray
+    landings: Optional[np.ndarray] = None
+
+
+class BatchSimulator:
+    """Plays many complete games at once using NumPy arrays.
+
+    Follows the same rules as ``GameLogic.play_turn`` by reading the board's
+    jump table: an exact roll is needed to reach the last cell, snakes and
+    ladders are followed after landing, and rolling a six gives the player
+    another roll. A roll that would overshoot the last cell leaves the token
+    where it is and the same player rolls again.
+    """
+
+    def __init__(self, board: Board, num_players: int = 2):
+        """Initialize the simulator.
+
+        Args:
+            board: The game board
+            num_players: Number of seats in every game
+        """
+        if num_players < 1:
+            raise ValueError("num_players must be at least 1")
+        self.board = board
+        self.num_players = num_players
+        self.goal = board.total_cells
+
+        # The board's sparse jumps expanded to one entry per cell, so a whole
+        # batch of landings resolves with a single gather
+        self.destinations = np.arange(self.goal + 1, dtype=np.int32)
+        self.landing_kinds = np.zeros(self.goal + 1, dtype=np.int8)
+        for cell, (destination, kind) in board.jumps.items():
+            self.destinations[cell] = destination
+            self.landing_kinds[cell] = kind
+
+    def run(self, num_games: int,
+            seed: Union[None, int, np.random.SeedSequence, np.random.Generator] = None,
+            max_turns: int = 10000, track_landings: bool = False) -> SimulationResult:
+        """Simulate a batch of independent games to completion.
+
+        Args:
+            num_games: Number of games to play
+            seed: Seed or generator for the dice (random if None)
+            max_turns: Games still running after this many turns are
+                abandoned and reported with winner -1
+            track_landings: Also count how often each cell is landed on
+
+        Returns:
+            SimulationResult: Per-game winner, turn, roll and jump counts
+        """
+        rng = np.random.default_rng(seed)
+
+        winner = np.full(num_games, -1, dtype=np.int32)
+        turns = np.zeros(num_games, dtype=np.int32)
+        rolls = np.zeros(num_games, dtype=np.int32)
+        snakes = np.zeros(num_games, dtype=np.int32)
+        ladders = np.zeros(num_games, dtype=np.int32)
+        landings = np.zeros(self.goal + 1, dtype=np.int64) if track_landings else None
+        # Landings not yet counted; they are binned once there are about as
+        # many as cells, so large boards don't pay for a full bincount per roll
+        pending: List[np.ndarray] = []
+        pending_size = 0
+
+        # State of the games still in play; finished games are compacted away
+        active = np.arange(num_games)
+        positions = np.zeros((self.num_players, num_games), dtype=np.int32)
+        seat = np.zeros(num_games, dtype=np.int32)
+
+        while active.size:
+            columns = np.arange(active.size)
+            roll = rng.integers(1, 7, size=active.size, dtype=np.int32)
+
+            current = positions[seat, columns]
+            landing = current + roll
+            blocked = landing > self.goal
+            landing[blocked] = current[blocked]
+            target = self.destinations[landing]
+            kind = self.landing_kinds[landing]
+            kind[blocked] = JUMP_BLOCKED
+            positions[seat, columns] = target
+
+            rolls[active] += 1
+            snakes[active] += kind == JUMP_SNAKE
+            ladders[active] += kind == JUMP_LADDER
+            if landings is not None:
+                pending.append(landing[~blocked])
+                pending_size += pending[-1].size
+                if pending_size > self.goal:
+                    landings += np.bincount(np.concatenate(pending), minlength=self.goal + 1)
+                    pending.clear()
+                    pending_size = 0
+
+            won = target == self.goal
+            # GameLogic doesn't pass the turn after an overshoot
+            turn_over = won | ((roll != 6) & ~blocked)
+            turns[active] += turn_over
+            winner[active[won]] = seat[won]
+            seat = np.where(turn_over, (seat + 1) % self.num_players, seat)
+
+            finished = won | (turns[active] >= max_turns)
+            if finished.any():
+                keep = ~finished
+                active = active[keep]
+                positions = positions[:, keep]
+                seat = seat[keep]
+
+        if landings is not None and pending:
+            landings += np.bincount(np.concatenate(pending), minlength=self.goal + 1)
+        return SimulationResult(winner, turns, rolls, snakes, ladders, landings)
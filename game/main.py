@@ -1,22 +1,90 @@
 """Main game module for the Snake and Ladder game."""
 
+import os
 import sys
+import time
+import argparse
 import pygame
-from typing import List, Optional, Dict, Any, Callable, Tuple
+from typing import List, Optional, Dict, Any, Callable, Tuple, NamedTuple
 
 from .models.player import Player
 from .models.board import Board
 from .core.game_logic import GameLogic
+from .analysis.markov import MAX_DENSE_CELLS
+from .analysis.win_odds import WinOdds
+from .core.dice import DiceSource
 from .ui.board_ui import BoardUI
 from .ui.sidebar_ui import SidebarUI
-from .ui.animations import AnimationManager, MoveAnimation, DiceRollAnimation
+from .ui.animations import AnimationManager, DiceRollAnimation
+from .ui.profiler import FrameProfiler, ProfilerOverlay
 from . import constants as const
 
+# Turbo-mode frames an animation may stay active before the game counts as stuck
+STALL_FRAMES = 10
+
+# Turbo-mode rolls a single game may take before it counts as stuck
+STALL_ROLLS = 10000
+
+# Seconds between turbo-mode progress lines
+TURBO_REPORT_INTERVAL = 10.0
+
+# Change in cell size per zoom step (mouse wheel notch or +/- key)
+CAMERA_ZOOM_STEP = 1.25
+
+# Arrow keys and the (columns, rows) they pan the board by
+CAMERA_PAN_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
+
+class TurboReport(NamedTuple):
+    """Outcome of a turbo-mode run.
+
+    Attributes:
+        games: Number of games played to the end
+        rolls: Number of dice rolls across all games
+        frames: Number of frames run
+        seconds: Wall-clock duration of the run
+        stalls: Descriptions of every stuck state detected
+    """
+    games: int
+    rolls: int
+    frames: int
+    seconds: float
+    stalls: List[str]
+
+    @property
+    def games_per_second(self) -> float:
+        """Games completed per second of the run."""
+        return self.games / self.seconds if self.seconds > 0 else 0.0
+
+
 class SnakeAndLadderGame:
     """Main game class for the Snake and Ladder game."""
     
-    def __init__(self):
-        """Initialize the game."""
+    def __init__(self, dirty_rects: bool = False, seed: Optional[int] = None,
+                 dice: Optional[DiceSource] = None, profile: bool = False,
+                 trace_path: Optional[str] = None, turbo: bool = False):
+        """Initialize the game.
+        
+        Args:
+            dirty_rects: Only repaint the parts of the screen that changed,
+                using ``pygame.display.update(rects)`` instead of a full flip
+            seed: Seed for the dice, to make a game reproducible
+            dice: Dice to roll (default: a standard six-sided die)
+            profile: Time every frame from the start and show the
+                performance overlay (F3 toggles it at any time)
+            trace_path: Write the frame timings to this file in Chrome
+                trace-event format on exit
+            turbo: Run headless with instant animations for ``run_turbo``
+        """
+        # Turbo mode renders off-screen through SDL's dummy video driver
+        self.turbo = turbo
+        if turbo:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        
         # Initialize Pygame
         pygame.init()
         
@@ -34,43 +102,200 @@ class SnakeAndLadderGame:
         ]
         
         self.board = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
-        self.game_logic = GameLogic(self.players, self.board)
+        self.game_logic = GameLogic(self.players, self.board, seed=seed, dice=dice)
+        
+        # Exact win chances for the sidebar, when the board is small enough
+        self.win_odds = WinOdds(self.board) if self.board.total_cells <= MAX_DENSE_CELLS else None
         
         # Initialize UI components
         self.board_ui = BoardUI(self.board, self.players)
-        self.sidebar_ui = SidebarUI(const.SIDEBAR_WIDTH, const.WINDOW_SIZE[1])
+        self.sidebar_ui = SidebarUI(const.SIDEBAR_WIDTH, const.WINDOW_SIZE[1], self.board.total_cells)
         
         # Initialize animation manager
         self.animation_manager = AnimationManager()
+        self.dice_roll_duration = 0.0 if turbo else const.DICE_ROLL_DURATION / 1000
+        self.move_duration = 0.0 if turbo else const.ANIMATION_DURATION / 1000
         
         # Game state
         self.running = True
         self.show_game_over = False
+        
+        # Dirty-rectangle rendering state
+        self.dirty_rects = dirty_rects
+        self._needs_full_redraw = True
+        self._token_rects: List[Optional[pygame.Rect]] = []
+        self._last_dice_value: Optional[int] = None
+        self._last_player_index: Optional[int] = None
+        self._last_game_over = False
+        self._last_camera_version = self.board_ui.camera.version
+        self._last_win_chances: Optional[Tuple[float, ...]] = None
+        
+        # Frame profiling, only set up while it is in use
+        self.trace_path = trace_path
+        self.profiler: Optional[FrameProfiler] = None
+        self.overlay: Optional[ProfilerOverlay] = None
+        if profile or trace_path:
+            self._start_profiling(show_overlay=profile)
     
     def run(self) -> None:
         """Run the main game loop."""
         while self.running:
-            self._handle_events()
-            self._update()
-            self._render()
-            self.clock.tick(const.FPS)
+            if self.profiler is None:
+                self._handle_events()
+                self._update()
+                self._render()
+                self.clock.tick(const.FPS)
+            else:
+                self._run_profiled_frame()
         
         # Clean up
+        if self.profiler is not None and self.trace_path:
+            self.profiler.dump_trace(self.trace_path)
         pygame.quit()
         sys.exit()
     
+    def run_turbo(self, games: Optional[int] = None, seconds: Optional[float] = None,
+                  report_interval: float = TURBO_REPORT_INTERVAL) -> TurboReport:
+        """Play complete games back to back through the GUI code path.
+        
+        Every frame runs the normal event, update and render steps, but
+        without the frame-rate cap, and the dice are rolled as soon as the
+        previous turn has finished animating, exactly as the space key
+        would. Finished games are reset and play continues. Animations that
+        never finish and games that never end are reported as stalls; a
+        stuck game is reset so the soak can carry on.
+        
+        Args:
+            games: Stop after this many games (default: no limit)
+            seconds: Stop after this many seconds (default: no limit)
+            report_interval: Seconds between progress lines (0 for none)
+        
+        Returns:
+            TurboReport: Games, rolls, frames, duration and stalls of the run
+        """
+        manager = self.animation_manager
+        state = self.game_logic.state
+        stalls: List[str] = []
+        completed = rolls = frames = game_rolls = animating_frames = 0
+        start = last_report = time.perf_counter()
+        
+        try:
+            while self.running:
+                if games is not None and completed >= games:
+                    break
+                
+                self._handle_events()
+                state = self.game_logic.state
+                if manager.is_animating():
+                    animating_frames += 1
+                elif state.game_over:
+                    completed += 1
+                    game_rolls = 0
+                    self._reset_game()
+                    state = self.game_logic.state
+                else:
+                    animating_frames = 0
+                    self._roll_dice()
+                    rolls += 1
+                    game_rolls += 1
+                self._update()
+                self._render()
+                frames += 1
+                
+                stall = self._detect_stall(animating_frames, game_rolls)
+                if stall is not None:
+                    stalls.append(f"game {completed + 1}, roll {game_rolls}: {stall}")
+                    print(f"STALL {stalls[-1]}", flush=True)
+                    animating_frames = game_rolls = 0
+                    self._reset_game()
+                
+                now = time.perf_counter()
+                if seconds is not None and now - start >= seconds:
+                    break
+                if report_interval and now - last_report >= report_interval:
+                    last_report = now
+                    elapsed = now - start
+                    print(f"{elapsed:8.0f}s  {completed} games  {completed / elapsed:.1f} games/s  "
+                          f"{frames / elapsed:.0f} frames/s  {len(stalls)} stalls", flush=True)
+        except KeyboardInterrupt:
+            pass
+        
+        return TurboReport(completed, rolls, frames, time.perf_counter() - start, stalls)
+    
+    def _detect_stall(self, animating_frames: int, game_rolls: int) -> Optional[str]:
+        """Describe the stuck state the turbo loop is in, if any."""
+        manager = self.animation_manager
+        if animating_frames > STALL_FRAMES:
+            active = ', '.join(type(animation).__name__ for animation in manager.animations)
+            return f"animations still running after {animating_frames} frames ({active})"
+        if not manager.is_animating():
+            flagged = [player.name for player in self.players if player.is_animating]
+            if flagged:
+                return f"is_animating never cleared for {', '.join(flagged)}"
+        if game_rolls > STALL_ROLLS:
+            return f"no winner after {game_rolls} rolls"
+        return None
+    
+    def _run_profiled_frame(self) -> None:
+        """Run one iteration of the game loop, timing each phase."""
+        profiler = self.profiler
+        profiler.begin_frame()
+        self._handle_events()
+        profiler.mark('events')
+        self._update()
+        profiler.mark('update')
+        self._render()
+        self.clock.tick(const.FPS)
+        profiler.mark('tick')
+        profiler.end_frame()
+    
+    def _start_profiling(self, show_overlay: bool = True) -> None:
+        """Start timing frames."""
+        self.profiler = FrameProfiler()
+        self.board_ui.profiler = self.profiler
+        if show_overlay:
+            self.overlay = ProfilerOverlay(self.profiler)
+    
+    def _toggle_overlay(self) -> None:
+        """Show or hide the performance overlay, profiling only while it is needed."""
+        if self.overlay is None:
+            if self.profiler is None:
+                self._start_profiling()
+            else:
+                self.overlay = ProfilerOverlay(self.profiler)
+        else:
+            self.overlay = None
+            if not self.trace_path:
+                self.profiler = None
+                self.board_ui.profiler = None
+        self._needs_full_redraw = True
+    
     def _handle_events(self) -> None:
         """Handle Pygame events."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type == pygame.WINDOWEXPOSED:
+                self._needs_full_redraw = True
+            
             elif event.type == pygame.KEYDOWN:
                 self._handle_keydown(event.key)
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse button
                     self._handle_click(event.pos)
+            
+            elif event.type == pygame.MOUSEWHEEL:
+                # Zoom the board about the mouse pointer
+                pos = pygame.mouse.get_pos()
+                if self.board_ui.camera.viewport.collidepoint(pos) and event.y:
+                    self.board_ui.camera.zoom(CAMERA_ZOOM_STEP ** event.y, pos)
+            
+            elif event.type == pygame.MOUSEMOTION:
+                # Drag the board with the right mouse button
+                if event.buttons[2]:
+                    self.board_ui.camera.pan(-event.rel[0], -event.rel[1])
     
     def _handle_keydown(self, key: int) -> None:
         """Handle key press events."""
@@ -80,6 +305,27 @@ class SnakeAndLadderGame:
         elif key == pygame.K_r:
             self._reset_game()
         
+        elif key == pygame.K_F3:
+            self._toggle_overlay()
+        
+        elif key == pygame.K_h:
+            self.board_ui.toggle_heatmap()
+            self._needs_full_redraw = True
+        
+        elif key in CAMERA_PAN_KEYS:
+            dx, dy = CAMERA_PAN_KEYS[key]
+            cell_size = self.board_ui.camera.cell_size
+            self.board_ui.camera.pan(dx * cell_size, dy * cell_size)
+        
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.board_ui.camera.zoom(CAMERA_ZOOM_STEP)
+        
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.board_ui.camera.zoom(1 / CAMERA_ZOOM_STEP)
+        
+        elif key == pygame.K_HOME:
+            self.board_ui.camera.reset()
+        
         elif key == pygame.K_SPACE and not self.animation_manager.is_animating():
             self._roll_dice()
     
@@ -101,47 +347,64 @@ class SnakeAndLadderGame:
         if self.game_logic.state.game_over:
             return
         
+        if self.profiler is not None:
+            self.profiler.input_received()
+        
         # Start dice roll animation
         def on_dice_update(value: int) -> None:
             self.game_logic.state.dice_value = value
         
         def on_dice_complete() -> None:
             # After dice roll completes, process the turn
+            player = self.game_logic.state.current_player
+            start_position = player.position
             success, winner = self.game_logic.play_turn()
             
             if success and winner is None:
-                # Animate player movement if needed
-                current_player = self.game_logic.state.current_player
-                if current_player.position > 0:
-                    self._animate_player_move(current_player)
+                # Animate the player who moved (the turn may have passed on)
+                self._animate_player_move(player, start_position)
         
-        dice_animation = DiceRollAnimation(
-            duration=1.0,  # 1 second
+        self.animation_manager.dice_roll(
+            duration=self.dice_roll_duration,
             on_update=on_dice_update,
             on_complete=on_dice_complete
         )
-        self.animation_manager.add_animation(dice_animation)
-    
-    def _animate_player_move(self, player: Player) -> None:
-        """Animate a player's movement to their new position."""
-        def on_move_complete():
-            # Check for snakes or ladders after movement
-            is_snake, target = self.board.check_snake_or_ladder(player.position)
-            if target is not None:
-                # Animate snake or ladder movement
-                player.set_position(target)
-                self._animate_player_move(player)
-        
-        move_animation = MoveAnimation(
-            player=player,
-            target_position=player.position,
-            duration=0.5,  # 0.5 seconds per move
-            board_size=self.board.size,
-            cell_size=const.CELL_SIZE,
-            window_height=const.WINDOW_SIZE[1],
-            on_complete=on_move_complete
-        )
-        self.animation_manager.add_animation(move_animation)
+    
+    def _animate_player_move(self, player: Player, start_position: Optional[int] = None) -> None:
+        """Animate a player's movement to their new position.
+        
+        The position already includes any snakes and ladders, resolved by the
+        board's move table during ``play_turn``. When the roll landed on one,
+        the token first steps onto the cell rolled to and then follows the
+        snake or ladder to where it leads.
+        
+        Args:
+            player: The player to animate
+            start_position: The cell the player moved from
+        """
+        def animate(target: int, start: Optional[int],
+                    on_complete: Optional[Callable] = None) -> None:
+            self.animation_manager.move(
+                player=player,
+                target_position=target,
+                duration=self.move_duration,
+                board=self.board,
+                cell_size=self.board_ui.cell_size,
+                window_height=self.board_ui.world_height,
+                on_complete=on_complete,
+                start_position=start
+            )
+        
+        landing = None
+        if start_position is not None:
+            landing = start_position + self.game_logic.state.dice_value
+        if landing is None or landing == player.position:
+            animate(player.position, start_position)
+            return
+        
+        def follow_jump() -> None:
+            animate(player.position, landing)
+        animate(landing, start_position, follow_jump)
     
     def _update(self) -> None:
         """Update game state."""
@@ -150,8 +413,19 @@ class SnakeAndLadderGame:
     
     def _render(self) -> None:
         """Render the game."""
+        profiler = self.profiler
+        if self.dirty_rects:
+            rects = self._collect_dirty_rects()
+            if not rects and self.overlay is None:
+                return
+        
         # Draw the game board
-        self.board_ui.draw(self.screen)
+        self.board_ui.draw_static(self.screen)
+        if profiler is not None:
+            profiler.mark('render.board')
+        self.board_ui.draw_players(self.screen)
+        if profiler is not None:
+            profiler.mark('render.players')
         
         # Draw the sidebar
         self.sidebar_ui.draw(
@@ -159,22 +433,120 @@ class SnakeAndLadderGame:
             current_player=self.game_logic.state.current_player,
             dice_value=self.game_logic.state.dice_value,
             game_over=self.game_logic.state.game_over,
-            winner=self.game_logic.state.winner
+            winner=self.game_logic.state.winner,
+            players=self.players,
+            win_chances=self._win_chances()
         )
+        if profiler is not None:
+            profiler.mark('render.sidebar')
+        
+        if self.overlay is not None:
+            old_rect = self.overlay.rect
+            self.overlay.draw(self.screen)
+            if self.dirty_rects:
+                rects.append(old_rect.union(self.overlay.rect))
         
         # Update the display
-        pygame.display.flip()
+        if self.dirty_rects:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        if profiler is not None:
+            profiler.mark('render.present')
+            profiler.frame_presented()
+    
+    def _collect_dirty_rects(self) -> List[pygame.Rect]:
+        """Get the screen areas that changed since the last rendered frame."""
+        state = self.game_logic.state
+        if state.game_over != self._last_game_over:
+            self._last_game_over = state.game_over
+            self._needs_full_redraw = True
+        
+        # The whole board moves with the camera
+        if self.board_ui.camera.version != self._last_camera_version:
+            self._last_camera_version = self.board_ui.camera.version
+            self._needs_full_redraw = True
+        
+        rects = []
+        
+        # Old and new areas of every token that moved
+        token_rects = [self.board_ui.token_rect(i) for i in range(len(self.players))]
+        if len(token_rects) != len(self._token_rects):
+            self._needs_full_redraw = True
+        else:
+            for old, new in zip(self._token_rects, token_rects):
+                if old != new:
+                    rects.extend(rect for rect in (old, new) if rect is not None)
+        self._token_rects = token_rects
+        
+        # Dice box while it is rolling or showing a new value
+        if (self.animation_manager.is_animating(DiceRollAnimation)
+                or state.dice_value != self._last_dice_value):
+            self._last_dice_value = state.dice_value
+            rects.append(self.sidebar_ui.dice_rect)
+        
+        # Win chances after every move or change of turn
+        win_chances = self._win_chances()
+        if win_chances != self._last_win_chances:
+            self._last_win_chances = win_chances
+            rects.append(self.sidebar_ui.odds_rect)
+        
+        # Current-turn label when the turn passes
+        if state.current_player_index != self._last_player_index:
+            self._last_player_index = state.current_player_index
+            rects.append(self.sidebar_ui.turn_rect)
+        
+        if self._needs_full_redraw:
+            self._needs_full_redraw = False
+            return [self.screen.get_rect()]
+        return rects
+    
+    def _win_chances(self) -> Optional[Tuple[float, ...]]:
+        """Get each player's chance of winning from the current positions."""
+        if self.win_odds is None:
+            return None
+        positions = [player.position for player in self.players]
+        return self.win_odds.win_probabilities(positions, self.game_logic.state.current_player_index)
     
     def _reset_game(self) -> None:
         """Reset the game to its initial state."""
         self.game_logic.reset()
         self.animation_manager.clear()
         self.show_game_over = False
+        self._needs_full_redraw = True
 
 
 def main():
     """Entry point for the game."""
-    game = SnakeAndLadderGame()
+    parser = argparse.ArgumentParser(description="Snake and Ladder")
+    parser.add_argument('--dirty-rects', action='store_true',
+                        help="only repaint the parts of the screen that changed")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="seed for the dice, to make a game reproducible")
+    parser.add_argument('--profile', action='store_true',
+                        help="time every frame and show the performance overlay (F3)")
+    parser.add_argument('--trace', metavar='FILE', default=None,
+                        help="write frame timings to FILE in Chrome trace-event format")
+    parser.add_argument('--turbo', action='store_true',
+                        help="play games headless and as fast as possible, reporting "
+                             "games/second and any stuck state")
+    parser.add_argument('--games', type=int, default=None,
+                        help="with --turbo, stop after this many games")
+    parser.add_argument('--seconds', type=float, default=None,
+                        help="with --turbo, stop after this many seconds")
+    args = parser.parse_args()
+    
+    game = SnakeAndLadderGame(dirty_rects=args.dirty_rects, seed=args.seed,
+                              profile=args.profile, trace_path=args.trace,
+                              turbo=args.turbo)
+    if args.turbo:
+        report = game.run_turbo(games=args.games, seconds=args.seconds)
+        pygame.quit()
+        print(f"{report.games} games, {report.rolls} rolls, {report.frames} frames in "
+              f"{report.seconds:.1f}s: {report.games_per_second:.1f} games/s, "
+              f"{len(report.stalls)} stalls")
+        sys.exit(1 if report.stalls else 0)
+    
     game.run()
 
 
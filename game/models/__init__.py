@@ -1,5 +1,5 @@
 """Game models package."""
 
-from .player import Player
+from .player import Player, PlayerTable
 
-__all__ = ['Player']
+__all__ = ['Player', 'PlayerTable']
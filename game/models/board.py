@@ -1,6 +1,113 @@
 """Board model for the Snake and Ladder game."""
 
+import hashlib
+from array import array
+from functools import lru_cache
 from typing import Dict, Tuple, Optional, List
+import numpy as np
+
+# Jump kinds in the move table
+JUMP_NONE = 0
+JUMP_SNAKE = 1
+JUMP_LADDER = 2
+JUMP_BLOCKED = 3  # The roll overshoots the last cell, so the token stays put
+
+# Highest roll of a standard die
+MAX_ROLL = 6
+
+# Supported board sizes, in cells per side
+MIN_SIZE = 5
+MAX_SIZE = 1000
+
+class BoardGeometry:
+    """Precomputed pixel layout of a board's cells for one cell size and window height.
+    
+    Cells run in a serpentine pattern from the bottom-left corner: left to
+    right on even rows, right to left on odd rows. Every cell's top-left
+    corner and center are worked out once into flat arrays indexed by
+    position, and ``grid`` maps (row from the top, column) back to a
+    position, so lookups in either direction are a single index.
+    
+    Attributes:
+        size: Number of cells per row/column
+        cell_size: Size of each cell in pixels
+        window_height: Height of the game window
+        top: Screen y coordinate of the board's top edge
+        xs: Top-left x coordinate of each cell, by position (index 0 unused)
+        ys: Top-left y coordinate of each cell, by position
+        center_xs: Center x coordinate of each cell, by position
+        center_ys: Center y coordinate of each cell, by position
+        grid: Position of each cell, by ``row_from_top * size + column``
+    """
+    
+    def __init__(self, size: int, cell_size: int, window_height: int):
+        """Compute the layout.
+        
+        Args:
+            size: Number of cells per row/column
+            cell_size: Size of each cell in pixels
+            window_height: Height of the game window
+        """
+        self.size = size
+        self.cell_size = cell_size
+        self.window_height = window_height
+        self.top = window_height - size * cell_size
+        
+        positions = np.arange(size * size, dtype=np.intc)
+        row, col = np.divmod(positions, size)
+        odd = row % 2 == 1
+        col[odd] = (size - 1) - col[odd]
+        
+        xs = np.zeros(size * size + 1, dtype=np.intc)
+        ys = np.zeros(size * size + 1, dtype=np.intc)
+        xs[1:] = col * cell_size
+        ys[1:] = window_height - (row + 1) * cell_size
+        grid = np.empty(size * size, dtype=np.intc)
+        grid[((size - 1) - row) * size + col] = positions + 1
+        
+        self.xs = _to_array(xs)
+        self.ys = _to_array(ys)
+        self.center_xs = _to_array(xs + cell_size // 2)
+        self.center_ys = _to_array(ys + cell_size // 2)
+        self.grid = _to_array(grid)
+    
+    def top_left(self, position: int) -> Tuple[int, int]:
+        """Get the top-left corner of a cell ((0, 0) for an invalid position)."""
+        if 1 <= position < len(self.xs):
+            return (self.xs[position], self.ys[position])
+        return (0, 0)
+    
+    def center(self, position: int) -> Tuple[int, int]:
+        """Get the center of a cell ((0, 0) for an invalid position)."""
+        if 1 <= position < len(self.xs):
+            return (self.center_xs[position], self.center_ys[position])
+        return (0, 0)
+    
+    def position_at(self, x: int, y: int) -> Optional[int]:
+        """Get the position of the cell containing a pixel, or None if it is off the board."""
+        col = x // self.cell_size
+        row = (y - self.top) // self.cell_size
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return self.grid[row * self.size + col]
+        return None
+
+
+def _to_array(values: np.ndarray) -> array:
+    """Copy a NumPy int array into an ``array('i')``, whose items index as plain ints."""
+    result = array('i')
+    result.frombytes(values.astype(np.intc).tobytes())
+    return result
+
+
+@lru_cache(maxsize=8)
+def board_geometry(size: int, cell_size: int, window_height: int) -> BoardGeometry:
+    """Get the shared layout for a board size, cell size and window height.
+    
+    The layout does not depend on snakes or ladders, so boards of the same
+    size share it.
+    """
+    return BoardGeometry(size, cell_size, window_height)
+
 
 class Board:
     """Represents the game board with snakes and ladders."""
@@ -11,29 +118,88 @@ class Board:
         Args:
             snakes: Dictionary mapping snake heads to tails {start: end}
             ladders: Dictionary mapping ladder bottoms to tops {start: end}
-            size: Size of the board (default: 10x10)
+            size: Size of the board (default: 10x10, from MIN_SIZE to MAX_SIZE)
+            
+        Raises:
+            ValueError: If the size is unsupported or a snake or ladder is off
+                the board or loops
         """
+        if not MIN_SIZE <= size <= MAX_SIZE:
+            raise ValueError(f"Board size must be between {MIN_SIZE} and {MAX_SIZE}, got {size}")
         self.snakes = snakes
         self.ladders = ladders
         self.size = size
         self.total_cells = size * size
+        self._compile_jumps()
+        self._geometry: Optional[BoardGeometry] = None
+        
+        # 64-bit hash of the layout, used to check snapshots belong to this board
+        digest = hashlib.blake2b(repr(self.key()).encode(), digest_size=8).digest()
+        self.fingerprint = int.from_bytes(digest, 'little')
     
-    def check_snake_or_ladder(self, position: int) -> Tuple[bool, Optional[int]]:
-        """Check if a position has a snake or ladder.
+    def _compile_jumps(self) -> None:
+        """Compile the snakes and ladders into a sparse jump table.
+        
+        ``jumps[cell]`` is ``(destination, kind)`` for a token landing on
+        ``cell`` after following every jump (a ladder may end on a snake
+        head). Only cells with a snake head or ladder bottom have an entry,
+        so the table grows with the number of jumps, not with the board.
+        
+        Raises:
+            ValueError: If a snake or ladder is off the board or they form a loop
+        """
+        for start, end in list(self.snakes.items()) + list(self.ladders.items()):
+            if not (1 <= start <= self.total_cells and 1 <= end <= self.total_cells) or start == end:
+                raise ValueError(f"Invalid jump {start} -> {end} on a board of {self.total_cells} cells")
+        
+        self.jumps: Dict[int, Tuple[int, int]] = {}
+        for cell in set(self.snakes) | set(self.ladders):
+            target = cell
+            visited = set()
+            while target in self.snakes or target in self.ladders:
+                if target in visited:
+                    raise ValueError(f"Snakes and ladders loop through cell {cell}")
+                visited.add(target)
+                target = self.snakes.get(target, self.ladders.get(target))
+            self.jumps[cell] = (target, JUMP_SNAKE if target < cell else JUMP_LADDER)
+    
+    def resolve_move(self, position: int, roll: int) -> Tuple[int, int]:
+        """Get the outcome of rolling ``roll`` from ``position``.
         
         Args:
-            position: The position to check (1-100)
+            position: The current position (0 - off board)
+            roll: The number rolled
             
         Returns:
-            Tuple[bool, Optional[int]]: 
-                - First element: True if snake, False if ladder, None if neither
-                - Second element: The target position if snake/ladder, None otherwise
+            Tuple[int, int]: The final position and the jump kind (JUMP_NONE,
+            JUMP_SNAKE, JUMP_LADDER or JUMP_BLOCKED)
+        """
+        landing = position + roll
+        if landing > self.total_cells or landing < 1:
+            return position, JUMP_BLOCKED
+        return self.jumps.get(landing) or (landing, JUMP_NONE)
+    
+    def key(self) -> Tuple[int, Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]:
+        """Get a hashable key describing the board's contents.
+        
+        Returns:
+            Tuple: (size, sorted snakes, sorted ladders); equal for boards with
+            the same layout, so it can be used to cache per-board results
         """
-        if position in self.snakes:
-            return (True, self.snakes[position])
-        elif position in self.ladders:
-            return (False, self.ladders[position])
-        return (None, None)
+        return (self.size, tuple(sorted(self.snakes.items())), tuple(sorted(self.ladders.items())))
+    
+    @classmethod
+    def from_key(cls, key: Tuple[int, Tuple[Tuple[int, int], ...], Tuple[Tuple[int, int], ...]]) -> 'Board':
+        """Rebuild a board from its key (see ``key``).
+        
+        Args:
+            key: (size, sorted snakes, sorted ladders)
+            
+        Returns:
+            Board: A board with the same layout
+        """
+        size, snakes, ladders = key
+        return cls(dict(snakes), dict(ladders), size)
     
     def is_valid_position(self, position: int) -> bool:
         """Check if a position is valid on the board.
@@ -42,37 +208,45 @@ class Board:
             position: The position to check
             
         Returns:
-            bool: True if valid (1-100), False otherwise
+            bool: True if valid (1 to total_cells), False otherwise
         """
         return 1 <= position <= self.total_cells
     
+    def geometry(self, cell_size: int, window_height: int) -> BoardGeometry:
+        """Get the board's cell layout for a cell size and window height.
+        
+        Layouts are built once and shared; the most recent one is kept at
+        hand, so asking again with the same dimensions is nearly free.
+        
+        Args:
+            cell_size: Size of each cell in pixels
+            window_height: Height of the game window
+            
+        Returns:
+            BoardGeometry: The layout
+        """
+        geometry = self._geometry
+        if (geometry is None or geometry.cell_size != cell_size
+                or geometry.window_height != window_height):
+            geometry = self._geometry = board_geometry(self.size, cell_size, window_height)
+        return geometry
+    
     def get_cell_coordinates(self, position: int, cell_size: int, window_height: int) -> Tuple[int, int]:
         """Get the screen coordinates for a board position.
         
         Args:
-            position: The board position (1-100)
+            position: The board position (1 to total_cells)
             cell_size: Size of each cell in pixels
             window_height: Height of the game window
             
         Returns:
             Tuple[int, int]: (x, y) coordinates of the cell's top-left corner
         """
-        if not self.is_valid_position(position):
-            return (0, 0)
-            
-        # Convert to 0-based index
-        pos = position - 1
-        row = pos // self.size
-        col = pos % self.size
-        
-        # Handle snake pattern (alternate direction each row)
-        if row % 2 == 1:
-            col = (self.size - 1) - col
-        
-        x = col * cell_size
-        y = window_height - ((row + 1) * cell_size)  # y=0 is at top of screen
-        
-        return (x, y)
+        geometry = self._geometry
+        if (geometry is not None and geometry.cell_size == cell_size
+                and geometry.window_height == window_height and 1 <= position <= self.total_cells):
+            return (geometry.xs[position], geometry.ys[position])
+        return self.geometry(cell_size, window_height).top_left(position)
     
     def get_position_from_coords(self, x: int, y: int, cell_size: int, window_height: int) -> Optional[int]:
         """Get the board position from screen coordinates.
@@ -84,18 +258,15 @@ class Board:
             window_height: Height of the game window
             
         Returns:
-            Optional[int]: The board position (1-100) or None if invalid
+            Optional[int]: The board position (1 to total_cells) or None if invalid
         """
+        geometry = self._geometry
+        if (geometry is None or geometry.cell_size != cell_size
+                or geometry.window_height != window_height):
+            geometry = self.geometry(cell_size, window_height)
         col = x // cell_size
-        row = (window_height - y) // cell_size
-        
-        if not (0 <= row < self.size and 0 <= col < self.size):
-            return None
-            
-        # Handle snake pattern (alternate direction each row)
-        if row % 2 == 1:
-            col = (self.size - 1) - col
-            
-        position = (row * self.size) + col + 1
-        
-        return position if 1 <= position <= self.total_cells else None
+        row = (y - geometry.top) // cell_size
+        size = self.size
+        if 0 <= row < size and 0 <= col < size:
+            return geometry.grid[row * size + col]
+        return None
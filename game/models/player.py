@@ -1,79 +1,251 @@
 """Player model for the Snake and Ladder game."""
 
-import pygame
-from typing import Tuple, Optional
+from array import array
+from typing import List, Tuple, Optional
+from .board import board_geometry
+
+# Bits of PlayerTable.flags
+FLAG_ANIMATING = 1
+
+# Size of the rectangle reported by Player.rect
+TOKEN_SIZE = 30
+
+class PlayerTable:
+    """Compact struct-of-arrays storage for many players.
+
+    Each column holds one attribute for every player, so game logic and
+    rendering can work on whole columns (e.g. all positions) at once.
+    ``Player`` objects are lightweight views onto one row.
+
+    Attributes:
+        names: Player names
+        positions: Board positions (0 - off board)
+        target_positions: Positions the players are animating towards
+        colors: Flat RGB triples, three entries per player
+        flags: Bit flags per player (see FLAG_ANIMATING)
+        token_x: Screen x coordinate of each animated token
+        token_y: Screen y coordinate of each animated token
+    """
+
+    def __init__(self):
+        """Initialize an empty player table."""
+        self.names: List[str] = []
+        self.positions = array('i')
+        self.target_positions = array('i')
+        self.colors = array('B')
+        self.flags = array('B')
+        self.token_x = array('f')
+        self.token_y = array('f')
+        self._views: List['Player'] = []
+
+    def __len__(self) -> int:
+        """Get the number of players in the table."""
+        return len(self.names)
+
+    def __getitem__(self, row: int) -> 'Player':
+        """Get the player view for a row."""
+        return self._views[row]
+
+    def add(self, name: str, color: Tuple[int, int, int], position: int = 0) -> 'Player':
+        """Add a player to the table.
+
+        Args:
+            name: The player's name
+            color: The player's color as an RGB tuple
+            position: Starting position (default: 0 - off board)
+
+        Returns:
+            Player: The view onto the new row
+        """
+        return Player(name, color, position, table=self)
+
+    def _append(self, player: 'Player', name: str, color: Tuple[int, int, int],
+                position: int, target_position: int, flags: int,
+                token_pos: Tuple[float, float]) -> int:
+        """Append a row for ``player`` and return its index."""
+        self.names.append(name)
+        self.positions.append(position)
+        self.target_positions.append(target_position)
+        self.colors.extend(color)
+        self.flags.append(flags)
+        self.token_x.append(token_pos[0])
+        self.token_y.append(token_pos[1])
+        self._views.append(player)
+        return len(self._views) - 1
+
+    def reset_positions(self, position: int = 0) -> None:
+        """Move every player to the same position and stop their animations.
+
+        Args:
+            position: The new position (default: 0 - off board)
+        """
+        count = len(self)
+        self.positions[:] = array('i', [position]) * count
+        self.target_positions[:] = array('i', [position]) * count
+        self.flags[:] = array('B', [0]) * count
+
+    def any_animating(self) -> bool:
+        """Check whether any player's token is animating."""
+        return any(flag & FLAG_ANIMATING for flag in self.flags)
+
+    @classmethod
+    def gather(cls, players: List['Player']) -> 'PlayerTable':
+        """Get a single table whose rows are exactly ``players``, in order.
+
+        If the players already share such a table it is returned as is;
+        otherwise their rows are copied into a new table and the views are
+        rebound to it, so existing ``Player`` objects stay valid.
+
+        Args:
+            players: The players to gather
+
+        Returns:
+            PlayerTable: The table holding the players
+        """
+        if players:
+            table = players[0]._table
+            if table._views == players and all(p._table is table for p in players):
+                return table
+
+        table = cls()
+        for player in players:
+            row = table._append(player, player.name, player.color, player.position,
+                                player.target_position, player._table.flags[player._row],
+                                player.token_pos)
+            player._table = table
+            player._row = row
+        return table
+
 
 class Player:
     """Represents a player in the Snake and Ladder game.
-    
+
+    A player is a view onto one row of a ``PlayerTable``; all of its state
+    lives in the table's columns.
+
     Attributes:
         name: The player's name
         color: The player's color as an RGB tuple
-        position: The current position on the board (1-100)
-        rect: The pygame Rect representing the player's position on screen
+        position: The current position on the board (0 - off board)
+        token_pos: Screen position of the player's token while animating
+        rect: A pygame Rect centered on ``token_pos`` (read-only)
     """
-    
-    def __init__(self, name: str, color: Tuple[int, int, int], position: int = 0):
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, name: str, color: Tuple[int, int, int], position: int = 0,
+                 table: Optional[PlayerTable] = None):
         """Initialize a new player.
-        
+
         Args:
             name: The player's name
             color: The player's color as an RGB tuple
             position: Starting position (default: 0 - off board)
+            table: Table to add the player to (default: a new table)
+        """
+        self._table = table if table is not None else PlayerTable()
+        self._row = self._table._append(self, name, color, position, position, 0, (0.0, 0.0))
+
+    @property
+    def name(self) -> str:
+        """The player's name."""
+        return self._table.names[self._row]
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._table.names[self._row] = value
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """The player's color as an RGB tuple."""
+        start = self._row * 3
+        return tuple(self._table.colors[start:start + 3])
+
+    @property
+    def position(self) -> int:
+        """The current position on the board."""
+        return self._table.positions[self._row]
+
+    @position.setter
+    def position(self, value: int) -> None:
+        self._table.positions[self._row] = value
+
+    @property
+    def target_position(self) -> int:
+        """The position the player is animating towards."""
+        return self._table.target_positions[self._row]
+
+    @target_position.setter
+    def target_position(self, value: int) -> None:
+        self._table.target_positions[self._row] = value
+
+    @property
+    def is_animating(self) -> bool:
+        """Whether the player's token is being animated."""
+        return bool(self._table.flags[self._row] & FLAG_ANIMATING)
+
+    @is_animating.setter
+    def is_animating(self, value: bool) -> None:
+        if value:
+            self._table.flags[self._row] |= FLAG_ANIMATING
+        else:
+            self._table.flags[self._row] &= ~FLAG_ANIMATING
+
+    @property
+    def token_pos(self) -> Tuple[float, float]:
+        """Screen position of the player's token while animating."""
+        return (self._table.token_x[self._row], self._table.token_y[self._row])
+
+    @token_pos.setter
+    def token_pos(self, value: Tuple[float, float]) -> None:
+        self._table.token_x[self._row], self._table.token_y[self._row] = value
+
+    @property
+    def rect(self):
+        """A pygame Rect centered on the token.
+
+        Read-only: a new Rect is built from the player table on every
+        access, so changing it (``player.rect.center = ...``) has no effect.
+        Set ``token_pos`` to move the token.
         """
-        self.name = name
-        self.color = color
-        self.position = position
-        self.rect = pygame.Rect(0, 0, 30, 30)  # Will be updated during rendering
-        self.target_position = position
-        self.is_animating = False
-        
-    def move(self, steps: int) -> bool:
+        import pygame  # Imported lazily so the model can be used headless
+        rect = pygame.Rect(0, 0, TOKEN_SIZE, TOKEN_SIZE)
+        rect.center = (int(self._table.token_x[self._row]), int(self._table.token_y[self._row]))
+        return rect
+
+    def move(self, steps: int, goal: int) -> bool:
         """Move the player by the given number of steps.
-        
+
         Args:
             steps: Number of steps to move (1-6)
-            
+            goal: The last cell of the board (``Board.total_cells``)
+
         Returns:
-            bool: True if the player has won (reached or passed 100), False otherwise
+            bool: True if the player has reached the goal, False otherwise
         """
-        if self.position + steps <= 100:
+        if self.position + steps <= goal:
             self.position += steps
-            return self.position == 100
+            return self.position == goal
         return False
-    
-    def set_position(self, position: int) -> None:
+
+    def set_position(self, position: int, goal: int) -> None:
         """Set the player's position directly.
-        
+
         Args:
-            position: The new position (1-100)
+            position: The new position (clamped to 0 - goal)
+            goal: The last cell of the board (``Board.total_cells``)
         """
-        self.position = max(0, min(100, position))
-    
+        self.position = max(0, min(goal, position))
+
     def get_cell_center(self, board_size: int, cell_size: int, window_height: int) -> Tuple[int, int]:
         """Calculate the center position of the player's current cell.
-        
+
         Args:
             board_size: Number of cells per row/column
             cell_size: Size of each cell in pixels
             window_height: Height of the game window
-            
+
         Returns:
             Tuple[int, int]: (x, y) coordinates of the cell center
         """
-        if self.position < 1 or self.position > 100:
-            return (0, 0)
-            
-        # Calculate row and column (0-based)
-        row = (self.position - 1) // board_size
-        col = (self.position - 1) % board_size
-        
-        # Handle snake pattern (alternate direction each row)
-        if row % 2 == 1:
-            col = (board_size - 1) - col
-        
-        # Calculate center coordinates
-        x = col * cell_size + cell_size // 2
-        y = window_height - (row * cell_size) - cell_size // 2
-        
-        return (x, y)
+        return board_geometry(board_size, cell_size, window_height).center(self.position)
@@ -0,0 +1,6 @@
+"""Network game server package."""
+
+from .server import GameServer, Session, SessionError
+from .session_store import SessionStore
+
+__all__ = ['GameServer', 'Session', 'SessionError', 'SessionStore']
@@ -0,0 +1,37 @@
+"""Run the Snake and Ladder game server.
+
+Usage:
+    python -m game.server --port 8765
+    python -m game.server --unix /tmp/snake.sock
+"""
+
+import argparse
+import asyncio
+from .server import GameServer
+
+async def serve(args: argparse.Namespace) -> None:
+    """Start the server and run until cancelled."""
+    server = GameServer()
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+    for sock in listener.sockets:
+        print(f"Serving on {sock.getsockname()}")
+    await listener.serve_forever()
+
+
+def main() -> None:
+    """Entry point for the game server."""
+    parser = argparse.ArgumentParser(description="Snake and Ladder game server")
+    parser.add_argument('--host', default='127.0.0.1', help="address to bind")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port to bind")
+    parser.add_argument('--unix', help="serve on this Unix socket instead of TCP")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
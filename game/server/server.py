@@ -0,0 +1,331 @@
+"""Asyncio game server hosting many Snake and Ladder sessions in one process.
+
+Clients speak line-delimited JSON over TCP or a Unix socket. Each request is
+an object with an ``op`` field and gets exactly one response line back, in
+order; an optional ``id`` field is echoed to help clients match them up.
+
+    {"op": "create", "seats": 2, "seed": 7}  -> {"ok": true, "session": 1}
+    {"op": "join", "session": 1, "name": "Ann"} -> {"ok": true, "seat": 0}
+    {"op": "roll", "session": 1, "seat": 0}  -> {"ok": true, "roll": 4, ...}
+    {"op": "state", "session": 1}            -> {"ok": true, "positions": [...], ...}
+
+Failures are reported as ``{"ok": false, "error": "..."}``.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+from ..core.game_logic import GameLogic, MAX_SEED
+from ..models.board import Board
+from ..models.player import PlayerTable
+from .. import constants as const
+
+if TYPE_CHECKING:
+    from .session_store import SessionStore
+
+# Token colors handed out to seats in order
+SEAT_COLORS = [const.RED, const.BLUE, const.GREEN, const.YELLOW]
+
+MAX_SEATS = 8
+
+# Longest player name accepted on join
+MAX_NAME_LENGTH = 32
+
+logger = logging.getLogger(__name__)
+
+def is_int(value: Any) -> bool:
+    """Check that a decoded JSON value is an integer and not a boolean."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def seat_name(seat: int) -> str:
+    """Get the name a seat has until a player joins it with their own."""
+    return f"Player {seat + 1}"
+
+class SessionError(Exception):
+    """A request that cannot be applied to a session."""
+
+
+class Session:
+    """One game hosted by the server, run as a lightweight actor.
+
+    Requests are queued in the session's mailbox and handled one at a time
+    by a task that only exists while the mailbox is non-empty, so an idle
+    session costs no task or thread.
+
+    Attributes:
+        session_id: Identifier of the session
+        logic: The game being played
+        joined: Number of seats taken so far
+    """
+
+    def __init__(self, session_id: int, logic: GameLogic, joined: int = 0):
+        """Initialize the session.
+
+        Args:
+            session_id: Identifier of the session
+            logic: The game being played
+            joined: Number of seats already taken
+        """
+        self.session_id = session_id
+        self.logic = logic
+        self.joined = joined
+        self._mailbox: Deque[Tuple[Dict[str, Any], asyncio.Future]] = deque()
+        self._draining = False
+
+    @classmethod
+    def create(cls, session_id: int, board: Board, seats: int,
+               seed: Optional[int] = None) -> 'Session':
+        """Create a session with empty seats.
+
+        Args:
+            session_id: Identifier of the session
+            board: The game board
+            seats: Number of players
+            seed: Seed for the session's dice (random if None)
+
+        Returns:
+            Session: The new session
+        """
+        table = PlayerTable()
+        players = [table.add(seat_name(i), SEAT_COLORS[i % len(SEAT_COLORS)])
+                   for i in range(seats)]
+        return cls(session_id, GameLogic(players, board, seed=seed))
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether the session has requests waiting or being handled."""
+        return self._draining
+
+    def send(self, request: Dict[str, Any]) -> 'asyncio.Future[Dict[str, Any]]':
+        """Queue a request for the session.
+
+        Args:
+            request: The decoded request
+
+        Returns:
+            asyncio.Future: Resolves to the response
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._mailbox.append((request, future))
+        if not self._draining:
+            self._draining = True
+            asyncio.get_running_loop().create_task(self._drain())
+        return future
+
+    async def _drain(self) -> None:
+        """Handle queued requests until the mailbox is empty."""
+        try:
+            while self._mailbox:
+                request, future = self._mailbox.popleft()
+                try:
+                    response = self.handle(request)
+                except SessionError as e:
+                    response = {'ok': False, 'error': str(e)}
+                except Exception:
+                    logger.exception("Request %r failed", request)
+                    response = {'ok': False, 'error': "Internal error"}
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            self._draining = False
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a request to the session.
+
+        Args:
+            request: The decoded request
+
+        Returns:
+            Dict[str, Any]: The response
+
+        Raises:
+            SessionError: If the request is not valid for the session
+        """
+        op = request.get('op')
+        if op == 'join':
+            return self._join(request)
+        if op == 'roll':
+            return self._roll(request)
+        if op == 'state':
+            return self.describe()
+        raise SessionError(f"Unknown op: {op!r}")
+
+    def _join(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Take the next free seat."""
+        players = self.logic.players
+        if self.joined >= len(players):
+            raise SessionError("Session is full")
+        seat = self.joined
+        name = request.get('name')
+        if name:
+            players[seat].name = str(name)[:MAX_NAME_LENGTH]
+        self.joined += 1
+        return {'ok': True, 'session': self.session_id, 'seat': seat}
+
+    def _roll(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Play a turn for the requesting seat."""
+        state = self.logic.state
+        if self.joined < len(self.logic.players):
+            raise SessionError("Waiting for players to join")
+        if state.game_over:
+            raise SessionError("Game is over")
+        seat = request.get('seat')
+        if not is_int(seat) or seat != state.current_player_index:
+            raise SessionError("Not your turn")
+
+        player = state.current_player
+        start = player.position
+        moved, winner = self.logic.play_turn()
+        return {
+            'ok': True,
+            'roll': state.dice_value,
+            'from': start,
+            'position': player.position,
+            'moved': moved,
+            'next': state.current_player_index,
+            'winner': self.logic.players.index(winner) if winner is not None else None,
+        }
+
+    def describe(self) -> Dict[str, Any]:
+        """Get the public state of the session."""
+        state = self.logic.state
+        players = self.logic.players
+        return {
+            'ok': True,
+            'session': self.session_id,
+            'players': [player.name for player in players],
+            'open_seats': len(players) - self.joined,
+            'positions': list(state.table.positions),
+            'current': state.current_player_index,
+            'dice': state.dice_value,
+            'winner': state.winner_index if state.winner is not None else None,
+        }
+
+
+class GameServer:
+    """Hosts independent game sessions behind a line-delimited JSON protocol."""
+
+    def __init__(self, board: Optional[Board] = None, store: Optional['SessionStore'] = None):
+        """Initialize the server.
+
+        Args:
+            board: Board used by every session (default: the standard board)
+            store: Where sessions are kept (default: a SessionStore with
+                default limits)
+        """
+        from .session_store import SessionStore
+        self.board = board or Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+        self.sessions = store if store is not None else SessionStore(self.board)
+        self._next_id = 1
+        self._servers: List[asyncio.AbstractServer] = []
+
+    async def start_tcp(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """Start listening on a TCP socket.
+
+        Args:
+            host: Address to bind
+            port: Port to bind (0 picks a free port)
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Start listening on a Unix domain socket.
+
+        Args:
+            path: Filesystem path of the socket
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        server = await asyncio.start_unix_server(self.handle_connection, path)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        """Stop listening on every socket."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Serve requests from one client until it disconnects."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self.dispatch_line(line)
+                writer.write(json.dumps(response, separators=(',', ':')).encode() + b'\n')
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch_line(self, line: bytes) -> Dict[str, Any]:
+        """Decode and handle one request line.
+
+        Args:
+            line: The raw request
+
+        Returns:
+            Dict[str, Any]: The response
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return {'ok': False, 'error': "Invalid JSON"}
+        if not isinstance(request, dict):
+            return {'ok': False, 'error': "Request must be an object"}
+
+        try:
+            response = await self.dispatch(request)
+        except Exception:
+            # A bug handling one request must not take the connection down
+            logger.exception("Request %r failed", request)
+            response = {'ok': False, 'error': "Internal error"}
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    async def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Route a decoded request to the server or to its session.
+
+        Args:
+            request: The decoded request
+
+        Returns:
+            Dict[str, Any]: The response
+        """
+        if request.get('op') == 'create':
+            return self._create(request)
+
+        session_id = request.get('session')
+        session = self.sessions.get(session_id) if is_int(session_id) else None
+        if session is None:
+            return {'ok': False, 'error': "Unknown session"}
+        return await session.send(request)
+
+    def _create(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new session."""
+        seats = request.get('seats', 2)
+        if not is_int(seats) or not 1 <= seats <= MAX_SEATS:
+            return {'ok': False, 'error': f"seats must be between 1 and {MAX_SEATS}"}
+        seed = request.get('seed')
+        if seed is not None and (not is_int(seed) or not 0 <= seed < MAX_SEED):
+            return {'ok': False, 'error': "seed must be an integer from 0 to 2**64 - 1"}
+
+        session_id = self._next_id
+        self._next_id += 1
+        self.sessions.add(Session.create(session_id, self.board, seats, seed))
+        return {'ok': True, 'session': session_id}
@@ -0,0 +1,204 @@
+"""Session store that parks idle game sessions compactly and spills cold ones to disk."""
+
+import logging
+import sqlite3
+import struct
+import sys
+from collections import OrderedDict
+from typing import List, Optional
+from ..models.board import Board
+from .server import Session, seat_name
+
+# Packed session: seat count, seats joined, length of the names blob, then
+# the names blob (NUL-separated, empty for default names) and the snapshot
+_PACKED_HEADER = struct.Struct('<BBH')
+
+# Approximate per-entry cost of a parked session beyond its packed bytes
+# (bytes object header, key and ordered-dict bookkeeping)
+_ENTRY_OVERHEAD = sys.getsizeof(b'') + sys.getsizeof(2 ** 40) + 100
+
+logger = logging.getLogger(__name__)
+
+class SessionStore:
+    """Keeps hot sessions live and parks idle ones as packed bytes.
+
+    The ``hot_capacity`` most recently used sessions stay as live ``Session``
+    objects. Older ones are packed into a few dozen bytes each, and once the
+    packed sessions exceed ``memory_budget`` bytes the least recently used
+    are spilled to an SQLite file. ``get`` rehydrates a session from
+    wherever it is, so callers never see the difference.
+    """
+
+    def __init__(self, board: Board, hot_capacity: int = 1024,
+                 memory_budget: int = 256 * 1024 * 1024, spill_path: str = ''):
+        """Initialize the session store.
+
+        Args:
+            board: Board shared by every session
+            hot_capacity: Number of sessions kept as live objects
+            memory_budget: Approximate bytes allowed for packed sessions
+                before spilling to disk
+            spill_path: SQLite file for spilled sessions (default: a private
+                temporary file)
+        """
+        self.board = board
+        self.hot_capacity = hot_capacity
+        self.memory_budget = memory_budget
+        self.parked_bytes = 0
+        self._hot: 'OrderedDict[int, Session]' = OrderedDict()
+        self._parked: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._spilled = 0
+        self._disk = sqlite3.connect(spill_path, isolation_level=None)
+        self._disk.execute("CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, data BLOB)")
+
+    def __len__(self) -> int:
+        """Get the total number of sessions held."""
+        return len(self._hot) + len(self._parked) + self._spilled
+
+    def __contains__(self, session_id: int) -> bool:
+        """Check whether a session is held anywhere in the store."""
+        if session_id in self._hot or session_id in self._parked:
+            return True
+        return self._load(session_id, remove=False) is not None
+
+    def add(self, session: Session) -> None:
+        """Add a new live session.
+
+        Args:
+            session: The session to add
+        """
+        self._hot[session.session_id] = session
+        self._evict(keep=session.session_id)
+
+    def get(self, session_id: int) -> Optional[Session]:
+        """Get a live session, rehydrating it if it was parked or spilled.
+
+        Args:
+            session_id: Identifier of the session
+
+        Returns:
+            Optional[Session]: The session, or None if it is unknown
+        """
+        session = self._hot.get(session_id)
+        if session is not None:
+            self._hot.move_to_end(session_id)
+            if len(self._hot) > self.hot_capacity:
+                # Busy sessions kept the hot set over capacity; park them now
+                self._evict(keep=session_id)
+            return session
+
+        data = self._parked.pop(session_id, None)
+        if data is not None:
+            self.parked_bytes -= len(data) + _ENTRY_OVERHEAD
+        else:
+            data = self._load(session_id, remove=True)
+        if data is None:
+            return None
+
+        session = self.unpack(session_id, data)
+        self._hot[session_id] = session
+        self._evict(keep=session_id)
+        return session
+
+    def pack(self, session: Session) -> bytes:
+        """Encode a session into its compact parked form.
+
+        Args:
+            session: The session to pack
+
+        Returns:
+            bytes: The packed session
+        """
+        players = session.logic.players
+        names = [player.name for player in players]
+        if names == _default_names(len(players)):
+            blob = b''
+        else:
+            blob = '\0'.join(names).encode()
+        header = _PACKED_HEADER.pack(len(players), session.joined, len(blob))
+        return header + blob + session.logic.snapshot()
+
+    def unpack(self, session_id: int, data: bytes) -> Session:
+        """Rebuild a live session from its parked form.
+
+        Args:
+            session_id: Identifier of the session
+            data: The packed session
+
+        Returns:
+            Session: The rehydrated session
+        """
+        seats, joined, name_length = _PACKED_HEADER.unpack_from(data)
+        start = _PACKED_HEADER.size
+        session = Session.create(session_id, self.board, seats)
+        session.joined = joined
+        if name_length:
+            names = data[start:start + name_length].decode().split('\0')
+            for player, name in zip(session.logic.players, names):
+                player.name = name
+        session.logic.restore(data[start + name_length:])
+        return session
+
+    def _evict(self, keep: Optional[int] = None) -> None:
+        """Park sessions beyond the hot capacity and spill beyond the memory budget.
+
+        Args:
+            keep: Session just handed to a caller, which stays live even if
+                busy sessions rotate it to the front
+        """
+        skipped = 0
+        while len(self._hot) > self.hot_capacity and skipped < len(self._hot):
+            session_id, session = next(iter(self._hot.items()))
+            if session.is_busy or session_id == keep:
+                # Sessions with queued requests, or about to get one, stay live
+                self._hot.move_to_end(session_id)
+                skipped += 1
+                continue
+            try:
+                data = self.pack(session)
+            except Exception:
+                # A session that can't be packed stays live rather than being lost
+                logger.exception("Could not park session %d", session_id)
+                self._hot.move_to_end(session_id)
+                skipped += 1
+                continue
+            # Only drop the live session once its packed form is stored
+            self._parked[session_id] = data
+            self.parked_bytes += len(data) + _ENTRY_OVERHEAD
+            del self._hot[session_id]
+
+        if self.parked_bytes > self.memory_budget:
+            self._spill(self.parked_bytes - self.memory_budget * 3 // 4)
+
+    def _spill(self, amount: int) -> None:
+        """Move at least ``amount`` bytes of the coldest parked sessions to disk."""
+        batch = []
+        freed = 0
+        while self._parked and freed < amount:
+            session_id, data = self._parked.popitem(last=False)
+            freed += len(data) + _ENTRY_OVERHEAD
+            batch.append((session_id, data))
+        self.parked_bytes -= freed
+        self._disk.execute("BEGIN")
+        self._disk.executemany("INSERT OR REPLACE INTO sessions VALUES (?, ?)", batch)
+        self._disk.execute("COMMIT")
+        self._spilled += len(batch)
+
+    def _load(self, session_id: int, remove: bool) -> Optional[bytes]:
+        """Read a spilled session from disk, optionally removing it."""
+        row = self._disk.execute("SELECT data FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        if remove:
+            self._disk.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            self._spilled -= 1
+        return row[0]
+
+    def close(self) -> None:
+        """Close the spill file."""
+        self._disk.close()
+
+
+def _default_names(count: int) -> List[str]:
+    """Get the names given to ``count`` seats before anyone joins."""
+    return [seat_name(seat) for seat in range(count)]
@@ -1,7 +1,13 @@
 """UI components for the Snake and Ladder game."""
 
 from .board_ui import BoardUI
+from .camera import Camera
+from .heatmap import HeatmapLayer
 from .sidebar_ui import SidebarUI
 from .animations import AnimationManager
+# The shared instance gets its own name so game.ui.text_cache stays the module
+from .text_cache import TextCache, text_cache as shared_text_cache
+from .profiler import FrameProfiler, ProfilerOverlay
 
-__all__ = ['BoardUI', 'SidebarUI', 'AnimationManager']
+__all__ = ['BoardUI', 'Camera', 'HeatmapLayer', 'SidebarUI', 'AnimationManager', 'TextCache', 'shared_text_cache',
+           'FrameProfiler', 'ProfilerOverlay']
@@ -1,13 +1,17 @@
 """Animation system for the Snake and Ladder game."""
 
 import pygame
-import math
+import numpy as np
 from typing import List, Dict, Any, Optional, Callable, Tuple
-from ..models.player import Player
+from ..models.board import Board
+from ..models.player import Player, PlayerTable
 
 class Animation:
     """Base class for animations."""
     
+    # Whether the animation came from an AnimationManager pool
+    pooled = False
+    
     def __init__(self, duration: float, on_complete: Optional[Callable] = None):
         """Initialize the animation.
         
@@ -15,24 +19,41 @@ class Animation:
             duration: Duration of the animation in seconds
             on_complete: Optional callback when animation completes
         """
+        self._start(duration, on_complete)
+    
+    def _start(self, duration: float, on_complete: Optional[Callable]) -> None:
+        """(Re)start the animation from the current time."""
         self.duration = duration * 1000  # Convert to milliseconds
         self.start_time = pygame.time.get_ticks()
         self.is_complete = False
         self.on_complete = on_complete
     
-    def update(self) -> bool:
+    def progress(self, now: int) -> float:
+        """Get how far through the animation ``now`` is, from 0.0 to 1.0.
+        
+        Args:
+            now: Current time in milliseconds (``pygame.time.get_ticks()``)
+        """
+        if self.duration <= 0:
+            return 1.0
+        return min((now - self.start_time) / self.duration, 1.0)
+    
+    def update(self, now: Optional[int] = None) -> bool:
         """Update the animation.
         
+        Args:
+            now: Current time in milliseconds (default: read the clock)
+        
         Returns:
             bool: True if the animation is complete, False otherwise
         """
         if self.is_complete:
             return True
+        if now is None:
+            now = pygame.time.get_ticks()
             
-        elapsed = pygame.time.get_ticks() - self.start_time
-        progress = min(elapsed / self.duration, 1.0)
-        
-        self._update_animation(progress)
+        progress = self.progress(now)
+        self._update_animation(progress, now)
         
         if progress >= 1.0:
             self.is_complete = True
@@ -41,11 +62,12 @@ class Animation:
             return True
         return False
     
-    def _update_animation(self, progress: float) -> None:
+    def _update_animation(self, progress: float, now: int) -> None:
         """Update the animation state based on progress (0.0 to 1.0).
         
         Args:
             progress: Animation progress from 0.0 to 1.0
+            now: Current time in milliseconds
         """
         raise NotImplementedError("Subclasses must implement _update_animation")
 
@@ -54,44 +76,54 @@ class MoveAnimation(Animation):
     """Animation for moving a player between cells."""
     
     def __init__(self, player: Player, target_position: int, duration: float, 
-                 board_size: int, cell_size: int, window_height: int,
-                 on_complete: Optional[Callable] = None):
+                 board: Board, cell_size: int, window_height: int,
+                 on_complete: Optional[Callable] = None,
+                 start_position: Optional[int] = None):
         """Initialize the move animation.
         
         Args:
             player: The player to animate
             target_position: The target position on the board
             duration: Duration of the animation in seconds
-            board_size: Size of the game board
+            board: The game board, which places the cells on screen
             cell_size: Size of each cell in pixels
             window_height: Height of the game window
             on_complete: Optional callback when animation completes
+            start_position: Position to animate from (default: the player's
+                current cell)
+        """
+        self.reset(player, target_position, duration, board, cell_size, window_height,
+                   on_complete, start_position)
+    
+    def reset(self, player: Player, target_position: int, duration: float,
+              board: Board, cell_size: int, window_height: int,
+              on_complete: Optional[Callable] = None,
+              start_position: Optional[int] = None) -> 'MoveAnimation':
+        """Reinitialize the animation so a pooled object can be reused.
+        
+        Takes the same arguments as the constructor.
+        
+        Returns:
+            MoveAnimation: This animation
         """
-        super().__init__(duration, on_complete)
+        self._start(duration, on_complete)
         self.player = player
-        self.start_pos = player.get_cell_center(board_size, cell_size, window_height)
-        self.target_pos = self._calculate_target_position(
-            target_position, board_size, cell_size, window_height)
+        if start_position is None:
+            start_position = player.position
+        geometry = board.geometry(cell_size, window_height)
+        self.start_pos = geometry.center(start_position)
+        self.target_pos = geometry.center(target_position)
         
         # Store original position to reset if needed
         self.original_position = player.position
         
-    def _calculate_target_position(self, position: int, board_size: int, 
-                                 cell_size: int, window_height: int) -> Tuple[float, float]:
-        """Calculate the target position in screen coordinates."""
-        row = (position - 1) // board_size
-        col = (position - 1) % board_size
-        
-        # Handle snake pattern (alternate direction each row)
-        if row % 2 == 1:
-            col = (board_size - 1) - col
-        
-        x = col * cell_size + cell_size // 2
-        y = window_height - (row * cell_size) - cell_size // 2
-        
-        return (x, y)
+        # The token is drawn at player.token_pos until the animation completes
+        player.token_pos = self.start_pos
+        player.target_position = target_position
+        player.is_animating = True
+        return self
     
-    def _update_animation(self, progress: float) -> None:
+    def _update_animation(self, progress: float, now: int) -> None:
         """Update the player's position based on animation progress."""
         # Use smooth step for easing
         t = self._ease_in_out_cubic(progress)
@@ -101,7 +133,9 @@ class MoveAnimation(Animation):
         y = self.start_pos[1] + (self.target_pos[1] - self.start_pos[1]) * t
         
         # Update player's visual position (not logical position)
-        self.player.rect.center = (x, y)
+        self.player.token_pos = (x, y)
+        if progress >= 1.0:
+            self.player.is_animating = False
     
     def _ease_in_out_cubic(self, t: float) -> float:
         """Easing function for smooth start and end."""
@@ -124,25 +158,117 @@ class DiceRollAnimation(Animation):
             on_update: Callback called with the current dice value
             on_complete: Optional callback when animation completes
         """
-        super().__init__(duration, on_complete)
+        self.reset(duration, on_update, on_complete)
+    
+    def reset(self, duration: float, on_update: Callable[[int], None],
+              on_complete: Optional[Callable] = None) -> 'DiceRollAnimation':
+        """Reinitialize the animation so a pooled object can be reused.
+        
+        Takes the same arguments as the constructor.
+        
+        Returns:
+            DiceRollAnimation: This animation
+        """
+        self._start(duration, on_complete)
         self.on_update = on_update
         self.last_value = 0
+        return self
     
-    def _update_animation(self, progress: float) -> None:
+    def _update_animation(self, progress: float, now: int) -> None:
         """Update the dice roll animation."""
         # Generate random dice values during the animation
-        value = pygame.time.get_ticks() % 6 + 1
+        value = now % 6 + 1
         if value != self.last_value:
             self.last_value = value
             self.on_update(value)
 
 
+def ease_in_out_cubic(t: np.ndarray) -> np.ndarray:
+    """Apply the cubic ease-in-out curve to an array of progress values."""
+    t = t * 2
+    return np.where(t < 1, 0.5 * t ** 3, 0.5 * ((t - 2) ** 3 + 2))
+
+
 class AnimationManager:
-    """Manages animations for the game."""
+    """Manages animations for the game.
+    
+    The clock is read once per ``update``. Move animations, which can run
+    by the hundred during a replay, are kept in parallel NumPy columns so
+    their easing is computed in one batched pass; other animations are
+    updated one by one. Finished animations are removed by swapping the
+    last one into their slot, and animations created through ``move`` and
+    ``dice_roll`` are recycled from a pool once they finish.
+    """
     
-    def __init__(self):
-        """Initialize the animation manager."""
-        self.animations: List[Animation] = []
+    def __init__(self, capacity: int = 64):
+        """Initialize the animation manager.
+        
+        Args:
+            capacity: Number of move animations the columns start with room for
+        """
+        self._moves: List[MoveAnimation] = []
+        self._others: List[Animation] = []
+        
+        # Move animation columns, one row per entry of _moves
+        self._start_x = np.zeros(capacity)
+        self._start_y = np.zeros(capacity)
+        self._delta_x = np.zeros(capacity)
+        self._delta_y = np.zeros(capacity)
+        self._start_time = np.zeros(capacity)
+        self._duration = np.zeros(capacity)
+        
+        # Tokens grouped by player table: (table, move rows, table rows),
+        # rebuilt whenever the set of moves changes
+        self._groups: Optional[List[Tuple[PlayerTable, np.ndarray, np.ndarray]]] = None
+        
+        self._move_pool: List[MoveAnimation] = []
+        self._dice_pool: List[DiceRollAnimation] = []
+    
+    @property
+    def animations(self) -> List[Animation]:
+        """All active animations."""
+        return self._moves + self._others
+    
+    def move(self, player: Player, target_position: int, duration: float,
+             board: Board, cell_size: int, window_height: int,
+             on_complete: Optional[Callable] = None,
+             start_position: Optional[int] = None) -> MoveAnimation:
+        """Start a pooled move animation.
+        
+        Takes the same arguments as ``MoveAnimation``. The returned object is
+        reused once the animation finishes, so do not keep it beyond that.
+        
+        Returns:
+            MoveAnimation: The started animation
+        """
+        if self._move_pool:
+            animation = self._move_pool.pop().reset(
+                player, target_position, duration, board, cell_size, window_height,
+                on_complete, start_position)
+        else:
+            animation = MoveAnimation(player, target_position, duration, board, cell_size,
+                                      window_height, on_complete, start_position)
+            animation.pooled = True
+        self.add_animation(animation)
+        return animation
+    
+    def dice_roll(self, duration: float, on_update: Callable[[int], None],
+                  on_complete: Optional[Callable] = None) -> DiceRollAnimation:
+        """Start a pooled dice roll animation.
+        
+        Takes the same arguments as ``DiceRollAnimation``. The returned object
+        is reused once the animation finishes, so do not keep it beyond that.
+        
+        Returns:
+            DiceRollAnimation: The started animation
+        """
+        if self._dice_pool:
+            animation = self._dice_pool.pop().reset(duration, on_update, on_complete)
+        else:
+            animation = DiceRollAnimation(duration, on_update, on_complete)
+            animation.pooled = True
+        self.add_animation(animation)
+        return animation
     
     def add_animation(self, animation: Animation) -> None:
         """Add an animation to be managed.
@@ -150,23 +276,153 @@ class AnimationManager:
         Args:
             animation: The animation to add
         """
-        self.animations.append(animation)
+        if not isinstance(animation, MoveAnimation):
+            self._others.append(animation)
+            return
+        
+        row = len(self._moves)
+        if row == len(self._start_x):
+            self._grow(2 * row)
+        self._moves.append(animation)
+        self._start_x[row], self._start_y[row] = animation.start_pos
+        self._delta_x[row] = animation.target_pos[0] - animation.start_pos[0]
+        self._delta_y[row] = animation.target_pos[1] - animation.start_pos[1]
+        self._start_time[row] = animation.start_time
+        self._duration[row] = animation.duration
+        self._groups = None
+    
+    def _grow(self, capacity: int) -> None:
+        """Enlarge the move animation columns."""
+        for name in ('_start_x', '_start_y', '_delta_x', '_delta_y', '_start_time', '_duration'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+    
+    def update(self, now: Optional[int] = None) -> None:
+        """Update all active animations and remove completed ones.
+        
+        Args:
+            now: Current time in milliseconds (default: read the clock once)
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        
+        finished = self._update_moves(now) if self._moves else []
+        
+        # Update other animations in reverse order so completed ones can be
+        # swapped out
+        others = self._others
+        for i in range(len(others) - 1, -1, -1):
+            animation = others[i]
+            if animation.update(now):
+                others[i] = others[-1]
+                others.pop()
+                self._release(animation)
+        
+        # Completion callbacks run last, as they may start new animations
+        for animation in finished:
+            animation.is_complete = True
+            if animation.on_complete:
+                animation.on_complete()
+            self._release(animation)
+    
+    def _update_moves(self, now: int) -> List[MoveAnimation]:
+        """Advance every move animation in one batched pass.
+        
+        Returns:
+            List[MoveAnimation]: The animations that finished, already removed
+        """
+        count = len(self._moves)
+        duration = self._duration[:count]
+        elapsed = now - self._start_time[:count]
+        progress = np.minimum(np.divide(elapsed, duration, out=np.ones(count), where=duration > 0), 1.0)
+        eased = ease_in_out_cubic(progress)
+        x = self._start_x[:count] + self._delta_x[:count] * eased
+        y = self._start_y[:count] + self._delta_y[:count] * eased
+        
+        if self._groups is None:
+            self._groups = self._group_by_table()
+        for table, rows, table_rows in self._groups:
+            if len(rows) == 1:
+                row, table_row = rows[0], table_rows[0]
+                table.token_x[table_row] = x[row]
+                table.token_y[table_row] = y[row]
+            else:
+                np.frombuffer(table.token_x, dtype=np.float32)[table_rows] = x[rows]
+                np.frombuffer(table.token_y, dtype=np.float32)[table_rows] = y[rows]
+        
+        done = np.flatnonzero(progress >= 1.0)
+        if not len(done):
+            return []
+        
+        # Remove from the highest row down so each swapped-in row is still live
+        finished = []
+        for row in done[::-1].tolist():
+            animation = self._moves[row]
+            animation.player.is_animating = False
+            finished.append(animation)
+            self._remove_move(row)
+        return finished
+    
+    def _group_by_table(self) -> List[Tuple[PlayerTable, np.ndarray, np.ndarray]]:
+        """Group the animated tokens by the player table that stores them."""
+        groups: Dict[int, Tuple[PlayerTable, List[int], List[int]]] = {}
+        for row, animation in enumerate(self._moves):
+            player = animation.player
+            group = groups.get(id(player._table))
+            if group is None:
+                group = groups[id(player._table)] = (player._table, [], [])
+            group[1].append(row)
+            group[2].append(player._row)
+        return [(table, np.array(rows), np.array(table_rows))
+                for table, rows, table_rows in groups.values()]
     
-    def update(self) -> None:
-        """Update all active animations and remove completed ones."""
-        # Update animations in reverse order so we can remove completed ones
-        for i in range(len(self.animations) - 1, -1, -1):
-            if self.animations[i].update():
-                self.animations.pop(i)
+    def _remove_move(self, row: int) -> None:
+        """Remove a move animation by moving the last one into its row."""
+        last = len(self._moves) - 1
+        if row != last:
+            self._moves[row] = self._moves[last]
+            for column in (self._start_x, self._start_y, self._delta_x, self._delta_y,
+                           self._start_time, self._duration):
+                column[row] = column[last]
+        self._moves.pop()
+        self._groups = None
     
-    def is_animating(self) -> bool:
+    def _release(self, animation: Animation) -> None:
+        """Return a finished animation to its pool if it came from one."""
+        if not animation.pooled:
+            return
+        if isinstance(animation, MoveAnimation):
+            animation.player = None
+            animation.on_complete = None
+            self._move_pool.append(animation)
+        elif isinstance(animation, DiceRollAnimation):
+            animation.on_update = None
+            animation.on_complete = None
+            self._dice_pool.append(animation)
+    
+    def is_animating(self, animation_type: Optional[type] = None) -> bool:
         """Check if any animations are currently playing.
         
+        Args:
+            animation_type: Only consider animations of this class
+            
         Returns:
             bool: True if animations are in progress, False otherwise
         """
-        return len(self.animations) > 0
+        if animation_type is None:
+            return bool(self._moves or self._others)
+        if self._moves and issubclass(MoveAnimation, animation_type):
+            return True
+        return any(isinstance(animation, animation_type) for animation in self._others)
     
     def clear(self) -> None:
         """Clear all animations."""
-        self.animations.clear()
+        for animation in self._moves:
+            animation.player.is_animating = False
+        for animation in self._moves + self._others:
+            self._release(animation)
+        self._moves.clear()
+        self._others.clear()
+        self._groups = None
@@ -1,10 +1,102 @@
 """Board rendering for the Snake and Ladder game."""
 
+import time
 import pygame
-from typing import List, Tuple, Optional
-from ..models.player import Player
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
+from ..models.player import Player, PlayerTable, FLAG_ANIMATING
 from ..models.board import Board
 from .. import constants as const
+from .camera import Camera
+from .heatmap import HeatmapLayer
+from .text_cache import text_cache
+
+if TYPE_CHECKING:
+    from .profiler import FrameProfiler
+
+# Target width of a cached tile of cells in pixels; tiles span a power-of-two
+# number of cells, so fewer cells per tile as the view zooms in
+TILE_PIXELS = 256
+
+# Tile surfaces kept across frames and zoom levels
+TILE_CACHE_SIZE = 128
+
+# Smallest cell sizes, in pixels, that get a border and a number
+MIN_BORDER_CELL = 8
+MIN_NUMBER_CELL = 24
+
+class JumpIndex:
+    """Spatial index of the board's snakes and ladders.
+    
+    The board is divided into square buckets of ``bucket_cells`` cells, and
+    each snake or ladder is listed in every bucket its drawing passes
+    through. A lookup only touches the buckets covering the area asked
+    for, so its cost depends on that area and not on the whole board.
+    """
+    
+    def __init__(self, board: Board, bucket_cells: int = 8):
+        """Index a board's snakes and ladders.
+        
+        Args:
+            board: The game board
+            bucket_cells: Width and height of a bucket in cells
+        """
+        self.board = board
+        self.bucket_cells = bucket_cells
+        self.buckets: Dict[Tuple[int, int], List[int]] = {}
+        
+        # One-pixel cells, so corners are (column, row from the top)
+        self.cells = board.geometry(1, board.size)
+        
+        # Ladders first, so they are drawn below snakes
+        self.jumps: List[Tuple[int, int, bool]] = (
+            [(start, end, False) for start, end in board.ladders.items()]
+            + [(start, end, True) for start, end in board.snakes.items()]
+        )
+        for number, (start, end, _) in enumerate(self.jumps):
+            self._insert(number, start, end)
+    
+    def _insert(self, number: int, start: int, end: int) -> None:
+        """List a jump in every bucket within a cell of the line between its ends."""
+        (x1, y1), (x2, y2) = self.cells.top_left(start), self.cells.top_left(end)
+        if y1 > y2:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        bucket = self.bucket_cells
+        margin = 1
+        for by in range((y1 - margin) // bucket, (y2 + margin) // bucket + 1):
+            # Part of the line crossing this row of buckets, then widened
+            top = max(y1, by * bucket - margin)
+            bottom = min(y2, (by + 1) * bucket + margin)
+            if y1 == y2:
+                xs = (x1, x2)
+            else:
+                xs = (x1 + (x2 - x1) * (top - y1) / (y2 - y1),
+                      x1 + (x2 - x1) * (bottom - y1) / (y2 - y1))
+            left = int(min(xs)) - margin
+            right = int(max(xs)) + margin
+            for bx in range(left // bucket, right // bucket + 1):
+                self.buckets.setdefault((bx, by), []).append(number)
+    
+    def query(self, first_col: int, end_col: int, first_row: int, end_row: int) -> List[Tuple[int, int, bool]]:
+        """Get the jumps that may be drawn over an area of the board.
+        
+        Args:
+            first_col: First column of the area
+            end_col: Column just past the area
+            first_row: First row of the area, counted from the top
+            end_row: Row just past the area
+        
+        Returns:
+            List[Tuple[int, int, bool]]: (start, end, is_snake) of each jump,
+            in drawing order
+        """
+        bucket = self.bucket_cells
+        found = set()
+        for by in range(first_row // bucket, (end_row - 1) // bucket + 1):
+            for bx in range(first_col // bucket, (end_col - 1) // bucket + 1):
+                found.update(self.buckets.get((bx, by), ()))
+        return [self.jumps[number] for number in sorted(found)]
+
 
 class BoardUI:
     """Handles rendering of the game board."""
@@ -18,12 +110,39 @@ class BoardUI:
         """
         self.board = board
         self.players = players
-        self.cell_size = const.CELL_SIZE
+        self.table = PlayerTable.gather(players)
+        
+        # Fit the board to the window, but keep cell numbers readable on
+        # large boards; the camera pans over whatever doesn't fit
+        self.cell_size = max(MIN_NUMBER_CELL, const.BOARD_WIDTH // board.size)
         self.window_height = const.WINDOW_SIZE[1]
         
+        # Board pixels at the base cell size, in which token positions are kept
+        self.world_height = board.size * self.cell_size
+        
+        # The part of the screen showing the board
+        self.camera = Camera(pygame.Rect(0, 0, const.BOARD_WIDTH, self.window_height),
+                             board.size, self.cell_size)
+        
         # Initialize fonts
         self.font = pygame.font.SysFont('Arial', 16)
         self.large_font = pygame.font.SysFont('Arial', 24, bold=True)
+        
+        # Rendered cells of the board, by (cell size, tile column, tile row)
+        self.jump_index = JumpIndex(board)
+        self._tiles: 'OrderedDict[Tuple[int, int, int], pygame.Surface]' = OrderedDict()
+        self._tiles_board = board.fingerprint
+        
+        # The composed view, redrawn when the camera moves
+        self._view: Optional[pygame.Surface] = None
+        self._view_key: Optional[Tuple[int, int, bool]] = None
+        
+        # Landing-frequency overlay, built the first time it is shown
+        self.show_heatmap = False
+        self._heatmap: Optional[HeatmapLayer] = None
+        
+        # Set to time redraws of the view
+        self.profiler: Optional['FrameProfiler'] = None
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the game board.
@@ -31,63 +150,176 @@ class BoardUI:
         Args:
             surface: The pygame surface to draw on
         """
-        self._draw_grid(surface)
-        self._draw_snakes_and_ladders(surface)
-        self._draw_players(surface)
-    
-    def _draw_grid(self, surface: pygame.Surface) -> None:
-        """Draw the game board grid."""
-        for row in range(self.board.size):
-            for col in range(self.board.size):
-                # Calculate position (board is on the left side)
-                x = col * self.cell_size
-                y = self.window_height - (row * self.cell_size) - self.cell_size
+        self.draw_static(surface)
+        self.draw_players(surface)
+    
+    def toggle_heatmap(self) -> bool:
+        """Show or hide the landing-frequency heatmap.
+        
+        Returns:
+            bool: True if the heatmap is now shown
+        """
+        self.show_heatmap = not self.show_heatmap
+        return self.show_heatmap
+    
+    def draw_static(self, surface: pygame.Surface) -> None:
+        """Draw the grid, snakes and ladders in view.
+        
+        The view is composed from cached tiles, the heatmap if shown and the
+        snakes and ladders crossing it, and kept until the camera moves.
+        
+        Args:
+            surface: The pygame surface to draw on
+        """
+        key = (self.board.fingerprint, self.camera.version, self.show_heatmap)
+        if self._view is None or key != self._view_key:
+            self._compose_view()
+            self._view_key = key
+        surface.blit(self._view, self.camera.viewport)
+    
+    def _compose_view(self) -> None:
+        """Redraw the view of the board from its tiles and the jumps in view."""
+        if self.board.fingerprint != self._tiles_board:
+            self.jump_index = JumpIndex(self.board)
+            self._tiles.clear()
+            self._tiles_board = self.board.fingerprint
+            self._heatmap = None
+        
+        camera = self.camera
+        if self._view is None or self._view.get_size() != camera.viewport.size:
+            self._view = pygame.Surface(camera.viewport.size)
+            if pygame.display.get_surface() is not None:
+                self._view = self._view.convert()
+        view = self._view
+        if camera.world_size < camera.viewport.width or camera.world_size < camera.viewport.height:
+            view.fill(const.LIGHT_GRAY)
+        
+        # Cells, from the tiles overlapping the view
+        start = time.perf_counter()
+        tile_cells = self.tile_cells()
+        tile_size = tile_cells * camera.cell_size
+        first_col, end_col, first_row, end_row = camera.visible_cells()
+        for tile_row in range(first_row // tile_cells, (end_row - 1) // tile_cells + 1):
+            for tile_col in range(first_col // tile_cells, (end_col - 1) // tile_cells + 1):
+                view.blit(self._get_tile(tile_col, tile_row, tile_cells),
+                          (tile_col * tile_size - camera.x, tile_row * tile_size - camera.y))
+        heatmap = None
+        if self.show_heatmap:
+            if self._heatmap is None:
+                self._heatmap = HeatmapLayer(self.board, self.jump_index.cells)
+            heatmap = self._heatmap
+            heatmap.draw_cells(view, camera, (first_col, end_col, first_row, end_row))
+        grid_done = time.perf_counter()
+        
+        # Snakes and ladders crossing the view, drawn over the whole view at
+        # once so they have no seams between tiles
+        origin = (camera.x, camera.y)
+        jumps = self.jump_index.query(first_col, end_col, first_row, end_row)
+        for start_cell, end_cell, is_snake in jumps:
+            if is_snake:
+                self._draw_snake(view, start_cell, end_cell, origin)
+            else:
+                self._draw_ladder(view, start_cell, end_cell, origin)
+        if heatmap is not None:
+            heatmap.draw_labels(view, camera, jumps,
+                                lambda cell: self._get_cell_corner(cell, origin))
+            heatmap.draw_legend(view)
+        if self.profiler is not None:
+            self.profiler.record('render.board.grid', start, grid_done - start)
+            self.profiler.record('render.board.snakes_ladders', grid_done,
+                                 time.perf_counter() - grid_done)
+    
+    def tile_cells(self) -> int:
+        """Get the number of cells across a tile at the current zoom."""
+        cells = 1
+        while cells * self.camera.cell_size < TILE_PIXELS and cells < self.board.size:
+            cells *= 2
+        return cells
+    
+    def _get_tile(self, tile_col: int, tile_row: int, tile_cells: int) -> pygame.Surface:
+        """Get the cells of a tile, rendering them on a cache miss.
+        
+        Args:
+            tile_col: Column of the tile
+            tile_row: Row of the tile, counted from the top
+            tile_cells: Number of cells across a tile
+        """
+        cell_size = self.camera.cell_size
+        key = (cell_size, tile_col, tile_row)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+        
+        first_col = tile_col * tile_cells
+        first_row = tile_row * tile_cells
+        end_col = min(self.board.size, first_col + tile_cells)
+        end_row = min(self.board.size, first_row + tile_cells)
+        tile = pygame.Surface(((end_col - first_col) * cell_size, (end_row - first_row) * cell_size))
+        if pygame.display.get_surface() is not None:
+            tile = tile.convert()
+        self._draw_grid(tile, first_col, end_col, first_row, end_row, cell_size)
+        
+        self._tiles[key] = tile
+        if len(self._tiles) > TILE_CACHE_SIZE:
+            self._tiles.popitem(last=False)
+        return tile
+    
+    def _draw_grid(self, surface: pygame.Surface, first_col: int, end_col: int,
+                   first_row: int, end_row: int, cell_size: int) -> None:
+        """Draw the cells of part of the board onto a tile.
+        
+        Args:
+            surface: The tile to draw on
+            first_col: First column of the tile
+            end_col: Column just past the tile
+            first_row: First row of the tile, counted from the top
+            end_row: Row just past the tile
+            cell_size: Size of each cell in pixels
+        """
+        surface.fill(const.WHITE)
+        size = self.board.size
+        grid = self.jump_index.cells.grid
+        for top_row in range(first_row, end_row):
+            row = (size - 1) - top_row
+            y = (top_row - first_row) * cell_size
+            for col in range(first_col, end_col):
+                x = (col - first_col) * cell_size
                 
                 # Alternate cell colors
-                cell_color = const.YELLOW if (row + col) % 2 == 0 else const.WHITE
-                pygame.draw.rect(surface, cell_color, (x, y, self.cell_size, self.cell_size))
+                if (row + col) % 2 == 0:
+                    pygame.draw.rect(surface, const.YELLOW, (x, y, cell_size, cell_size))
                 
                 # Draw cell border
-                pygame.draw.rect(surface, const.BLACK, (x, y, self.cell_size, self.cell_size), 1)
+                if cell_size >= MIN_BORDER_CELL:
+                    pygame.draw.rect(surface, const.BLACK, (x, y, cell_size, cell_size), 1)
                 
                 # Draw cell number
-                self._draw_cell_number(surface, row, col, x, y)
+                if cell_size >= MIN_NUMBER_CELL:
+                    self._draw_cell_number(surface, grid[top_row * size + col], x, y, cell_size)
     
-    def _draw_cell_number(self, surface: pygame.Surface, row: int, col: int, x: int, y: int) -> None:
+    def _draw_cell_number(self, surface: pygame.Surface, number: int,
+                          x: int, y: int, cell_size: int) -> None:
         """Draw the number in a cell."""
-        # Calculate cell number based on snake pattern
-        if row % 2 == 0:
-            number = row * self.board.size + col + 1
-        else:
-            number = (row + 1) * self.board.size - col
-        
-        # Draw the number
         text = self.font.render(str(number), True, const.BLACK)
-        text_rect = text.get_rect(center=(x + self.cell_size//2, y + self.cell_size//2))
+        text_rect = text.get_rect(center=(x + cell_size//2, y + cell_size//2))
         surface.blit(text, text_rect)
     
-    def _draw_snakes_and_ladders(self, surface: pygame.Surface) -> None:
-        """Draw snakes and ladders on the board."""
-        # Draw ladders first (so they appear below snakes)
-        for start, end in self.board.ladders.items():
-            self._draw_ladder(surface, start, end)
-        
-        # Draw snakes
-        for start, end in self.board.snakes.items():
-            self._draw_snake(surface, start, end)
-    
-    def _draw_ladder(self, surface: pygame.Surface, start: int, end: int) -> None:
-        """Draw a ladder on the board."""
+    def _draw_ladder(self, surface: pygame.Surface, start: int, end: int,
+                     origin: Tuple[int, int]) -> None:
+        """Draw a ladder onto a tile whose top-left corner is at ``origin``."""
         # Get start and end positions
-        start_pos = self._get_cell_center(start)
-        end_pos = self._get_cell_center(end)
+        start_pos = self._get_cell_corner(start, origin)
+        end_pos = self._get_cell_corner(end, origin)
+        # Sizes below are for the standard board's cells; keep them in proportion
+        scale = self.camera.cell_size / const.CELL_SIZE
         
         # Draw ladder with two side rails and rungs
         ladder_color = (139, 69, 19)  # Brown
-        rail_width = 5
+        rail_width = max(1, round(5 * scale))
         
         # Draw side rails
-        offset = 10
+        offset = 10 * scale
         pygame.draw.line(
             surface, ladder_color,
             (start_pos[0] - offset, start_pos[1]),
@@ -113,18 +345,20 @@ class BoardUI:
             pygame.draw.line(
                 surface, ladder_color,
                 (x1, y1), (x2, y2),
-                3
+                max(1, round(3 * scale))
             )
     
-    def _draw_snake(self, surface: pygame.Surface, start: int, end: int) -> None:
-        """Draw a snake on the board."""
+    def _draw_snake(self, surface: pygame.Surface, start: int, end: int,
+                    origin: Tuple[int, int]) -> None:
+        """Draw a snake onto a tile whose top-left corner is at ``origin``."""
         # Get start and end positions
-        start_pos = self._get_cell_center(start)
-        end_pos = self._get_cell_center(end)
+        start_pos = self._get_cell_corner(start, origin)
+        end_pos = self._get_cell_corner(end, origin)
+        scale = self.camera.cell_size / const.CELL_SIZE
         
         # Draw snake body with a curved line
-        control_x = (start_pos[0] + end_pos[0]) // 2 + 30
-        control_y = (start_pos[1] + end_pos[1]) // 2 - 40
+        control_x = (start_pos[0] + end_pos[0]) // 2 + 30 * scale
+        control_y = (start_pos[1] + end_pos[1]) // 2 - 40 * scale
         
         # Draw snake body as a curve
         points = [start_pos]
@@ -139,45 +373,87 @@ class BoardUI:
         
         # Draw snake body
         if len(points) > 1:
-            pygame.draw.lines(surface, const.GREEN, False, points, 10)
+            pygame.draw.lines(surface, const.GREEN, False, points, max(1, round(10 * scale)))
         
         # Draw snake head
-        pygame.draw.circle(surface, const.GREEN, start_pos, 8)
+        pygame.draw.circle(surface, const.GREEN, start_pos, max(1, round(8 * scale)))
         
         # Draw eyes on the head
         direction = 1 if start_pos[0] < end_pos[0] else -1
         pygame.draw.circle(
             surface, const.WHITE,
-            (int(start_pos[0] + 3 * direction), int(start_pos[1] - 3)),
-            3
+            (int(start_pos[0] + 3 * scale * direction), int(start_pos[1] - 3 * scale)),
+            max(1, round(3 * scale))
         )
     
-    def _draw_players(self, surface: pygame.Surface) -> None:
-        """Draw all players on the board."""
-        for i, player in enumerate(self.players):
-            if 1 <= player.position <= 100:
-                x, y = player.get_cell_center(
-                    self.board.size,
-                    self.cell_size,
-                    self.window_height
-                )
-                
-                # Offset players so they don't overlap
-                offset = (i - (len(self.players) - 1) / 2) * 20
-                x += offset
+    def draw_players(self, surface: pygame.Surface) -> None:
+        """Draw all players' tokens that are in view.
+        
+        Args:
+            surface: The pygame surface to draw on
+        """
+        colors = self.table.colors
+        names = self.table.names
+        old_clip = surface.get_clip()
+        surface.set_clip(self.camera.viewport)
+        for i in range(len(self.table)):
+            center = self._get_token_center(i)
+            if center is not None:
+                x, y = center
                 
                 # Draw player token
-                pygame.draw.circle(surface, player.color, (int(x), int(y)), const.PLAYER_RADIUS)
+                color = (colors[3 * i], colors[3 * i + 1], colors[3 * i + 2])
+                pygame.draw.circle(surface, color, (int(x), int(y)), const.PLAYER_RADIUS)
                 
                 # Draw player name
-                name_surface = self.font.render(player.name[0], True, const.WHITE)
+                name_surface = text_cache.render(self.font, names[i][0], const.WHITE)
                 name_rect = name_surface.get_rect(center=(x, y))
                 surface.blit(name_surface, name_rect)
+        surface.set_clip(old_clip)
     
-    def _get_cell_center(self, position: int) -> Tuple[int, int]:
-        """Get the center coordinates of a cell."""
-        return self.board.get_cell_coordinates(
-            position,
-            self.cell_size,
-            self.window_height
-        )
+    def _get_token_center(self, index: int) -> Optional[Tuple[float, float]]:
+        """Get where a player's token is drawn on screen, or None if it is out of view."""
+        table = self.table
+        if table.flags[index] & FLAG_ANIMATING:
+            x, y = table.token_x[index], table.token_y[index]
+        elif self.board.is_valid_position(table.positions[index]):
+            x, y = self.board.geometry(self.cell_size, self.world_height).center(
+                table.positions[index])
+        else:
+            return None
+        
+        # Offset players so they don't overlap
+        offset = (index - (len(table) - 1) / 2) * 20
+        x, y = self.camera.to_screen(x, y)
+        x += offset
+        
+        viewport = self.camera.viewport
+        radius = const.PLAYER_RADIUS
+        if not (viewport.left - radius <= x < viewport.right + radius
+                and viewport.top - radius <= y < viewport.bottom + radius):
+            return None
+        return (x, y)
+    
+    def token_rect(self, index: int) -> Optional[pygame.Rect]:
+        """Get the screen area covered by a player's token.
+        
+        Args:
+            index: Index of the player
+        
+        Returns:
+            Optional[pygame.Rect]: The token's bounding box, or None if the
+            player is not on the board or out of view
+        """
+        center = self._get_token_center(index)
+        if center is None:
+            return None
+        size = 2 * const.PLAYER_RADIUS + 4
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(center[0]), int(center[1]))
+        return rect.clip(self.camera.viewport)
+    
+    def _get_cell_corner(self, position: int, origin: Tuple[int, int]) -> Tuple[int, int]:
+        """Get the top-left corner of a cell at the current zoom, relative to ``origin``."""
+        col, top_row = self.jump_index.cells.top_left(position)
+        cell_size = self.camera.cell_size
+        return (col * cell_size - origin[0], top_row * cell_size - origin[1])
@@ -0,0 +1,129 @@
+"""Pan and zoom camera for the Snake and Ladder board."""
+
+from typing import Optional, Tuple
+import pygame
+
+# Limits of the on-screen cell size, in pixels
+MIN_CELL_SIZE = 4
+MAX_CELL_SIZE = 240
+
+class Camera:
+    """Maps board pixels to a viewport on screen, with pan and zoom.
+
+    Board pixels are measured at the unzoomed ``base_cell_size``, with (0, 0)
+    at the board's top-left corner. At the current zoom a cell is
+    ``cell_size`` pixels wide and ``(x, y)`` is the zoomed board pixel shown
+    at the viewport's top-left corner.
+
+    Attributes:
+        viewport: Screen area the board is drawn in
+        board_size: Number of cells per row/column
+        base_cell_size: Cell size in pixels when not zoomed
+        cell_size: Current cell size in pixels
+        x: Zoomed board x coordinate at the viewport's left edge
+        y: Zoomed board y coordinate at the viewport's top edge
+        version: Incremented whenever the view changes
+    """
+
+    def __init__(self, viewport: pygame.Rect, board_size: int, base_cell_size: int):
+        """Initialize the camera at the default view.
+
+        Args:
+            viewport: Screen area the board is drawn in
+            board_size: Number of cells per row/column
+            base_cell_size: Cell size in pixels when not zoomed
+        """
+        self.viewport = pygame.Rect(viewport)
+        self.board_size = board_size
+        self.base_cell_size = base_cell_size
+        self.cell_size = base_cell_size
+        self.x = 0
+        self.y = 0
+        self.version = 0
+        self.reset()
+
+    @property
+    def scale(self) -> float:
+        """Zoom factor relative to the base cell size."""
+        return self.cell_size / self.base_cell_size
+
+    @property
+    def world_size(self) -> int:
+        """Width and height of the board at the current zoom, in pixels."""
+        return self.board_size * self.cell_size
+
+    def reset(self) -> None:
+        """Return to the unzoomed view of the bottom-left corner, where play starts."""
+        self.cell_size = self.base_cell_size
+        self.x = 0
+        self.y = self.world_size - self.viewport.height
+        self._clamp()
+        self.version += 1
+
+    def pan(self, dx: int, dy: int) -> None:
+        """Move the view.
+
+        Args:
+            dx: Screen pixels to move right
+            dy: Screen pixels to move down
+        """
+        old = (self.x, self.y)
+        self.x += int(dx)
+        self.y += int(dy)
+        self._clamp()
+        if (self.x, self.y) != old:
+            self.version += 1
+
+    def zoom(self, factor: float, anchor: Optional[Tuple[int, int]] = None) -> None:
+        """Zoom the view, keeping the board point under ``anchor`` in place.
+
+        Args:
+            factor: Change in cell size (above 1 zooms in)
+            anchor: Screen point to zoom about (default: the viewport's center)
+        """
+        cell_size = round(self.cell_size * factor)
+        if cell_size == self.cell_size:
+            cell_size += 1 if factor > 1 else -1
+        cell_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, cell_size))
+        if cell_size == self.cell_size:
+            return
+
+        ax, ay = anchor if anchor is not None else self.viewport.center
+        ax -= self.viewport.x
+        ay -= self.viewport.y
+        ratio = cell_size / self.cell_size
+        self.x = round((self.x + ax) * ratio - ax)
+        self.y = round((self.y + ay) * ratio - ay)
+        self.cell_size = cell_size
+        self._clamp()
+        self.version += 1
+
+    def to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """Convert a board pixel (at the base cell size) to screen coordinates."""
+        scale = self.cell_size / self.base_cell_size
+        return (x * scale - self.x + self.viewport.x, y * scale - self.y + self.viewport.y)
+
+    def visible_cells(self) -> Tuple[int, int, int, int]:
+        """Get the cells in view.
+
+        Returns:
+            Tuple[int, int, int, int]: First and past-the-end column, and first
+            and past-the-end row counted from the top of the board
+        """
+        size = self.cell_size
+        first_col = max(0, self.x // size)
+        first_row = max(0, self.y // size)
+        end_col = min(self.board_size, -(-(self.x + self.viewport.width) // size))
+        end_row = min(self.board_size, -(-(self.y + self.viewport.height) // size))
+        return first_col, end_col, first_row, end_row
+
+    def _clamp(self) -> None:
+        """Keep the board in view.
+
+        A board larger than the viewport cannot be scrolled past its edges; a
+        smaller one sits in the bottom-left corner.
+        """
+        world = self.world_size
+        width, height = self.viewport.size
+        self.x = min(max(self.x, 0), world - width) if world > width else 0
+        self.y = min(max(self.y, 0), world - height) if world > height else world - height
@@ -0,0 +1,113 @@
+"""Landing-frequency heatmap drawn over the Snake and Ladder board."""
+
+from typing import Callable, Iterable, Tuple
+import numpy as np
+import pygame
+from .. import constants as const
+from ..analysis.landings import landing_stats
+from ..models.board import Board, BoardGeometry
+from .camera import Camera
+from .text_cache import text_cache
+
+# Heat color ramp, from the least to the most landed-on cell
+COLD_COLOR = (40, 90, 255)
+HOT_COLOR = (255, 40, 0)
+HEAT_ALPHA = 140
+
+# Smallest cell size, in pixels, that gets a firing count beside each jump
+MIN_LABEL_CELL = 24
+
+class HeatmapLayer:
+    """Pre-rendered landing frequencies of a board.
+
+    The frequencies come from ``landing_stats`` and are baked once into a
+    translucent image with one pixel per cell, laid out like the board, so
+    drawing it at any zoom is a scale of the cells in view.
+
+    Attributes:
+        board: The board the layer shows
+        stats: Its landing and jump frequencies
+        cells: Translucent heat color of each cell, one pixel per cell
+        peak: Highest landings per game on any cell before the goal
+    """
+
+    def __init__(self, board: Board, geometry: BoardGeometry):
+        """Build the layer.
+
+        Args:
+            board: The game board
+            geometry: The board's layout in cell units (``board.geometry(1, board.size)``)
+        """
+        self.board = board
+        self.stats = landing_stats(board)
+        self.font = pygame.font.SysFont('Arial', 12, bold=True)
+
+        # The goal is landed on in most games, so it would wash out the rest
+        landings = self.stats.landings
+        self.peak = float(landings[1:board.total_cells].max())
+        grid = np.frombuffer(geometry.grid, dtype=np.intc).reshape(board.size, board.size)
+        heat = np.clip(landings[grid] / self.peak, 0.0, 1.0) if self.peak > 0 else np.zeros(grid.shape)
+
+        self.cells = pygame.Surface((board.size, board.size), pygame.SRCALPHA)
+        colors = pygame.surfarray.pixels3d(self.cells)
+        for channel, (cold, hot) in enumerate(zip(COLD_COLOR, HOT_COLOR)):
+            colors[:, :, channel] = (cold + (hot - cold) * heat).T
+        del colors
+        alpha = pygame.surfarray.pixels_alpha(self.cells)
+        alpha[:] = HEAT_ALPHA
+        del alpha
+
+    def draw_cells(self, surface: pygame.Surface, camera: Camera,
+                   visible: Tuple[int, int, int, int]) -> None:
+        """Draw the heat of the cells in view.
+
+        Args:
+            surface: The view to draw on, with the camera's top-left at (0, 0)
+            camera: The board camera
+            visible: The cells in view, from ``camera.visible_cells``
+        """
+        first_col, end_col, first_row, end_row = visible
+        if end_col <= first_col or end_row <= first_row:
+            return
+        cell_size = camera.cell_size
+        area = self.cells.subsurface((first_col, first_row, end_col - first_col, end_row - first_row))
+        scaled = pygame.transform.scale(area, ((end_col - first_col) * cell_size,
+                                               (end_row - first_row) * cell_size))
+        surface.blit(scaled, (first_col * cell_size - camera.x, first_row * cell_size - camera.y))
+
+    def draw_labels(self, surface: pygame.Surface, camera: Camera,
+                    jumps: Iterable[Tuple[int, int, bool]],
+                    corner: Callable[[int], Tuple[int, int]]) -> None:
+        """Label each snake and ladder in view with how often it fires per game.
+
+        Args:
+            surface: The view to draw on
+            camera: The board camera
+            jumps: The jumps in view, as ``(start, end, is_snake)``
+            corner: Function giving a cell's top-left corner on ``surface``
+        """
+        if camera.cell_size < MIN_LABEL_CELL:
+            return
+        for start, _, is_snake in jumps:
+            color = const.GREEN if is_snake else (139, 69, 19)
+            text = text_cache.render(self.font, f"{self.stats.fires[start]:.2f}", const.WHITE)
+            x, y = corner(start)
+            badge = text.get_rect(topleft=(x + 2, y + 2)).inflate(4, 2)
+            pygame.draw.rect(surface, color, badge)
+            surface.blit(text, text.get_rect(center=badge.center))
+
+    def draw_legend(self, surface: pygame.Surface) -> None:
+        """Draw the scale of the heat colors in the view's top-right corner."""
+        if self.stats.exact:
+            source = "exact"
+        elif self.stats.cut_off:
+            source = f"simulated, {self.stats.cut_off:.0%} of games cut off"
+        else:
+            source = "simulated"
+        text = text_cache.render(self.font, f"Landings/game ({source}): 0 - {self.peak:.2f}",
+                                 const.WHITE)
+        box = text.get_rect(topright=(surface.get_width() - 6, 6)).inflate(8, 4)
+        legend = pygame.Surface(box.size, pygame.SRCALPHA)
+        legend.fill((0, 0, 0, 170))
+        surface.blit(legend, box)
+        surface.blit(text, text.get_rect(center=box.center))
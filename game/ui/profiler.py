@@ -0,0 +1,275 @@
+"""Frame profiler and performance overlay for the Snake and Ladder game."""
+
+import json
+import time
+from array import array
+from typing import Dict, List, Optional, Tuple
+import pygame
+from .. import constants as const
+
+# Seconds between refreshes of the overlay text
+OVERLAY_REFRESH = 0.25
+
+class RingBuffer:
+    """Fixed-size buffer of the most recent float samples.
+
+    Attributes:
+        count: Total number of samples ever added
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the buffer.
+
+        Args:
+            capacity: Number of samples kept
+        """
+        self._values = array('d', [0.0]) * capacity
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """Add a sample, overwriting the oldest once the buffer is full."""
+        self._values[self.count % len(self._values)] = value
+        self.count += 1
+
+    def __len__(self) -> int:
+        """Get the number of samples held."""
+        return min(self.count, len(self._values))
+
+    def values(self) -> List[float]:
+        """Get the samples held, oldest first."""
+        capacity = len(self._values)
+        if self.count <= capacity:
+            return self._values[:self.count].tolist()
+        start = self.count % capacity
+        return (self._values[start:] + self._values[:start]).tolist()
+
+    def total(self) -> float:
+        """Get the sum of the samples held."""
+        return sum(self._values[:len(self)])
+
+    def mean(self) -> float:
+        """Get the mean of the samples held (0 if empty)."""
+        size = len(self)
+        return sum(self._values[:size]) / size if size else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Get a percentile of the samples held (0 if empty).
+
+        Args:
+            fraction: The percentile as a fraction (0.99 for p99)
+        """
+        size = len(self)
+        if not size:
+            return 0.0
+        ordered = sorted(self._values[:size])
+        return ordered[min(size - 1, int(fraction * size))]
+
+
+class FrameProfiler:
+    """Records per-phase frame timings into fixed-size ring buffers.
+
+    The game loop calls ``begin_frame`` and then ``mark`` at the end of each
+    phase; each mark records the time since the previous one. Samples older
+    than ``capacity`` frames are overwritten, so memory use is constant.
+
+    Attributes:
+        capacity: Number of frames kept
+        frames: Total frame durations
+        phases: Phase durations by phase name
+        latency: Input-to-first-dice-frame latencies
+    """
+
+    def __init__(self, capacity: int = 600):
+        """Initialize the profiler.
+
+        Args:
+            capacity: Number of frames of history to keep
+        """
+        self.capacity = capacity
+        self.frames = RingBuffer(capacity)
+        self.phases: Dict[str, RingBuffer] = {}
+        self.latency = RingBuffer(capacity)
+        # Start times of every sample, for the trace
+        self._starts: Dict[str, RingBuffer] = {}
+        self._origin = time.perf_counter()
+        self._frame_start = self._origin
+        self._cursor = self._origin
+        self._input_time: Optional[float] = None
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        self._frame_start = self._cursor = time.perf_counter()
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as ``phase``."""
+        now = time.perf_counter()
+        self.record(phase, self._cursor, now - self._cursor)
+        self._cursor = now
+
+    def end_frame(self) -> None:
+        """Finish timing the frame started by ``begin_frame``."""
+        self.record('frame', self._frame_start, self._cursor - self._frame_start)
+
+    def record(self, phase: str, start: float, duration: float) -> None:
+        """Record a duration that did not come from ``mark``.
+
+        Args:
+            phase: Name of the phase
+            start: ``time.perf_counter()`` when it started
+            duration: Its duration in seconds
+        """
+        if phase == 'frame':
+            samples = self.frames
+        else:
+            samples = self.phases.get(phase)
+            if samples is None:
+                samples = self.phases[phase] = RingBuffer(self.capacity)
+        starts = self._starts.get(phase)
+        if starts is None:
+            starts = self._starts[phase] = RingBuffer(self.capacity)
+        samples.add(duration)
+        starts.add(start)
+
+    def input_received(self) -> None:
+        """Note an input whose response latency should be measured.
+
+        The input is timed from the start of the frame that handled it,
+        which is the closest the loop knows to when it arrived.
+        """
+        self._input_time = self._frame_start
+
+    def frame_presented(self) -> None:
+        """Note that a frame reached the screen, completing any pending latency."""
+        if self._input_time is not None:
+            self.latency.add(time.perf_counter() - self._input_time)
+            self._input_time = None
+
+    def fps(self) -> float:
+        """Get the frame rate over the frames held."""
+        mean = self.frames.mean()
+        return 1.0 / mean if mean > 0 else 0.0
+
+    def slowest_phase(self) -> Optional[Tuple[str, float]]:
+        """Get the phase taking the most time per frame, excluding the frame tick.
+
+        Phases are compared by their total time spread over the frames held,
+        so a rare but slow phase (such as a layer rebuild) does not outrank
+        one that runs every frame. A phase named after another one plus a
+        dot (``render.board.grid`` in ``render.board``) runs inside it, so
+        its time is taken off the parent's rather than counted twice.
+
+        Returns:
+            Optional[Tuple[str, float]]: (phase, seconds per frame), or None
+            if nothing has been recorded
+        """
+        frames = len(self.frames)
+        totals = {phase: samples.total() for phase, samples in self.phases.items()
+                  if phase != 'tick' and len(samples)}
+        if not totals or not frames:
+            return None
+
+        own = dict(totals)
+        for phase, total in totals.items():
+            parent = phase
+            while '.' in parent:
+                parent = parent.rsplit('.', 1)[0]
+                if parent in own:
+                    own[parent] -= total
+                    break
+        phase = max(own, key=own.get)
+        return phase, max(0.0, own[phase]) / frames
+
+    def summary(self) -> List[str]:
+        """Get the lines shown by the overlay."""
+        lines = [
+            f"FPS {self.fps():5.1f}",
+            f"frame p50 {self.frames.percentile(0.5) * 1000:5.2f} ms  "
+            f"p99 {self.frames.percentile(0.99) * 1000:5.2f} ms",
+        ]
+        slowest = self.slowest_phase()
+        if slowest is not None:
+            lines.append(f"slowest {slowest[0]} {slowest[1] * 1000:5.2f} ms")
+        if len(self.latency):
+            lines.append(f"input to dice {self.latency.percentile(0.5) * 1000:5.1f} ms")
+        return lines
+
+    def trace_events(self) -> List[Dict]:
+        """Get the recorded samples as Chrome trace events."""
+        events = []
+        for phase, starts in self._starts.items():
+            samples = self.frames if phase == 'frame' else self.phases[phase]
+            thread = 0 if phase == 'frame' else 1
+            for start, duration in zip(starts.values(), samples.values()):
+                events.append({
+                    'name': phase,
+                    'ph': 'X',
+                    'ts': (start - self._origin) * 1e6,
+                    'dur': duration * 1e6,
+                    'pid': 0,
+                    'tid': thread,
+                })
+        events.sort(key=lambda event: event['ts'])
+        return events
+
+    def dump_trace(self, path: str) -> None:
+        """Write the recorded samples in Chrome trace-event format.
+
+        The file can be opened in chrome://tracing or Perfetto.
+
+        Args:
+            path: File to write
+        """
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+
+
+class ProfilerOverlay:
+    """Draws a profiler's summary in a translucent box on top of the game."""
+
+    def __init__(self, profiler: FrameProfiler, position: Tuple[int, int] = (10, 10)):
+        """Initialize the overlay.
+
+        Args:
+            profiler: The profiler to show
+            position: Top-left corner of the overlay on screen
+        """
+        self.profiler = profiler
+        self.position = position
+        self.font = pygame.font.SysFont('Arial', 14)
+        self._surface: Optional[pygame.Surface] = None
+        self._refreshed = 0.0
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """The screen area covered by the overlay."""
+        if self._surface is None:
+            return pygame.Rect(self.position, (0, 0))
+        return self._surface.get_rect(topleft=self.position)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the overlay, refreshing its text a few times a second.
+
+        Args:
+            surface: The pygame surface to draw on
+        """
+        now = time.perf_counter()
+        if self._surface is None or now - self._refreshed >= OVERLAY_REFRESH:
+            self._surface = self._render()
+            self._refreshed = now
+        surface.blit(self._surface, self.position)
+
+    def _render(self) -> pygame.Surface:
+        """Render the summary into a new surface."""
+        # Rendered directly: the text changes constantly and would only churn
+        # the shared text cache
+        lines = [self.font.render(line, True, const.WHITE) for line in self.profiler.summary()]
+        padding = 6
+        width = max(line.get_width() for line in lines) + 2 * padding
+        height = sum(line.get_height() for line in lines) + 2 * padding
+        box = pygame.Surface((width, height), pygame.SRCALPHA)
+        box.fill((0, 0, 0, 170))
+        y = padding
+        for line in lines:
+            box.blit(line, (padding, y))
+            y += line.get_height()
+        return box
@@ -1,24 +1,35 @@
 """Sidebar UI for the Snake and Ladder game."""
 
 import pygame
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 from ..models.player import Player
 from .. import constants as const
+from .text_cache import text_cache
 
 class SidebarUI:
     """Handles rendering of the game sidebar."""
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, goal: int):
         """Initialize the sidebar UI.
         
         Args:
             width: Width of the sidebar
             height: Height of the sidebar (should match window height)
+            goal: The board's winning cell (``Board.total_cells``)
         """
         self.width = width
         self.height = height
+        self.goal = goal
         self.padding = 20
         
+        # Screen areas that change during play, for partial display updates
+        self.turn_rect = pygame.Rect(const.SIDEBAR_X, 105, width, 30)
+        self.dice_rect = pygame.Rect(
+            const.SIDEBAR_X + (width - const.DICE_SIZE) // 2, 200,
+            const.DICE_SIZE + 5, const.DICE_SIZE + 5
+        )
+        self.odds_rect = pygame.Rect(const.SIDEBAR_X + 2, 668, width - 2, height - 668)
+        
         # Initialize fonts
         self.title_font = pygame.font.SysFont('Arial', 28, bold=True)
         self.header_font = pygame.font.SysFont('Arial', 24, bold=True)
@@ -26,7 +37,9 @@ class SidebarUI:
         self.small_font = pygame.font.SysFont('Arial', 16)
     
     def draw(self, surface: pygame.Surface, current_player: Player, dice_value: int, 
-             game_over: bool = False, winner: Optional[Player] = None) -> None:
+             game_over: bool = False, winner: Optional[Player] = None,
+             players: Optional[List[Player]] = None,
+             win_chances: Optional[Sequence[float]] = None) -> None:
         """Draw the sidebar.
         
         Args:
@@ -35,6 +48,8 @@ class SidebarUI:
             dice_value: Current dice value to display
             game_over: Whether the game is over
             winner: The winning player (if game is over)
+            players: All players, in seat order
+            win_chances: Each player's chance of winning (no panel if None)
         """
         # Draw background
         self._draw_background(surface)
@@ -54,6 +69,10 @@ class SidebarUI:
         
         # Draw instructions
         self._draw_instructions(surface)
+        
+        # Draw win chances
+        if players and win_chances is not None:
+            self._draw_win_chances(surface, players, win_chances)
     
     def _draw_background(self, surface: pygame.Surface) -> None:
         """Draw the sidebar background."""
@@ -68,27 +87,27 @@ class SidebarUI:
         """Draw the game title."""
         # Draw title (positioned in the sidebar)
         x = const.SIDEBAR_X
-        title = self.title_font.render("Snake & Ladder", True, const.BLACK)
+        title = text_cache.render(self.title_font, "Snake & Ladder", const.BLACK)
         title_rect = title.get_rect(center=(x + self.width // 2, 40))
         surface.blit(title, title_rect)
     
     def _draw_player_info(self, surface: pygame.Surface, player: Player) -> None:
         """Draw information about the current player."""
         # Draw section header
-        header = self.header_font.render("Current Turn", True, const.BLACK)
+        header = text_cache.render(self.header_font, "Current Turn", const.BLACK)
         surface.blit(header, (const.SIDEBAR_X + self.padding, 80))
         
         # Draw player info
         x = const.SIDEBAR_X
         player_text = f"{player.name}'s Turn"
-        text_surface = self.font.render(player_text, True, player.color)
+        text_surface = text_cache.render(self.font, player_text, player.color)
         text_rect = text_surface.get_rect(center=(x + self.width // 2, 120))
         surface.blit(text_surface, text_rect)
     
     def _draw_dice(self, surface: pygame.Surface, value: int) -> None:
         """Draw the dice."""
         # Draw section header
-        header = self.header_font.render("Dice", True, const.BLACK)
+        header = text_cache.render(self.header_font, "Dice", const.BLACK)
         surface.blit(header, (const.SIDEBAR_X + self.padding, 160))
         
         # Draw dice background (centered in the sidebar)
@@ -175,9 +194,9 @@ class SidebarUI:
         surface.blit(overlay, (0, 0))
         
         # Draw game over text
-        game_over_text = self.header_font.render("GAME OVER", True, const.WHITE)
-        winner_text = self.font.render(f"{winner.name} wins!", True, const.WHITE)
-        restart_text = self.small_font.render("Press R to restart", True, const.WHITE)
+        game_over_text = text_cache.render(self.header_font, "GAME OVER", const.WHITE)
+        winner_text = text_cache.render(self.font, f"{winner.name} wins!", const.WHITE)
+        restart_text = text_cache.render(self.small_font, "Press R to restart", const.WHITE)
         
         # Center the text
         center_x = self.width // 2
@@ -194,32 +213,62 @@ class SidebarUI:
         """Draw game instructions."""
         # Draw section header
         x = const.SIDEBAR_X
-        header = self.header_font.render("How to Play", True, const.BLACK)
-        surface.blit(header, (x + self.padding, 340))
+        header = text_cache.render(self.header_font, "How to Play", const.BLACK)
+        surface.blit(header, (x + self.padding, 325))
         
         # Draw instructions
         instructions = [
             "• Click the dice to roll",
             "• Land on ladders to climb up",
             "• Avoid snakes or slide down",
-            "• First to reach 100 wins!",
+            f"• First to reach {self.goal} wins!",
             "",
             "Controls:",
             "SPACE: Roll dice",
             "R: Restart game",
+            "H: Landing heatmap",
+            "Arrows: Pan board",
+            "+/-: Zoom",
+            "Home: Reset view",
+            "F3: Profiler overlay",
             "Q/ESC: Quit"
         ]
         
-        y_offset = 380
-        line_height = 24
+        # Tight enough to leave room for the win chances below
+        y_offset = 360
+        line_height = 18
         
         for i, line in enumerate(instructions):
             if line.endswith(':'):
                 # Header line
-                text = self.font.render(line, True, const.BLACK)
+                text = text_cache.render(self.font, line, const.BLACK)
                 surface.blit(text, (const.SIDEBAR_X + self.padding, y_offset + i * line_height))
             else:
                 # Regular line
                 x = const.SIDEBAR_X
-                text = self.small_font.render(line, True, const.DARK_GRAY)
+                text = text_cache.render(self.small_font, line, const.DARK_GRAY)
                 surface.blit(text, (x + self.padding + 10, y_offset + i * line_height))
+    
+    def _draw_win_chances(self, surface: pygame.Surface, players: List[Player],
+                          chances: Sequence[float]) -> None:
+        """Draw each player's chance of winning as a bar and a percentage."""
+        # Draw section header
+        x = const.SIDEBAR_X
+        header = text_cache.render(self.header_font, "Win Chances", const.BLACK)
+        surface.blit(header, (x + self.padding, 632))
+        
+        bar_x = x + 120
+        bar_width = 110
+        line_height = 26
+        for i, (player, chance) in enumerate(zip(players, chances)):
+            y = self.odds_rect.y + 5 + i * line_height
+            name = text_cache.render(self.small_font, player.name, player.color)
+            surface.blit(name, (x + self.padding + 10, y))
+            
+            # Draw bar
+            bar_y = y + (name.get_height() - 12) // 2
+            pygame.draw.rect(surface, const.GRAY, (bar_x, bar_y, bar_width, 12))
+            pygame.draw.rect(surface, player.color, (bar_x, bar_y, round(bar_width * chance), 12))
+            
+            percent = text_cache.render(self.small_font, f"{chance:.1%}", const.DARK_GRAY)
+            surface.blit(percent, (bar_x + bar_width + 8, y))
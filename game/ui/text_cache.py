@@ -0,0 +1,73 @@
+"""Shared cache of rendered text surfaces for the Snake and Ladder game."""
+
+from collections import OrderedDict
+from typing import Tuple
+import pygame
+
+class TextCache:
+    """LRU cache of rendered text, keyed by (font, text, color, antialias).
+
+    Attributes:
+        max_size: Maximum number of surfaces kept
+        hits: Number of renders served from the cache
+        misses: Number of renders that had to call ``font.render``
+    """
+
+    def __init__(self, max_size: int = 256):
+        """Initialize the text cache.
+
+        Args:
+            max_size: Maximum number of surfaces kept before the least
+                recently used one is evicted
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+
+    def render(self, font: pygame.font.Font, text: str, color: Tuple[int, ...],
+               antialias: bool = True) -> pygame.Surface:
+        """Get a rendered text surface, rendering it only on a cache miss.
+
+        The returned surface is shared and must not be modified.
+
+        Args:
+            font: The font to render with
+            text: The text to render
+            color: The text color as an RGB tuple
+            antialias: Whether to antialias the text
+
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def __len__(self) -> int:
+        """Get the number of cached surfaces."""
+        return len(self._surfaces)
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Drop all cached surfaces and reset the counters."""
+        self._surfaces.clear()
+        self.reset_stats()
+
+
+# Cache shared by all UI components
+text_cache = TextCache()
@@ -0,0 +1,92 @@
+"""Tests for the board's jump table, move resolution and cell layout."""
+
+import pytest
+from game.models.board import Board, BoardGeometry, JUMP_BLOCKED, JUMP_LADDER, JUMP_NONE, JUMP_SNAKE
+
+
+def test_plain_snake_and_ladder():
+    """Landing on a snake head or ladder foot follows it."""
+    board = Board({17: 7}, {4: 14}, 5)
+    assert board.resolve_move(0, 4) == (14, JUMP_LADDER)
+    assert board.resolve_move(12, 5) == (7, JUMP_SNAKE)
+    assert board.resolve_move(12, 3) == (15, JUMP_NONE)
+
+
+def test_chained_jumps_resolve_to_the_end():
+    """A ladder ending on a snake head takes the token down the snake too."""
+    board = Board({14: 2, 20: 15}, {4: 14, 10: 20}, 5)
+    # 4 climbs to 14, whose snake drops to 2: a net fall
+    assert board.resolve_move(1, 3) == (2, JUMP_SNAKE)
+    # 10 climbs to 20, whose snake only drops to 15: still a net climb
+    assert board.resolve_move(5, 5) == (15, JUMP_LADDER)
+    assert board.jumps == {4: (2, JUMP_SNAKE), 14: (2, JUMP_SNAKE),
+                           10: (15, JUMP_LADDER), 20: (15, JUMP_SNAKE)}
+
+
+def test_exact_roll_needed_for_the_goal():
+    """Overshooting the last cell leaves the token where it is."""
+    board = Board({}, {}, 5)
+    assert board.resolve_move(22, 3) == (25, JUMP_NONE)
+    assert board.resolve_move(22, 4) == (22, JUMP_BLOCKED)
+    assert board.resolve_move(25, 1) == (25, JUMP_BLOCKED)
+
+
+def test_loops_are_rejected():
+    """Snakes and ladders that send a token round forever are refused."""
+    with pytest.raises(ValueError, match="loop"):
+        Board({14: 4}, {4: 14}, 5)
+    with pytest.raises(ValueError, match="loop"):
+        Board({20: 10, 15: 5}, {10: 15, 5: 20}, 5)
+
+
+@pytest.mark.parametrize('snakes, ladders', [
+    ({26: 3}, {}),
+    ({3: 0}, {}),
+    ({}, {4: 30}),
+    ({}, {7: 7}),
+])
+def test_jumps_off_the_board_are_rejected(snakes, ladders):
+    """Jumps must start and end on the board's cells and go somewhere."""
+    with pytest.raises(ValueError, match="Invalid jump"):
+        Board(snakes, ladders, 5)
+
+
+@pytest.mark.parametrize('size', [4, 1001])
+def test_unsupported_sizes_are_rejected(size):
+    """Board sizes outside MIN_SIZE to MAX_SIZE are refused."""
+    with pytest.raises(ValueError):
+        Board({}, {}, size)
+
+
+def test_geometry_lays_cells_out_in_a_serpentine():
+    """Rows run left to right from the bottom, turning back on each new row."""
+    geometry = BoardGeometry(5, 10, 60)
+    assert geometry.top == 10
+    assert geometry.top_left(1) == (0, 50)
+    assert geometry.top_left(5) == (40, 50)
+    assert geometry.top_left(6) == (40, 40)
+    assert geometry.top_left(25) == (40, 10)
+    assert geometry.center(6) == (45, 45)
+    assert geometry.top_left(0) == geometry.center(26) == (0, 0)
+    # The grid is indexed from the top row down
+    assert list(geometry.grid[:5]) == [21, 22, 23, 24, 25]
+    assert list(geometry.grid[-5:]) == [1, 2, 3, 4, 5]
+
+
+def test_position_at_inverts_the_layout():
+    """Every pixel of a cell maps back to that cell's position."""
+    geometry = BoardGeometry(5, 10, 60)
+    for position in range(1, 26):
+        x, y = geometry.top_left(position)
+        assert geometry.position_at(x, y) == position
+        assert geometry.position_at(x + 9, y + 9) == position
+        assert geometry.position_at(*geometry.center(position)) == position
+
+
+def test_position_at_off_the_board():
+    """Pixels outside the board have no position."""
+    geometry = BoardGeometry(5, 10, 60)
+    assert geometry.position_at(5, 5) is None
+    assert geometry.position_at(50, 30) is None
+    assert geometry.position_at(-1, 30) is None
+    assert geometry.position_at(5, 60) is None
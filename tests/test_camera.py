@@ -0,0 +1,71 @@
+"""Tests for the board camera's zoom, pan limits and culling."""
+
+import pygame
+from game.ui.camera import Camera, MAX_CELL_SIZE, MIN_CELL_SIZE
+
+
+def make_camera() -> Camera:
+    """A 10x10 board of 20-pixel cells seen through a 100x100 viewport."""
+    return Camera(pygame.Rect(0, 0, 100, 100), 10, 20)
+
+
+def test_reset_shows_the_bottom_left_corner():
+    """The default view starts where play starts."""
+    camera = make_camera()
+    assert (camera.x, camera.y) == (0, 100)
+    assert camera.cell_size == 20
+    assert camera.to_screen(0, 200) == (0, 100)
+
+
+def test_zoom_is_clamped():
+    """Zooming stops at the smallest and largest cell sizes."""
+    camera = make_camera()
+    camera.zoom(1000)
+    assert camera.cell_size == MAX_CELL_SIZE
+    version = camera.version
+    camera.zoom(2)
+    assert camera.cell_size == MAX_CELL_SIZE
+    assert camera.version == version
+    camera.zoom(0.001)
+    assert camera.cell_size == MIN_CELL_SIZE
+
+
+def test_zoom_keeps_the_anchor_in_place():
+    """The board point under the anchor stays under it after zooming."""
+    camera = Camera(pygame.Rect(50, 10, 100, 100), 10, 20)
+    camera.zoom(2, anchor=(50, 110))
+    assert camera.cell_size == 40
+    assert camera.to_screen(0, 200) == (50, 110)
+
+
+def test_pan_stops_at_the_board_edges():
+    """A board larger than the viewport cannot be scrolled past its edges."""
+    camera = make_camera()
+    camera.pan(1000, 1000)
+    assert (camera.x, camera.y) == (100, 100)
+    camera.pan(-1000, -1000)
+    assert (camera.x, camera.y) == (0, 0)
+    version = camera.version
+    camera.pan(-5, -5)
+    assert camera.version == version
+
+
+def test_small_board_sits_in_the_bottom_left_corner():
+    """A board smaller than the viewport cannot be panned at all."""
+    camera = make_camera()
+    camera.zoom(0.25)
+    assert camera.cell_size == 5
+    assert (camera.x, camera.y) == (0, -50)
+    camera.pan(30, 30)
+    assert (camera.x, camera.y) == (0, -50)
+    assert camera.to_screen(0, 200) == (0, 100)
+
+
+def test_visible_cells_cover_only_the_viewport():
+    """Culling keeps the cells the viewport overlaps, partly or fully."""
+    camera = make_camera()
+    assert camera.visible_cells() == (0, 5, 5, 10)
+    camera.pan(10, -10)
+    assert camera.visible_cells() == (0, 6, 4, 10)
+    camera.zoom(0.25)
+    assert camera.visible_cells() == (0, 10, 0, 10)
@@ -0,0 +1,63 @@
+"""Tests for the seeded dice sources."""
+
+import numpy as np
+import pytest
+from game.core.dice import MultiDice, StandardDice, WeightedDice
+
+
+def make(kind, seed=7):
+    """Create a die of one of the kinds under test with a small block size."""
+    if kind == 'standard':
+        return StandardDice(seed=seed, block_size=16)
+    if kind == 'weighted':
+        return WeightedDice([1, 2, 3, 0, 5, 1], seed=seed, block_size=16)
+    return MultiDice(3, seed=seed, block_size=16)
+
+
+@pytest.mark.parametrize('kind', ['standard', 'weighted', 'multi'])
+@pytest.mark.parametrize('draws', [0, 5, 16, 17, 50])
+def test_seek_matches_drawing(kind, draws):
+    """Seeking past N draws continues the stream exactly where rolling N times would."""
+    rolled = make(kind)
+    for _ in range(draws):
+        rolled.roll()
+    sought = make(kind)
+    sought.seek(draws)
+    assert sought.draws == draws
+    assert [sought.roll() for _ in range(40)] == [rolled.roll() for _ in range(40)]
+
+
+@pytest.mark.parametrize('kind', ['standard', 'weighted', 'multi'])
+def test_seek_back_and_to_another_seed(kind):
+    """Seeking backwards or to a new seed replays that seed's stream from the start."""
+    reference = make(kind, seed=3)
+    expected = [reference.roll() for _ in range(30)]
+
+    die = make(kind)
+    for _ in range(25):
+        die.roll()
+    die.seek(10, seed=3)
+    assert [die.roll() for _ in range(20)] == expected[10:]
+    die.seek(2)
+    assert [die.roll() for _ in range(5)] == expected[2:7]
+
+
+def test_alias_frequencies_match_weights():
+    """Alias-sampled faces come up in proportion to their weights."""
+    weights = np.array([1, 2, 3, 0, 5, 1], dtype=float)
+    die = WeightedDice(weights, seed=11, block_size=4096)
+    count = 120000
+    rolls = np.array([die.roll() for _ in range(count)])
+    frequencies = np.bincount(rolls, minlength=7)[1:] / count
+    expected = weights / weights.sum()
+    assert frequencies[3] == 0
+    # Five standard errors of a binomial share
+    assert np.all(np.abs(frequencies - expected) <= 5 * np.sqrt(expected * (1 - expected) / count))
+
+
+def test_weighted_dice_rejects_bad_weights():
+    """Negative or all-zero weights are refused."""
+    with pytest.raises(ValueError):
+        WeightedDice([1, -1, 1])
+    with pytest.raises(ValueError):
+        WeightedDice([0, 0])
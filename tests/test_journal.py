@@ -0,0 +1,90 @@
+"""Tests for recording games to a journal and seeking back into them."""
+
+import os
+import pytest
+from game import constants as const
+from game.core.game_logic import GameLogic
+from game.core.journal import GameJournal, JournalReader, index_path
+from game.models.board import Board, JUMP_BLOCKED
+from game.models.player import Player
+
+BOARD = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+
+
+def new_game(seed=11, journal=None):
+    """Create a two-player game on the standard board (seed 11 overshoots in its first game)."""
+    players = [Player("Player 1", const.RED), Player("Player 2", const.BLUE)]
+    return GameLogic(players, BOARD, seed=seed, journal=journal)
+
+
+def record(path, games=2, snapshot_interval=8):
+    """Play whole games into a journal and return the snapshot after every turn."""
+    snapshots = []
+    with GameJournal(path, snapshot_interval) as journal:
+        logic = new_game(journal=journal)
+        for game in range(games):
+            if game:
+                logic.reset()
+            states = [logic.snapshot()]
+            while not logic.state.game_over:
+                logic.play_turn()
+                states.append(logic.snapshot())
+            snapshots.append(states)
+    return snapshots
+
+
+def test_records_every_turn(tmp_path):
+    """Every turn is recorded in order, overshoots included."""
+    path = str(tmp_path / 'games.slj')
+    snapshots = record(path)
+    records = list(JournalReader(path).records())
+    assert [r.turn for r in records if r.game == 0] == list(range(1, len(snapshots[0])))
+    assert any(r.jump == JUMP_BLOCKED and r.start == r.end for r in records)
+
+
+@pytest.mark.parametrize('game', [0, 1])
+def test_seek_matches_play(tmp_path, game):
+    """Seeking to any turn gives the state the game had after playing it."""
+    path = str(tmp_path / 'games.slj')
+    snapshots = record(path)
+    reader = JournalReader(path)
+    for turn in (0, 1, 7, 8, 9, len(snapshots[game]) - 1):
+        logic = new_game(seed=99)
+        assert reader.seek(logic, game, turn) == turn
+        assert logic.snapshot() == snapshots[game][turn]
+
+    # Replaying the whole game leaves it over, with the dice in step
+    logic = new_game(seed=99)
+    assert reader.seek(logic, game) == len(snapshots[game]) - 1
+    assert logic.state.game_over
+    assert logic.snapshot() == snapshots[game][-1]
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    """A journal cut off mid-frame reads up to the last whole frame."""
+    path = str(tmp_path / 'games.slj')
+    snapshots = record(path, games=1)
+    records = list(JournalReader(path).records())
+
+    # Cut into the last snapshot frame, which the index still points at
+    with open(index_path(path), 'rb') as index:
+        index.seek(-8, os.SEEK_END)
+        last_snapshot = int.from_bytes(index.read(8), 'little')
+    with open(path, 'r+b') as f:
+        f.truncate(last_snapshot + 5)
+
+    reader = JournalReader(path)
+    kept = list(reader.records())
+    assert kept == [r for r in records if r.turn <= kept[-1].turn]
+    logic = new_game(seed=99)
+    reached = reader.seek(logic, 0)
+    assert reached == kept[-1].turn
+    assert logic.snapshot() == snapshots[0][reached]
+
+
+def test_unknown_game(tmp_path):
+    """Seeking to a game that was never recorded raises ValueError."""
+    path = str(tmp_path / 'games.slj')
+    record(path, games=1)
+    with pytest.raises(ValueError):
+        JournalReader(path).seek(new_game(), 3)
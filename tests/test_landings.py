@@ -0,0 +1,19 @@
+"""Tests for the landing frequencies behind the heatmap."""
+
+import math
+from game.analysis.landings import landing_stats
+from game.analysis.markov import MAX_DENSE_CELLS
+from game.models.board import Board
+
+
+def test_simulated_board_reaches_the_goal():
+    """A board too large to solve exactly still gets heat right up to the goal."""
+    size = math.isqrt(MAX_DENSE_CELLS) + 1
+    board = Board({3 * size: size}, {2 * size: 5 * size}, size)
+    stats = landing_stats(board)
+    goal = board.total_cells
+    assert not stats.exact
+    assert stats.cut_off == 0.0
+    assert (stats.landings[goal - 6:goal] > 0).all()
+    # Every simulated game ends on the goal exactly once
+    assert stats.landings[goal] == 1.0
@@ -0,0 +1,31 @@
+"""Tests for the exact turn statistics of a board."""
+
+import pytest
+from game.analysis.markov import MAX_DENSE_CELLS, solve_board
+from game.analysis.optimizer import optimize_layout
+from game.models.board import Board
+
+
+def test_large_board_is_refused():
+    """Boards past MAX_DENSE_CELLS raise instead of building dense matrices."""
+    with pytest.raises(ValueError):
+        solve_board(Board({}, {}, 1000))
+    with pytest.raises(ValueError):
+        optimize_layout(size=int(MAX_DENSE_CELLS ** 0.5) + 1, iterations=1, chains=1, processes=1)
+
+
+def test_empty_board_finishes_from_every_cell():
+    """On a board with no jumps every start cell finishes in a finite mean time."""
+    solution = solve_board(Board({}, {}, 5))
+    assert solution.expected_turns[-1] == 0.0
+    assert (solution.expected_turns[:-1] > 0).all()
+
+
+def test_length_distribution_respects_each_cap():
+    """Asking again with a different turn cap doesn't return the first answer."""
+    solution = solve_board(Board({}, {}, 10))
+    short = solution.length_distribution(0, max_turns=5)
+    full = solution.length_distribution(0)
+    assert len(short) == 6
+    assert len(full) > len(short)
+    assert full.sum() == pytest.approx(1.0)
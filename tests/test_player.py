@@ -0,0 +1,54 @@
+"""Tests for the struct-of-arrays player table."""
+
+import pytest
+from game.models.player import Player, PlayerTable
+
+
+def test_gather_reuses_a_matching_table():
+    """Players already sharing a table in the same order keep it."""
+    table = PlayerTable()
+    players = [table.add("Ann", (255, 0, 0)), table.add("Bob", (0, 0, 255))]
+    assert PlayerTable.gather(players) is table
+
+
+@pytest.mark.parametrize('order', [(0, 1), (1, 0)])
+def test_gather_rebinds_separate_players(order):
+    """Players from separate tables are copied into one and keep working."""
+    ann = Player("Ann", (255, 0, 0), position=12)
+    bob = Player("Bob", (0, 0, 255), position=40)
+    bob.is_animating = True
+    bob.token_pos = (15.0, 25.0)
+    players = [(ann, bob)[i] for i in order]
+
+    table = PlayerTable.gather(players)
+    assert len(table) == 2
+    assert [table[row] for row in range(2)] == players
+    assert list(table.positions) == [p.position for p in players]
+    assert bob.is_animating and not ann.is_animating
+    assert bob.token_pos == (15.0, 25.0)
+    assert bob.color == (0, 0, 255) and bob.name == "Bob"
+
+    # The views now write through to the shared table
+    ann.position = 30
+    assert table.positions[players.index(ann)] == 30
+    assert PlayerTable.gather(players) is table
+
+
+def test_gather_subset_of_a_table():
+    """Gathering some of a table's players makes a table of just those."""
+    table = PlayerTable()
+    players = [table.add(name, (0, 0, 0), position) for name, position in
+               [("Ann", 1), ("Bob", 2), ("Cy", 3)]]
+    gathered = PlayerTable.gather(players[::2])
+    assert gathered is not table
+    assert list(gathered.positions) == [1, 3]
+    assert gathered.names == ["Ann", "Cy"]
+
+
+def test_rect_follows_the_token():
+    """rect is rebuilt around token_pos on every access."""
+    player = Player("Ann", (255, 0, 0))
+    player.token_pos = (100.0, 50.0)
+    assert player.rect.center == (100, 50)
+    player.rect.center = (0, 0)
+    assert player.rect.center == (100, 50)
@@ -0,0 +1,40 @@
+"""Tests for the frame profiler's phase ranking."""
+
+from game.ui.profiler import FrameProfiler
+
+
+def profile(phases, frames=10):
+    """Record the same phase durations, in milliseconds, for several frames."""
+    profiler = FrameProfiler(capacity=frames)
+    for frame in range(frames):
+        for phase, duration in phases.items():
+            profiler.record(phase, frame, duration / 1000)
+        profiler.record('frame', frame, sum(phases.values()) / 1000)
+    return profiler
+
+
+def test_slowest_phase_per_frame():
+    """The phase with the most time per frame wins, and the tick is ignored."""
+    profiler = profile({'events': 1.0, 'render.board': 4.0, 'render.sidebar': 2.0, 'tick': 9.0})
+    phase, seconds = profiler.slowest_phase()
+    assert phase == 'render.board'
+    assert abs(seconds - 0.004) < 1e-9
+
+
+def test_nested_phases_are_not_counted_twice():
+    """Time in a nested phase comes off its parent before ranking."""
+    profiler = profile({'render.board': 5.0, 'render.board.grid': 3.0,
+                        'render.board.snakes_ladders': 1.5, 'render.sidebar': 2.5})
+    # render.board only spends 0.5 ms outside its children
+    phase, seconds = profiler.slowest_phase()
+    assert phase == 'render.board.grid'
+    assert abs(seconds - 0.003) < 1e-9
+
+    profiler = profile({'render.board': 5.0, 'render.board.grid': 1.0,
+                        'render.board.snakes_ladders': 1.0, 'render.sidebar': 2.5})
+    assert profiler.slowest_phase()[0] == 'render.board'
+
+
+def test_nothing_recorded():
+    """Without frames there is no slowest phase."""
+    assert FrameProfiler().slowest_phase() is None
@@ -0,0 +1,140 @@
+"""Tests for the game server's protocol, over a localhost socket."""
+
+import asyncio
+import json
+from game.server.server import GameServer
+from game.server.session_store import SessionStore
+
+
+async def _talk(server, requests):
+    """Send requests over one connection and get the responses, in order."""
+    listener = await server.start_tcp('127.0.0.1', 0)
+    host, port = listener.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    responses = []
+    for request in requests:
+        line = request if isinstance(request, bytes) else json.dumps(request).encode() + b'\n'
+        writer.write(line)
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+    writer.close()
+    await server.close()
+    return responses
+
+
+def talk(requests, server=None):
+    """Run ``_talk`` against a fresh server."""
+    return asyncio.run(_talk(server or GameServer(), requests))
+
+
+def test_create_join_roll_state():
+    """A game can be created, joined and played through the protocol."""
+    responses = talk([
+        {'op': 'create', 'seats': 2, 'seed': 7, 'id': 'a'},
+        {'op': 'join', 'session': 1, 'name': "Ann"},
+        {'op': 'join', 'session': 1},
+        {'op': 'roll', 'session': 1, 'seat': 0},
+        {'op': 'state', 'session': 1},
+    ])
+    created, ann, second, roll, state = responses
+    assert created == {'ok': True, 'session': 1, 'id': 'a'}
+    assert ann['seat'] == 0 and second['seat'] == 1
+    assert roll['ok'] and 1 <= roll['roll'] <= 6 and roll['from'] == 0
+    assert state['players'] == ["Ann", "Player 2"]
+    assert state['open_seats'] == 0
+    assert state['positions'][0] == roll['position']
+    assert state['current'] == roll['next']
+
+
+def test_same_seed_plays_the_same_game():
+    """Two sessions created with one seed roll the same dice."""
+    requests = [{'op': 'create', 'seats': 1, 'seed': 3}, {'op': 'create', 'seats': 1, 'seed': 3}]
+    requests += [{'op': 'join', 'session': session} for session in (1, 2)]
+    for _ in range(10):
+        requests += [{'op': 'roll', 'session': session, 'seat': 0} for session in (1, 2)]
+    rolls = talk(requests)[4:]
+    assert [r['roll'] for r in rolls[::2]] == [r['roll'] for r in rolls[1::2]]
+
+
+def test_error_replies():
+    """Bad requests get an error reply and leave the connection usable."""
+    responses = talk([
+        b'not json\n',
+        b'[1, 2]\n',
+        {'op': 'create', 'seats': 0},
+        {'op': 'create', 'seats': True},
+        {'op': 'create', 'seed': -1},
+        {'op': 'create', 'seed': 2 ** 64},
+        {'op': 'create', 'seats': 1},
+        {'op': 'roll', 'session': 1, 'seat': 0},
+        {'op': 'join', 'session': 1},
+        {'op': 'join', 'session': 1},
+        {'op': 'roll', 'session': 1, 'seat': True},
+        {'op': 'dance', 'session': 1},
+        {'op': 'state', 'session': 2},
+        {'op': 'state', 'session': True},
+        {'op': 'state', 'session': 1},
+    ])
+    errors = [response.get('error') for response in responses]
+    assert errors == [
+        "Invalid JSON",
+        "Request must be an object",
+        "seats must be between 1 and 8",
+        "seats must be between 1 and 8",
+        "seed must be an integer from 0 to 2**64 - 1",
+        "seed must be an integer from 0 to 2**64 - 1",
+        None,
+        "Waiting for players to join",
+        None,
+        "Session is full",
+        "Not your turn",
+        "Unknown op: 'dance'",
+        "Unknown session",
+        "Unknown session",
+        None,
+    ]
+
+
+def test_unexpected_error_becomes_a_reply():
+    """A bug in a handler is reported as an internal error, not a dropped connection."""
+    server = GameServer()
+
+    def broken(request):
+        raise RuntimeError("boom")
+
+    async def run():
+        created = await server.dispatch({'op': 'create', 'seats': 1})
+        server.sessions.get(created['session']).handle = broken
+        return await server.dispatch_line(b'{"op": "state", "session": 1, "id": 5}\n')
+
+    assert asyncio.run(run()) == {'ok': False, 'error': "Internal error", 'id': 5}
+
+
+def test_concurrent_sessions_survive_parking():
+    """Many clients playing at once get consistent games while sessions are parked."""
+    server = GameServer(store=SessionStore(GameServer().board, hot_capacity=4))
+
+    async def client(session):
+        moves = []
+        await server.dispatch({'op': 'join', 'session': session})
+        for _ in range(20):
+            response = await server.dispatch({'op': 'roll', 'session': session, 'seat': 0})
+            if not response['ok']:
+                break
+            moves.append(response['position'])
+            await asyncio.sleep(0)
+        state = await server.dispatch({'op': 'state', 'session': session})
+        return moves, state['positions'][0]
+
+    async def run():
+        sessions = [(await server.dispatch({'op': 'create', 'seats': 1, 'seed': i}))['session']
+                    for i in range(32)]
+        return sessions, await asyncio.gather(*(client(session) for session in sessions))
+
+    sessions, results = asyncio.run(run())
+    assert len(server.sessions) == len(sessions)
+    for session, (moves, position) in zip(sessions, results):
+        assert moves and moves[-1] == position
+        # Fetching every session in turn parks the others and brings it back
+        assert server.sessions.get(session).describe()['positions'] == [position]
+    assert server.sessions.parked_bytes > 0
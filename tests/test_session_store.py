@@ -0,0 +1,54 @@
+"""Tests for parking and rehydrating sessions."""
+
+from game import constants as const
+from game.models.board import Board
+from game.server.server import Session
+from game.server.session_store import SessionStore
+
+BOARD = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+
+
+def test_parked_session_round_trips():
+    """A parked session comes back with the same game state."""
+    store = SessionStore(BOARD, hot_capacity=1)
+    session = Session.create(1, BOARD, 2, seed=7)
+    for _ in range(5):
+        session.logic.play_turn()
+    snapshot = session.logic.snapshot()
+    store.add(session)
+    store.add(Session.create(2, BOARD, 2, seed=8))
+
+    assert store.get(1).logic.snapshot() == snapshot
+    assert len(store) == 2
+
+
+def test_session_that_cannot_be_packed_stays_live():
+    """A failure to pack a session keeps it hot instead of losing it."""
+    store = SessionStore(BOARD, hot_capacity=1)
+    unpackable = Session.create(1, BOARD, 2, seed=7)
+
+    def broken():
+        raise RuntimeError("cannot snapshot")
+
+    unpackable.logic.snapshot = broken
+    store.add(unpackable)
+    store.add(Session.create(2, BOARD, 2, seed=8))
+    store.add(Session.create(3, BOARD, 2, seed=9))
+
+    assert len(store) == 3
+    assert store.get(1) is unpackable
+    assert store.get(2).logic.seed == 8
+    assert store.get(3).logic.seed == 9
+
+
+def test_fetched_session_is_not_parked_behind_busy_ones():
+    """A session handed out by get stays live while busy sessions fill the hot set."""
+    store = SessionStore(BOARD, hot_capacity=1)
+    store.add(Session.create(1, BOARD, 1, seed=1))
+    store.add(Session.create(2, BOARD, 1, seed=2))
+    busy = store.get(2)
+    busy._draining = True
+
+    session = store.get(1)
+    assert store.get(1) is session
+    assert store.get(2) is busy
@@ -0,0 +1,63 @@
+"""Tests for the vectorized batch simulator against GameLogic."""
+
+import numpy as np
+import pytest
+from game import constants as const
+from game.core.dice import DiceSource
+from game.core.game_logic import GameLogic
+from game.core.simulation import BatchSimulator
+from game.models.board import Board
+from game.models.player import Player
+
+# A small board, so games are short and overshoot the goal often
+BOARD = Board({14: 4, 23: 9}, {3: 12, 8: 17}, 5)
+
+
+class SimulatorDice(DiceSource):
+    """Fair die drawn the way BatchSimulator draws a one-game batch."""
+
+    def __init__(self, seed: int):
+        super().__init__(seed, block_size=1)
+
+    @property
+    def max_roll(self) -> int:
+        return 6
+
+    def _draw_block(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        return rng.integers(1, 7, size=count, dtype=np.int32)
+
+
+def play(seed, seats):
+    """Play one game with GameLogic and count what BatchSimulator reports."""
+    players = [Player(f"Player {i + 1}", const.RED) for i in range(seats)]
+    logic = GameLogic(players, BOARD, dice=SimulatorDice(seed))
+    turns = overshoots = extra_rolls = 0
+    while not logic.state.game_over:
+        seat = logic.state.current_player_index
+        moved, winner = logic.play_turn()
+        passed = logic.state.current_player_index != seat
+        extra_roll = moved and winner is None and logic.state.last_roll == 6
+        if seats > 1:
+            # The turn passes on after any valid move but a winning one or a six
+            assert passed == (moved and winner is None and not extra_roll)
+        overshoots += not moved
+        extra_rolls += extra_roll
+        turns += moved and not extra_roll
+    return logic.state.winner_index, turns, logic.rolls, overshoots, extra_rolls
+
+
+@pytest.mark.parametrize('seats', [1, 2, 3])
+def test_matches_game_logic(seats):
+    """Seeded one-game batches play out exactly as GameLogic does."""
+    simulator = BatchSimulator(BOARD, seats)
+    overshoots = extra_rolls = 0
+    for seed in range(20):
+        result = simulator.run(1, seed)
+        winner, turns, rolls, game_overshoots, game_extra_rolls = play(seed, seats)
+        assert result.winner[0] == winner
+        assert result.turns[0] == turns
+        assert result.rolls[0] == rolls
+        overshoots += game_overshoots
+        extra_rolls += game_extra_rolls
+    # Both rules that keep the turn with the same player were exercised
+    assert overshoots and extra_rolls
@@ -0,0 +1,72 @@
+"""Tests for binary game snapshots."""
+
+import pytest
+from game import constants as const
+from game.core.dice import MultiDice
+from game.core.game_logic import GameLogic
+from game.models.board import Board
+from game.models.player import Player
+
+BOARD = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+
+
+def new_game(seats=2, board=BOARD, **kwargs):
+    """Create a game with ``seats`` players."""
+    players = [Player(f"Player {i + 1}", const.RED) for i in range(seats)]
+    return GameLogic(players, board, **kwargs)
+
+
+def test_round_trip_continues_the_game():
+    """A restored game matches the original and rolls the same dice from there."""
+    original = new_game(seed=4)
+    for _ in range(15):
+        original.play_turn()
+    copy = new_game(seed=1)
+    copy.restore(original.snapshot())
+    assert copy.snapshot() == original.snapshot()
+    assert copy.get_state() == original.get_state()
+
+    for _ in range(30):
+        assert copy.play_turn()[0] == original.play_turn()[0]
+        assert list(copy.state.table.positions) == list(original.state.table.positions)
+
+
+def test_round_trip_keeps_the_winner():
+    """A finished game comes back finished, with the same winner."""
+    original = new_game(seats=3, seed=2)
+    while not original.state.game_over:
+        original.play_turn()
+    copy = new_game(seats=3)
+    copy.restore(original.snapshot())
+    assert copy.state.game_over
+    assert copy.state.winner is copy.players[original.state.winner_index]
+
+
+def test_large_dice_sums_fit():
+    """Rolls above 255 from many summed dice are kept whole."""
+    board = Board({}, {}, 40)
+    original = new_game(board=board, seed=3, dice=MultiDice(count=100, seed=3))
+    original.play_turn()
+    assert original.state.dice_value > 255
+    copy = new_game(board=board, dice=MultiDice(count=100))
+    copy.restore(original.snapshot())
+    assert copy.state.dice_value == original.state.dice_value
+
+
+def test_rejects_other_boards_and_player_counts():
+    """Snapshots only restore into a game with the same board and seats."""
+    snapshot = new_game(seed=1).snapshot()
+    other_board = Board({const.BOARD_SIZE * 2: 3}, {}, const.BOARD_SIZE)
+    with pytest.raises(ValueError, match="different board"):
+        new_game(board=other_board).restore(snapshot)
+    with pytest.raises(ValueError, match="number of players"):
+        new_game(seats=3).restore(snapshot)
+    with pytest.raises(ValueError):
+        new_game().restore(b'XXX' + snapshot[3:])
+
+
+@pytest.mark.parametrize('seed', [-1, 2 ** 64])
+def test_seed_out_of_range(seed):
+    """Seeds that don't fit a snapshot are refused up front."""
+    with pytest.raises(ValueError, match="seed"):
+        new_game(seed=seed)
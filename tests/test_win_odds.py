@@ -0,0 +1,60 @@
+"""Tests for the exact win probabilities."""
+
+import pytest
+from game import constants as const
+from game.analysis.win_odds import WinOdds
+from game.core.game_logic import GameLogic
+from game.models.board import Board
+from game.models.player import Player
+
+BOARD = Board(const.SNAKES, const.LADDERS, const.BOARD_SIZE)
+
+
+def play_out(positions, current, seed):
+    """Play a game to the end from a position with seeded GameLogic and return the winning seat."""
+    players = [Player(f"Player {i + 1}", const.RED) for i in range(len(positions))]
+    logic = GameLogic(players, BOARD, seed=seed)
+    for player, position in zip(players, positions):
+        player.set_position(position, BOARD.total_cells)
+    logic.state.current_player_index = current
+    while not logic.state.game_over:
+        logic.play_turn()
+    return players.index(logic.state.winner)
+
+
+def test_overshoot_keeps_the_turn():
+    """A player one short of the goal re-rolls overshoots until they win."""
+    odds = WinOdds(BOARD).win_probabilities((99, 99), 0)
+    assert odds == pytest.approx((1.0, 0.0))
+    assert all(play_out((99, 99), 0, seed) == 0 for seed in range(50))
+
+
+@pytest.mark.parametrize('positions, current', [
+    ((94, 97), 1),
+    ((90, 96, 85), 2),
+    ((0, 0), 0),
+])
+def test_matches_game_logic_playouts(positions, current):
+    """The exact odds agree with games played out by GameLogic."""
+    games = 3000
+    wins = [0] * len(positions)
+    for seed in range(games):
+        wins[play_out(positions, current, seed)] += 1
+
+    odds = WinOdds(BOARD).win_probabilities(positions, current)
+    for seat, chance in enumerate(odds):
+        # Well over four standard errors of the playout estimate
+        assert wins[seat] / games == pytest.approx(chance, abs=0.04)
+
+
+def test_cache_is_bounded():
+    """The transposition cache evicts the least recently used positions."""
+    odds = WinOdds(BOARD, max_size=2)
+    odds.win_probabilities((1, 2), 0)
+    odds.win_probabilities((3, 4), 0)
+    odds.win_probabilities((1, 2), 0)
+    odds.win_probabilities((5, 6), 1)
+    assert len(odds) == 2
+    assert (odds.hits, odds.misses) == (1, 3)
+    odds.win_probabilities((1, 2), 0)
+    assert odds.hits == 2